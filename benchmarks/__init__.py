@@ -0,0 +1 @@
+"""Offline benchmarks for yfin-cli, run with `python -m benchmarks.<name>`."""
@@ -0,0 +1,227 @@
+"""
+End-to-end command benchmarks against mocked yfinance backends, runnable offline.
+
+Each scenario patches yfinance like the tests do and returns a synthetic response of realistic
+size, then times every stage of the CLI path: the full CLI invocation (parsing, dispatch, fetch and
+output), the command itself, `data_frame_to_list`, `JsonWriter` and `TableWriter`. Reports the best
+time over --repeat runs, throughput, and peak memory (traced in a separate run).
+
+Usage: python -m benchmarks.bench_commands [--repeat 3] [--only history] [--save results.json]
+       python -m benchmarks.bench_commands --compare results.json [--tolerance 0.25]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from unittest.mock import MagicMock, patch
+import pandas as pd
+from typer.testing import CliRunner
+from src.cli import app
+from src.endpoints import build_endpoints
+from src.utils import console, data_frame_to_list
+from src.writer import JsonWriter, TableWriter, materialize
+from . import data
+
+
+class Scenario:
+    """A command invocation with a mocked yfinance backend."""
+
+    def __init__(self, name: str, target: str, configure: Callable, argv: list[str]):
+        self.name = name
+        self.target = target
+        self.configure = configure
+        self.argv = argv
+
+    @contextlib.contextmanager
+    def mocked(self):
+        with patch(self.target) as mock:
+            self.configure(mock)
+            yield mock
+
+
+def configure_history(mock: MagicMock) -> None:
+    mock.return_value.history.return_value = data.history_frame(days=30)
+
+
+def configure_statement(mock: MagicMock) -> None:
+    mock.return_value.get_income_stmt.return_value = data.statement_frame(years=10)
+
+
+def configure_screen(mock: MagicMock) -> None:
+    mock.return_value = data.screen_response(count=250)
+
+
+def configure_market(mock: MagicMock) -> None:
+    mock.return_value.status = {"market_state": "REGULAR", "open": True}
+
+
+SCENARIOS = [
+    Scenario(
+        "dispatch (market-status)",
+        "src.commands.market.yf.Market",
+        configure_market,
+        ["market-status"],
+    ),
+    Scenario(
+        "history 1m x 30 days",
+        "src.commands.stock.yf.Ticker",
+        configure_history,
+        ["history", "AAPL", "--interval", "1m", "--period", "1mo"],
+    ),
+    Scenario(
+        "income-stmt 10y quarterly",
+        "src.commands.financials.yf.Ticker",
+        configure_statement,
+        ["income-stmt", "AAPL", "--frequency", "quarterly"],
+    ),
+    Scenario(
+        "screen 250 rows",
+        "src.commands.screen.yf.screen",
+        configure_screen,
+        ["screen", "--predefined", "day_gainers", "--limit", "250"],
+    ),
+]
+
+
+@contextlib.contextmanager
+def discard_output():
+    """Send writer output to /dev/null, like piping yfin into another program."""
+    original = console.file
+    with open(os.devnull, "w") as devnull:
+        console.file = devnull
+        try:
+            yield
+        finally:
+            console.file = original
+
+
+def measure(func: Callable, repeat: int) -> dict:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(times), "peak_bytes": peak}
+
+
+def row_count(result) -> int:
+    if isinstance(result, (pd.DataFrame, list)):
+        return len(result)
+    return 1
+
+
+def run_scenario(scenario: Scenario, repeat: int) -> dict[str, dict]:
+    runner = CliRunner()
+    endpoint = build_endpoints(app)[scenario.argv[0]]
+    kwargs = endpoint.parse_args(scenario.argv[1:])
+
+    def invoke(output: str) -> Callable:
+        def run():
+            result = runner.invoke(
+                app, ["--no-cache", "--output", output, *scenario.argv]
+            )
+            if result.exit_code != 0:
+                raise RuntimeError(f"{scenario.name} failed: {result.output}")
+
+        return run
+
+    with scenario.mocked():
+        result = materialize(endpoint.func(**kwargs))
+        records = (
+            data_frame_to_list(result) if isinstance(result, pd.DataFrame) else result
+        )
+        stages = {
+            "cli --output json": invoke("json"),
+            "cli --output table": invoke("table"),
+            "command": lambda: materialize(endpoint.func(**kwargs)),
+            "JsonWriter": lambda: JsonWriter().write(result),
+            "TableWriter": lambda: TableWriter().write(result),
+        }
+        if isinstance(result, pd.DataFrame):
+            stages["data_frame_to_list"] = lambda: data_frame_to_list(result)
+
+        results = {}
+        with discard_output():
+            for stage, func in stages.items():
+                results[stage] = {"rows": row_count(records), **measure(func, repeat)}
+    return results
+
+
+def report(results: dict[str, dict[str, dict]]) -> None:
+    print(
+        f"{'scenario':<28} {'stage':<20} {'rows':>7} {'best':>10} {'rows/s':>12} {'peak':>10}"
+    )
+    for scenario, stages in results.items():
+        for stage, r in stages.items():
+            throughput = r["rows"] / r["seconds"] if r["seconds"] > 0 else float("inf")
+            print(
+                f"{scenario:<28} {stage:<20} {r['rows']:>7,} {r['seconds'] * 1000:>8.2f}ms "
+                f"{throughput:>12,.0f} {r['peak_bytes'] / 2**20:>7.2f}MiB"
+            )
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return the stages that are slower than the baseline by more than `tolerance`."""
+    regressions = []
+    for scenario, stages in results.items():
+        for stage, r in stages.items():
+            base = baseline.get(scenario, {}).get(stage)
+            if base is not None and r["seconds"] > base["seconds"] * (1 + tolerance):
+                regressions.append(
+                    f"{scenario} / {stage}: {r['seconds'] * 1000:.2f}ms "
+                    f"vs {base['seconds'] * 1000:.2f}ms baseline"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per stage, the best is kept"
+    )
+    parser.add_argument(
+        "--only", help="Only run scenarios whose name contains this text"
+    )
+    parser.add_argument("--save", help="Write the results as JSON to this file")
+    parser.add_argument(
+        "--compare", help="Fail if slower than the results in this file"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown against --compare",
+    )
+    args = parser.parse_args()
+
+    scenarios = [s for s in SCENARIOS if args.only is None or args.only in s.name]
+    results = {s.name: run_scenario(s, args.repeat) for s in scenarios}
+    report(results)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions:", *regressions, sep="\n  ", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
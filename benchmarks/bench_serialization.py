@@ -0,0 +1,70 @@
+"""
+Compare the legacy to_json -> json.loads -> json.dumps round-trip with the direct DataFrame serialization.
+
+Usage: python -m benchmarks.bench_serialization [--rows 200000]
+"""
+
+import argparse
+import json
+import time
+import numpy as np
+import pandas as pd
+from src.utils import data_frame_to_json, data_frame_to_list
+
+
+def create_history_frame(rows: int) -> pd.DataFrame:
+    """Synthetic 1-minute OHLCV bars with a timezone-aware index, like `Ticker.history`."""
+    rng = np.random.default_rng(0)
+    index = pd.date_range(
+        "2000-01-03 09:30",
+        periods=rows,
+        freq="1min",
+        tz="America/New_York",
+        name="Datetime",
+    )
+    close = 100 + rng.standard_normal(rows).cumsum()
+    return pd.DataFrame(
+        {
+            "Open": close + rng.random(rows),
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(0, 1_000_000, rows),
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=index,
+    ).reset_index()
+
+
+def legacy_round_trip(data_frame: pd.DataFrame) -> str:
+    records = json.loads(data_frame.to_json(orient="records", date_format="iso"))
+    return json.dumps(records, indent=2, default=str)
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    data_frame = create_history_frame(args.rows)
+    results = {
+        "legacy round-trip (json)": timed(legacy_round_trip, data_frame),
+        "data_frame_to_json (json)": timed(data_frame_to_json, data_frame, 2),
+        "data_frame_to_list (records)": timed(data_frame_to_list, data_frame),
+    }
+
+    baseline = results["legacy round-trip (json)"]
+    print(f"{args.rows:,} rows")
+    for name, seconds in results.items():
+        print(f"  {name:<30} {seconds:8.3f}s  {baseline / seconds:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
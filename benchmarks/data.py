@@ -0,0 +1,66 @@
+"""Synthetic yfinance responses of realistic sizes, shaped like the real ones."""
+
+import numpy as np
+import pandas as pd
+
+BARS_PER_SESSION = 390  # 09:30-16:00 in 1-minute bars
+
+
+def history_frame(days: int = 30, seed: int = 0) -> pd.DataFrame:
+    """1-minute OHLCV bars over `days` trading sessions, like `Ticker.history(interval="1m")`."""
+    rng = np.random.default_rng(seed)
+    sessions = pd.bdate_range("2026-01-05", periods=days)
+    index = pd.DatetimeIndex(
+        np.concatenate(
+            [
+                pd.date_range(
+                    f"{d.date()} 09:30", periods=BARS_PER_SESSION, freq="1min"
+                )
+                for d in sessions
+            ]
+        ),
+        name="Datetime",
+    ).tz_localize("America/New_York")
+    rows = len(index)
+    close = 100 + rng.standard_normal(rows).cumsum() * 0.05
+    return pd.DataFrame(
+        {
+            "Open": close + rng.random(rows) * 0.1,
+            "High": close + 0.2,
+            "Low": close - 0.2,
+            "Close": close,
+            "Volume": rng.integers(0, 100_000, rows),
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=index,
+    )
+
+
+def statement_frame(
+    years: int = 10, line_items: int = 45, seed: int = 0
+) -> pd.DataFrame:
+    """Quarterly statement with line items as rows and period ends as columns, like `get_income_stmt`."""
+    rng = np.random.default_rng(seed)
+    periods = pd.date_range("2016-03-31", periods=years * 4, freq="QE")[::-1]
+    index = [f"Line Item {i}" for i in range(line_items)]
+    values = rng.standard_normal((line_items, len(periods))) * 1e9
+    return pd.DataFrame(values, index=index, columns=periods)
+
+
+def screen_response(count: int = 250, seed: int = 0) -> dict:
+    """Screener response with `count` quotes of ~80 fields each, like `yf.screen`."""
+    rng = np.random.default_rng(seed)
+    quotes = []
+    for i in range(count):
+        quote = {
+            "symbol": f"SYM{i}",
+            "shortName": f"Company {i} Inc.",
+            "exchange": "NMS",
+            "quoteType": "EQUITY",
+            "currency": "USD",
+            "marketState": "REGULAR",
+        }
+        quote.update({f"metric{j}": float(rng.random()) for j in range(74)})
+        quotes.append(quote)
+    return {"quotes": quotes, "total": count}
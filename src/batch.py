@@ -0,0 +1,127 @@
+"""
+Batch execution of many commands in one process.
+
+A jobs file has one job per line, either a command line (`history AAPL --period 5d`) or a JSON
+object (`{"id": "aapl-5d", "command": "history", "args": ["AAPL", "--period", "5d"]}`, where
+`args` may also be an object of named parameters). Blank lines and `#` comments are skipped.
+"""
+
+import json
+import shlex
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import click
+
+import typer
+
+from .cache import make_key
+from .decorators import fetch
+from .endpoints import CommandEndpoint
+from .utils import (
+    data_frame_to_list,
+    lazy_import,
+    load_lazy_modules,
+    resolve_path,
+    resolve_tickers,
+)
+from .writer import materialize
+
+pd = lazy_import("pandas")
+
+
+class Job:
+    """A parsed and validated command invocation."""
+
+    def __init__(self, id: str, endpoint: CommandEndpoint, kwargs: dict):
+        self.id = id
+        self.endpoint = endpoint
+        self.kwargs = resolve_tickers(kwargs)
+        self.key = make_key(endpoint.func.__name__, self.kwargs)
+
+
+def parse_job(
+    line: str, line_number: int, endpoints: dict[str, CommandEndpoint]
+) -> Job:
+    if line.startswith("{"):
+        spec = json.loads(line)
+        job_id = str(spec.get("id", line_number))
+        name, args = spec.get("command"), spec.get("args", [])
+    else:
+        job_id = str(line_number)
+        name, *args = shlex.split(line)
+
+    endpoint = endpoints.get(str(name).replace("_", "-"))
+    if endpoint is None:
+        raise click.UsageError(f"Unknown command: '{name}'")
+    if isinstance(args, dict):
+        params = {
+            k: [str(x) for x in v] if isinstance(v, list) else [str(v)]
+            for k, v in args.items()
+        }
+        return Job(job_id, endpoint, endpoint.parse(params))
+    return Job(job_id, endpoint, endpoint.parse_args([str(arg) for arg in args]))
+
+
+def read_jobs(jobs_file: str, endpoints: dict[str, CommandEndpoint]) -> list[Job]:
+    """Parse and validate every job up front, so that mistakes surface before any request is made."""
+    if jobs_file == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        try:
+            with open(resolve_path(jobs_file)) as f:
+                lines = f.read().splitlines()
+        except OSError as e:
+            raise typer.BadParameter(f"Cannot read jobs file: {e}")
+
+    jobs = []
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if line == "" or line.startswith("#"):
+            continue
+        try:
+            jobs.append(parse_job(line, line_number, endpoints))
+        except (ValueError, click.ClickException) as e:
+            message = e.format_message() if isinstance(e, click.ClickException) else e
+            raise typer.BadParameter(f"Line {line_number}: {message}")
+    return jobs
+
+
+def run_job(job: Job, options: dict) -> dict:
+    try:
+        data = fetch(job.endpoint.func, job.kwargs, options)
+        if data is None:
+            return {"error": "No data found"}
+        # Streamed results fail while they are consumed, which is this job's failure too
+        data = materialize(data)
+        if isinstance(data, pd.DataFrame):
+            data = data_frame_to_list(data)
+    except click.ClickException as e:
+        return {"error": e.format_message()}
+    except Exception as e:  # noqa: BLE001
+        # One failing job must not stop the others, like a failing command in a script
+        return {"error": f"Unexpected error: {e}"}
+    return {"data": data}
+
+
+def run_jobs(jobs: list[Job], options: dict, workers: int) -> Iterator[dict]:
+    """
+    Run jobs concurrently and yield one result per job, in completion order, tagged with its id.
+
+    Identical jobs (same command and parameters) are fetched once and their result is shared.
+    """
+    groups: dict[str, list[Job]] = {}
+    for job in jobs:
+        groups.setdefault(job.key, []).append(job)
+
+    load_lazy_modules()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(run_job, group[0], options): group
+            for group in groups.values()
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            for job in futures[future]:
+                yield {"id": job.id, "command": job.endpoint.name, **result}
@@ -0,0 +1,228 @@
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+DEFAULT_TTL = 5 * MINUTE
+
+# Time-to-live (in seconds) per command, keyed by the command function name.
+# A TTL of 0 disables caching, e.g. for commands answered from local constants.
+COMMAND_TTLS = {
+    # Stock
+    "history": 5 * MINUTE,
+    "dividends": DAY,
+    "fast_info": 15,
+    "news": 5 * MINUTE,
+    # Market
+    "market_status": MINUTE,
+    # Calendar
+    "calendar_earnings": HOUR,
+    "calendar_economic_events": HOUR,
+    "calendar_ipo": HOUR,
+    # Financials
+    "income_stmt": DAY,
+    "balance_sheet": DAY,
+    "cashflow": DAY,
+    "financials": DAY,
+    "earnings_dates": 12 * HOUR,
+    "sec_filings": 7 * DAY,
+    # Analysis
+    "recommendations": 12 * HOUR,
+    "upgrades_downgrades": 12 * HOUR,
+    "price_targets": 12 * HOUR,
+    "earnings_estimate": 12 * HOUR,
+    "revenue_estimate": 12 * HOUR,
+    "earnings_history": DAY,
+    "eps_trend": 12 * HOUR,
+    "eps_revisions": 12 * HOUR,
+    "growth_estimates": 12 * HOUR,
+    "insider_purchases": DAY,
+    "insider_transactions": DAY,
+    "insider_roster_holders": DAY,
+    "major_holders": DAY,
+    "institutional_holders": DAY,
+    "mutualfund_holders": DAY,
+    "analysis_bundle": 12 * HOUR,
+    # Sector
+    "sector_keys": 0,
+    "sector_industries": DAY,
+    "sector_overview": 12 * HOUR,
+    "sector_research_reports": 12 * HOUR,
+    "sector_top_companies": 12 * HOUR,
+    "sector_top_etfs": 12 * HOUR,
+    "sector_top_mutual_funds": 12 * HOUR,
+    "sector_report": 12 * HOUR,
+    "sector_crawl": 12 * HOUR,
+    # Industry
+    "industry_overview": 12 * HOUR,
+    "industry_research_reports": 12 * HOUR,
+    "industry_top_companies": 12 * HOUR,
+    "industry_top_growth_companies": 12 * HOUR,
+    "industry_top_performing_companies": 12 * HOUR,
+    # Screen
+    "screen": 5 * MINUTE,
+    "screen_query_fields": 0,
+    "screen_query_values": 0,
+    "screen_predefined_queries": 0,
+    "screen_snapshot": 0,
+    # Batch jobs are cached individually
+    "batch": 0,
+}
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024  # 256 MiB
+
+
+def get_ttl(command_name: str) -> int:
+    """Return the cache TTL in seconds for a command."""
+    return COMMAND_TTLS.get(command_name, DEFAULT_TTL)
+
+
+def get_cache_dir() -> Path:
+    """Return the cache directory, honouring YFIN_CACHE_DIR and XDG_CACHE_HOME."""
+    if os.environ.get("YFIN_CACHE_DIR"):
+        return Path(os.environ["YFIN_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "yfin"
+
+
+def write_pickle(path: Path, obj: Any) -> None:
+    """
+    Pickle `obj` to `path` through a temporary file in the same directory, so that readers never
+    see a partial file. The temporary file is removed if writing fails, and the error re-raised.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def get_max_size() -> int:
+    """Return the maximum cache size in bytes, honouring YFIN_CACHE_MAX_SIZE."""
+    value = os.environ.get("YFIN_CACHE_MAX_SIZE")
+    return int(value) if value else DEFAULT_MAX_SIZE
+
+
+# Arguments tuning how a result is fetched, not what it is
+UNKEYED_PARAMS = {"workers", "rate_limit"}
+
+
+def make_key(command_name: str, kwargs: dict) -> str:
+    """Build a stable cache key from the command name and its arguments."""
+    args = {k: v for k, v in kwargs.items() if k not in UNKEYED_PARAMS}
+    payload = json.dumps(
+        {"command": command_name, "args": args}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    A size-bounded, TTL-aware key-value store backed by SQLite.
+
+    Entries are evicted in least-recently-used order once the total size exceeds `max_size`.
+    Cache errors are never fatal: a failed read is a miss and a failed write is dropped.
+    """
+
+    def __init__(self, path: Path, max_size: int = DEFAULT_MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+
+    @contextmanager
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:  # commits on success, rolls back on error
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS entries (
+                        key TEXT PRIMARY KEY,
+                        value BLOB NOT NULL,
+                        size INTEGER NOT NULL,
+                        expires_at REAL NOT NULL,
+                        accessed_at REAL NOT NULL
+                    )
+                    """
+                )
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value FROM entries WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+        except (sqlite3.Error, OSError):
+            return None
+        try:
+            return pickle.loads(row[0])
+        except Exception:  # noqa: BLE001
+            # e.g. a DataFrame pickled by another pandas version: drop it, so that it is refetched
+            self.delete(key)
+            return None
+
+    def delete(self, key: str) -> None:
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        except (sqlite3.Error, OSError):
+            return
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        now = time.time()
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            if len(blob) > self.max_size:
+                return
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (key, blob, len(blob), now + ttl, now),
+                )
+                self._evict(conn, now)
+        except (sqlite3.Error, OSError, pickle.PicklingError):
+            return
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_size:
+            return
+
+        evicted = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+
+def get_cache() -> ResponseCache:
+    return ResponseCache(get_cache_dir() / "responses.sqlite3", get_max_size())
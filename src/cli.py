@@ -3,8 +3,31 @@
 yfin CLI - A command-line tool for Yahoo Finance data
 """
 
+import sys
 import typer
-from .typer import OutputType, default_output
+from click.core import ParameterSource
+from . import session
+from .daemon import forward, strip_option
+from .utils import console_print_error, console_print_warning
+from .typer import (
+    OutputType,
+    default_output,
+    OutFileType,
+    BINARY_OUTPUT_TYPES,
+    CacheType,
+    default_cache,
+    RefreshType,
+    default_refresh,
+    FieldsType,
+    PoolSizeType,
+    default_pool_size,
+    TimeoutType,
+    Http2Type,
+    default_http2,
+    DebugConnectionsType,
+    default_debug_connections,
+    ViaDaemonType,
+)
 from .commands.stock import (
     history,
     dividends,
@@ -21,6 +44,7 @@ from .commands.financials import (
     income_stmt,
     balance_sheet,
     cashflow,
+    financials,
     earnings_dates,
     sec_filings,
 )
@@ -40,6 +64,7 @@ from .commands.analysis import (
     major_holders,
     institutional_holders,
     mutualfund_holders,
+    analysis_bundle,
 )
 from .commands.sector import (
     sector_keys,
@@ -49,6 +74,8 @@ from .commands.sector import (
     sector_top_companies,
     sector_top_etfs,
     sector_top_mutual_funds,
+    sector_report,
+    sector_crawl,
 )
 from .commands.industry import (
     industry_overview,
@@ -57,13 +84,19 @@ from .commands.industry import (
     industry_top_growth_companies,
     industry_top_performing_companies,
 )
+from .commands.server import serve, http_serve
+from .commands.batch import batch
 from .commands.screen import (
     screen,
     screen_query_fields,
     screen_query_values,
     screen_predefined_queries,
+    screen_snapshot,
 )
 
+# Global options configuring the process-wide HTTP session
+SESSION_OPTIONS = ("pool_size", "timeout", "http2")
+
 app = typer.Typer(
     name="yfin",
     help="A command-line interface for Yahoo Finance data",
@@ -72,9 +105,55 @@ app = typer.Typer(
 
 
 @app.callback()
-def main(ctx: typer.Context, output: OutputType = default_output):
+def main(
+    ctx: typer.Context,
+    output: OutputType = default_output,
+    out_file: OutFileType = None,
+    cache: CacheType = default_cache,
+    refresh: RefreshType = default_refresh,
+    fields: FieldsType = None,
+    pool_size: PoolSizeType = default_pool_size,
+    timeout: TimeoutType = None,
+    http2: Http2Type = default_http2,
+    debug_connections: DebugConnectionsType = default_debug_connections,
+    via_daemon: ViaDaemonType = None,
+):
+    if via_daemon is not None:
+        # Thin client mode: the daemon runs the command and streams back its output
+        argv = strip_option(sys.argv[1:], "--via-daemon")
+        try:
+            code = forward(via_daemon, argv)
+        except OSError as e:
+            console_print_error(f"Cannot reach daemon at {via_daemon}: {e}")
+            raise typer.Exit(code=1)
+        raise typer.Exit(code=code)
+
+    if out_file is not None and output not in BINARY_OUTPUT_TYPES:
+        raise typer.BadParameter(
+            f"--out-file is only supported with --output {', '.join(BINARY_OUTPUT_TYPES)}."
+        )
+
     ctx.ensure_object(dict)
     ctx.obj["output"] = output
+    ctx.obj["out_file"] = out_file
+    ctx.obj["cache"] = cache
+    ctx.obj["refresh"] = refresh
+    ctx.obj["fields"] = [f.strip() for f in fields.split(",")] if fields else None
+
+    if not ctx.obj.get("forwarded"):
+        session.configure(pool_size, timeout, http2)
+    elif any(
+        ctx.get_parameter_source(name) == ParameterSource.COMMANDLINE
+        for name in SESSION_OPTIONS
+    ):
+        # The session is shared by every command the daemon runs
+        console_print_warning(
+            "--pool-size, --timeout and --http2 are set when the daemon starts, "
+            "ignoring them for this command.",
+            stderr=True,
+        )
+    if debug_connections:
+        ctx.call_on_close(session.print_stats)
 
 
 app.command(rich_help_panel="Stock")(history)
@@ -91,6 +170,7 @@ app.command(rich_help_panel="Calendar")(calendar_ipo)
 app.command(rich_help_panel="Financials")(income_stmt)
 app.command(rich_help_panel="Financials")(balance_sheet)
 app.command(rich_help_panel="Financials")(cashflow)
+app.command(rich_help_panel="Financials")(financials)
 app.command(rich_help_panel="Financials")(earnings_dates)
 app.command(rich_help_panel="Financials")(sec_filings)
 
@@ -109,6 +189,7 @@ app.command(rich_help_panel="Analysis")(insider_roster_holders)
 app.command(rich_help_panel="Analysis")(major_holders)
 app.command(rich_help_panel="Analysis")(institutional_holders)
 app.command(rich_help_panel="Analysis")(mutualfund_holders)
+app.command(rich_help_panel="Analysis")(analysis_bundle)
 
 app.command(rich_help_panel="Sector")(sector_keys)
 app.command(rich_help_panel="Sector")(sector_industries)
@@ -117,6 +198,8 @@ app.command(rich_help_panel="Sector")(sector_research_reports)
 app.command(rich_help_panel="Sector")(sector_top_companies)
 app.command(rich_help_panel="Sector")(sector_top_etfs)
 app.command(rich_help_panel="Sector")(sector_top_mutual_funds)
+app.command(rich_help_panel="Sector")(sector_report)
+app.command(rich_help_panel="Sector")(sector_crawl)
 
 app.command(rich_help_panel="Industry")(industry_overview)
 app.command(rich_help_panel="Industry")(industry_research_reports)
@@ -128,6 +211,12 @@ app.command(rich_help_panel="Screen")(screen)
 app.command(rich_help_panel="Screen")(screen_query_fields)
 app.command(rich_help_panel="Screen")(screen_query_values)
 app.command(rich_help_panel="Screen")(screen_predefined_queries)
+app.command(rich_help_panel="Screen")(screen_snapshot)
+
+app.command(rich_help_panel="Batch")(batch)
+
+app.command(rich_help_panel="Server")(serve)
+app.command(rich_help_panel="Server")(http_serve)
 
 if __name__ == "__main__":
     app()
@@ -1,7 +1,66 @@
-import yfinance as yf
-from ..typer import TickerType
+from ..typer import (
+    TickerType,
+    TickersType,
+    TickersFileType,
+    WorkersType,
+    default_workers,
+    ANALYSIS_SECTIONS,
+    AnalysisSectionsType,
+)
 from ..decorators import command
-from ..utils import data_frame_to_list
+from ..utils import (
+    data_frame_to_list,
+    flatten_index,
+    map_concurrently,
+    read_tickers,
+    lazy_import,
+)
+
+pd = lazy_import("pandas")
+yf = lazy_import("yfinance")
+
+# Section: (Ticker method, index name)
+SECTION_GETTERS = {
+    "recommendations": ("get_recommendations", None),
+    "upgrades-downgrades": ("get_upgrades_downgrades", None),
+    "price-targets": ("get_analyst_price_targets", None),
+    "earnings-estimate": ("get_earnings_estimate", None),
+    "revenue-estimate": ("get_revenue_estimate", None),
+    "earnings-history": ("get_earnings_history", None),
+    "eps-trend": ("get_eps_trend", None),
+    "eps-revisions": ("get_eps_revisions", None),
+    "growth-estimates": ("get_growth_estimates", None),
+    "insider-purchases": ("get_insider_purchases", None),
+    "insider-transactions": ("get_insider_transactions", None),
+    "insider-roster-holders": ("get_insider_roster_holders", None),
+    "major-holders": ("get_major_holders", "Breakdown"),
+    "institutional-holders": ("get_institutional_holders", None),
+    "mutualfund-holders": ("get_mutualfund_holders", None),
+}
+
+# Sections served by the same quoteSummary request. A group is fetched in order on one thread,
+# so that the first section makes the request and the others reuse the Ticker's parsed response.
+SECTION_GROUPS = [
+    ["recommendations"],
+    ["upgrades-downgrades"],
+    ["price-targets"],
+    [
+        "earnings-estimate",
+        "revenue-estimate",
+        "eps-trend",
+        "eps-revisions",
+        "growth-estimates",
+    ],
+    ["earnings-history"],
+    [
+        "insider-purchases",
+        "insider-transactions",
+        "insider-roster-holders",
+        "major-holders",
+        "institutional-holders",
+        "mutualfund-holders",
+    ],
+]
 
 
 @command
@@ -11,7 +70,7 @@ def recommendations(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_recommendations()
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
 
 
 @command
@@ -21,7 +80,7 @@ def upgrades_downgrades(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_upgrades_downgrades()
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
 
 
 @command
@@ -40,7 +99,7 @@ def earnings_estimate(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_earnings_estimate()
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
 
 
 @command
@@ -50,7 +109,7 @@ def revenue_estimate(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_revenue_estimate()
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
 
 
 @command
@@ -60,7 +119,7 @@ def earnings_history(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_earnings_history()
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
 
 
 @command
@@ -70,7 +129,7 @@ def eps_trend(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_eps_trend()
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
 
 
 @command
@@ -80,7 +139,7 @@ def eps_revisions(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_eps_revisions()
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
 
 
 @command
@@ -90,7 +149,7 @@ def growth_estimates(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_growth_estimates()
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
 
 
 @command
@@ -100,7 +159,7 @@ def insider_purchases(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_insider_purchases()
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
 
 
 @command
@@ -110,7 +169,7 @@ def insider_transactions(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_insider_transactions()
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
 
 
 @command
@@ -120,7 +179,7 @@ def insider_roster_holders(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_insider_roster_holders()
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
 
 
 @command
@@ -130,7 +189,7 @@ def major_holders(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_major_holders()
-    return data_frame_to_list(data_frame, index_name="Breakdown")
+    return flatten_index(data_frame, index_name="Breakdown")
 
 
 @command
@@ -140,7 +199,7 @@ def institutional_holders(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_institutional_holders()
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
 
 
 @command
@@ -150,4 +209,63 @@ def mutualfund_holders(ticker: TickerType):
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_mutualfund_holders()
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
+
+
+def get_section(stock, section: str):
+    """Return one section of a Ticker as records, or an `{"error": ...}` value if it fails."""
+    method, index_name = SECTION_GETTERS[section]
+    try:
+        data = getattr(stock, method)()
+    except Exception as e:  # noqa: BLE001
+        # e.g. no upgrades/downgrades for a symbol: the other sections are still worth returning
+        return {"error": str(e)}
+    if isinstance(data, pd.DataFrame):
+        return data_frame_to_list(flatten_index(data, index_name=index_name))
+    return data
+
+
+@command
+def analysis_bundle(
+    tickers: TickersType = None,
+    tickers_file: TickersFileType = None,
+    sections: AnalysisSectionsType = None,
+    workers: WorkersType = default_workers,
+):
+    """
+    Get several analysis sections for one or more tickers, as one nested document per ticker.
+
+    Sections are fetched concurrently on one Ticker per symbol, and sections served by the same
+    request (e.g. the holders) share it. Documents are returned in input order, and a section
+    that fails to load is given as {"error": ...}.
+    """
+    tickers = read_tickers(tickers, tickers_file)
+    selected = set(sections.split(",")) if sections else set(ANALYSIS_SECTIONS)
+    groups = [
+        [section for section in group if section in selected]
+        for group in SECTION_GROUPS
+    ]
+    groups = [group for group in groups if len(group) > 0]
+
+    def fetch_group(task) -> dict:
+        stock, group = task
+        return {section: get_section(stock, section) for section in group}
+
+    stocks = [yf.Ticker(ticker) for ticker in tickers]
+    tasks = [(stock, group) for stock in stocks for group in groups]
+    results = iter(map_concurrently(fetch_group, tasks, workers))
+    documents = []
+    for ticker in tickers:
+        document = {}
+        for _ in groups:
+            document.update(next(results))
+        # Keep the sections in the order of the analysis commands
+        documents.append(
+            {
+                "ticker": ticker,
+                **{s: document[s] for s in ANALYSIS_SECTIONS if s in document},
+            }
+        )
+
+    # Both forms are cached alike
+    return documents[0] if len(tickers) == 1 else documents
@@ -0,0 +1,24 @@
+import click
+
+from ..decorators import command
+from ..typer import JobsFileType, WorkersType, default_workers
+
+
+@command(projected=False)
+def batch(
+    jobs_file: JobsFileType,
+    workers: WorkersType = default_workers,
+):
+    """
+    Run many commands in one process, e.g. `history AAPL --period 5d` per line of JOBS_FILE.
+
+    Jobs may also be JSON objects like {"id": "a", "command": "news", "args": ["TSLA"]}.
+    All jobs are validated up front, identical jobs are fetched once, and each result is
+    written as {"id", "command", "data"} (or "error") in completion order.
+    """
+    from ..batch import read_jobs, run_jobs
+    from ..cli import app
+    from ..endpoints import build_endpoints
+
+    jobs = read_jobs(jobs_file, build_endpoints(app))
+    return run_jobs(jobs, click.get_current_context().obj, workers)
@@ -1,4 +1,4 @@
-import yfinance as yf
+from datetime import datetime, timedelta
 from ..typer import (
     StartDateType,
     EndDateType,
@@ -8,9 +8,97 @@ from ..typer import (
     default_offset,
     MarketCapType,
     default_market_cap,
+    CalendarAllType,
+    default_all_results,
+    WorkersType,
+    default_workers,
 )
 from ..decorators import command
-from ..utils import compact, data_frame_to_list, default_end_from_start
+from ..utils import (
+    compact,
+    flatten_index,
+    default_end_from_start,
+    format_datetime,
+    map_concurrently,
+    lazy_import,
+)
+
+pd = lazy_import("pandas")
+yf = lazy_import("yfinance")
+
+# Yahoo serves at most 100 calendar rows per request
+MAX_PAGE_SIZE = 100
+
+# Length of the date ranges a long --all range is split into
+SHARD_DAYS = 7
+
+
+def split_dates(start: str, end: str, days: int) -> list[tuple[str, str]]:
+    """Split [start, end] into consecutive ranges of `days` days, sharing their boundary dates."""
+    shard_start = datetime.strptime(start, "%Y-%m-%d")
+    last = datetime.strptime(end, "%Y-%m-%d")
+    shards = []
+    while True:
+        shard_end = min(shard_start + timedelta(days=days), last)
+        shards.append((format_datetime(shard_start), format_datetime(shard_end)))
+        if shard_end >= last:
+            return shards
+        shard_start = shard_end
+
+
+def fetch_pages(method: str, start: str, end: str, **kwargs) -> "pd.DataFrame":
+    """Fetch every page of one calendar for one date range, until a page comes back short."""
+    # Calendars objects keep per-request state, so each range gets its own; they share
+    # yfinance's HTTP session
+    calendars = yf.Calendars()
+    frames = []
+    offset = 0
+    while True:
+        page = getattr(calendars, method)(
+            start=start, end=end, limit=MAX_PAGE_SIZE, offset=offset, **kwargs
+        )
+        if page is None or page.empty:
+            break
+        frames.append(page)
+        if len(page) < MAX_PAGE_SIZE:
+            break
+        offset += MAX_PAGE_SIZE
+    return pd.concat(frames) if len(frames) > 0 else pd.DataFrame()
+
+
+def fetch_calendar(
+    method: str,
+    start: str,
+    end: str | None,
+    limit: int,
+    offset: int,
+    all_results: bool,
+    workers: int,
+    **kwargs,
+) -> "pd.DataFrame":
+    """
+    Fetch one page of a calendar, or with `all_results` every event from start to end.
+
+    Long ranges are split into shards that are paged through concurrently, and rows that
+    appear in two shards (events on a shared boundary date) are dropped.
+    """
+    end = default_end_from_start(start, end)
+    if not all_results:
+        calendars = yf.Calendars()
+        data_frame = getattr(calendars, method)(
+            **compact(limit=limit, offset=offset, start=start, end=end, **kwargs)
+        )
+        return flatten_index(data_frame)
+
+    frames = map_concurrently(
+        lambda shard: fetch_pages(method, *shard, **kwargs),
+        split_dates(start, end, SHARD_DAYS),
+        max_workers=workers,
+    )
+    frames = [f for f in frames if not f.empty]
+    if len(frames) == 0:
+        return pd.DataFrame()
+    return flatten_index(pd.concat(frames)).drop_duplicates(ignore_index=True)
 
 
 @command
@@ -20,23 +108,29 @@ def calendar_earnings(
     limit: LimitType = default_limit,
     offset: OffsetType = default_offset,
     market_cap: MarketCapType = default_market_cap,
+    all_results: CalendarAllType = default_all_results,
+    workers: WorkersType = default_workers,
 ):
     """
     Get earnings calendar.
+
+    With --all, every earnings date from start to end is fetched, not only the most active stocks.
     """
-    end = default_end_from_start(start, end)
-    kwargs = compact(
-        limit=limit,
-        offset=offset,
-        start=start,
-        end=end,
+    # yfinance only filters on the most active stocks on the first page, so it is
+    # turned off when paging to keep every page consistent
+    extra = {"filter_most_active": False} if all_results else {}
+    return fetch_calendar(
+        "get_earnings_calendar",
+        start,
+        end,
+        limit,
+        offset,
+        all_results,
+        workers,
         market_cap=market_cap,
+        **extra,
     )
 
-    calendars = yf.Calendars()
-    data_frame = calendars.get_earnings_calendar(**kwargs)
-    return data_frame_to_list(data_frame)
-
 
 @command
 def calendar_economic_events(
@@ -44,22 +138,22 @@ def calendar_economic_events(
     end: EndDateType = None,
     limit: LimitType = default_limit,
     offset: OffsetType = default_offset,
+    all_results: CalendarAllType = default_all_results,
+    workers: WorkersType = default_workers,
 ):
     """
     Get economic events calendar.
     """
-    end = default_end_from_start(start, end)
-    kwargs = compact(
-        limit=limit,
-        offset=offset,
-        start=start,
-        end=end,
+    return fetch_calendar(
+        "get_economic_events_calendar",
+        start,
+        end,
+        limit,
+        offset,
+        all_results,
+        workers,
     )
 
-    calendars = yf.Calendars()
-    data_frame = calendars.get_economic_events_calendar(**kwargs)
-    return data_frame_to_list(data_frame)
-
 
 @command
 def calendar_ipo(
@@ -67,18 +161,18 @@ def calendar_ipo(
     end: EndDateType = None,
     limit: LimitType = default_limit,
     offset: OffsetType = default_offset,
+    all_results: CalendarAllType = default_all_results,
+    workers: WorkersType = default_workers,
 ):
     """
     Get IPO calendar.
     """
-    end = default_end_from_start(start, end)
-    kwargs = compact(
-        limit=limit,
-        offset=offset,
-        start=start,
-        end=end,
+    return fetch_calendar(
+        "get_ipo_info_calendar",
+        start,
+        end,
+        limit,
+        offset,
+        all_results,
+        workers,
     )
-
-    calendars = yf.Calendars()
-    data_frame = calendars.get_ipo_info_calendar(**kwargs)
-    return data_frame_to_list(data_frame)
@@ -1,6 +1,11 @@
-import yfinance as yf
 from ..typer import (
     TickerType,
+    TickersType,
+    TickersFileType,
+    WorkersType,
+    default_workers,
+    STATEMENTS,
+    StatementsType,
     FrequencyType,
     ExtendedFrequencyType,
     default_frequency,
@@ -9,9 +14,19 @@ from ..typer import (
     LimitType,
     default_limit,
 )
-from ..utils import data_frame_to_list
+from ..utils import flatten_index, map_concurrently, read_tickers, lazy_import
 from ..decorators import command
 
+pd = lazy_import("pandas")
+yf = lazy_import("yfinance")
+
+# Statement name and the Ticker method that fetches it
+STATEMENT_GETTERS = {
+    "income": "get_income_stmt",
+    "balance": "get_balance_sheet",
+    "cashflow": "get_cashflow",
+}
+
 
 @command
 def income_stmt(
@@ -25,7 +40,7 @@ def income_stmt(
     data_frame = stock.get_income_stmt(pretty=True, freq=frequency)
     if data_frame is None:
         return None
-    return data_frame_to_list(data_frame.T, index_name="Date")
+    return flatten_index(data_frame.T, index_name="Date")
 
 
 @command
@@ -40,7 +55,7 @@ def balance_sheet(
     data_frame = stock.get_balance_sheet(pretty=True, freq=frequency)
     if data_frame is None:
         return None
-    return data_frame_to_list(data_frame.T, index_name="Date")
+    return flatten_index(data_frame.T, index_name="Date")
 
 
 @command
@@ -55,7 +70,54 @@ def cashflow(
     data_frame = stock.get_cashflow(pretty=True, freq=frequency)
     if data_frame is None:
         return None
-    return data_frame_to_list(data_frame.T, index_name="Date")
+    return flatten_index(data_frame.T, index_name="Date")
+
+
+def get_statement_values(
+    stock, statement: str, frequency: str
+) -> "pd.DataFrame | None":
+    """Fetch one statement as long-format rows of (Date, Line Item, Value), without empty values."""
+    data_frame = getattr(stock, STATEMENT_GETTERS[statement])(
+        pretty=True, freq=frequency
+    )
+    if data_frame is None or data_frame.empty:
+        return None
+    values = data_frame.rename_axis(index="Line Item", columns="Date").T.stack()
+    return values.dropna().rename("Value").reset_index()
+
+
+@command
+def financials(
+    tickers: TickersType = None,
+    tickers_file: TickersFileType = None,
+    statements: StatementsType = None,
+    frequency: ExtendedFrequencyType = default_frequency,
+    workers: WorkersType = default_workers,
+):
+    """
+    Get financial statements for one or more tickers as one long table.
+
+    Returns one row per ticker, statement, date and line item, suitable for bulk loading.
+    Every statement of every ticker is fetched concurrently. The balance sheet has no trailing
+    frequency, so it is left out with --frequency trailing.
+    """
+    tickers = read_tickers(tickers, tickers_file)
+    statements = statements.split(",") if statements else STATEMENTS
+    if frequency == "trailing":
+        statements = [s for s in statements if s != "balance"]
+
+    stocks = {ticker: yf.Ticker(ticker) for ticker in tickers}
+    tasks = [(ticker, statement) for ticker in stocks for statement in statements]
+    results = map_concurrently(
+        lambda task: get_statement_values(stocks[task[0]], task[1], frequency),
+        tasks,
+        max_workers=workers,
+    )
+    frames = {task: rows for task, rows in zip(tasks, results) if rows is not None}
+    if len(frames) == 0:
+        return None
+    data_frame = pd.concat(frames, names=["Ticker", "Statement", None])
+    return data_frame.reset_index(level=["Ticker", "Statement"]).reset_index(drop=True)
 
 
 @command
@@ -69,7 +131,7 @@ def earnings_dates(
     """
     stock = yf.Ticker(ticker)
     data_frame = stock.get_earnings_dates(limit=limit, offset=offset)
-    return data_frame_to_list(data_frame)
+    return flatten_index(data_frame)
 
 
 @command
@@ -1,7 +1,7 @@
-import yfinance as yf
 from ..typer import IndustryKeyType
 from ..decorators import command
-from ..utils import data_frame_to_list
+from ..domains import get_industry
+from ..utils import flatten_index
 
 
 @command
@@ -9,7 +9,7 @@ def industry_overview(key: IndustryKeyType):
     """
     Get the overview information of the domain entity.
     """
-    return yf.Industry(key).overview
+    return get_industry(key).overview
 
 
 @command
@@ -17,7 +17,7 @@ def industry_research_reports(key: IndustryKeyType):
     """
     Get research reports related to the domain entity.
     """
-    return yf.Industry(key).research_reports
+    return get_industry(key).research_reports
 
 
 @command
@@ -25,7 +25,7 @@ def industry_top_companies(key: IndustryKeyType):
     """
     Get the top companies within the domain entity.
     """
-    return data_frame_to_list(yf.Industry(key).top_companies)
+    return flatten_index(get_industry(key).top_companies)
 
 
 @command
@@ -33,7 +33,7 @@ def industry_top_growth_companies(key: IndustryKeyType):
     """
     Get the top growth companies in the industry.
     """
-    return data_frame_to_list(yf.Industry(key).top_growth_companies)
+    return flatten_index(get_industry(key).top_growth_companies)
 
 
 @command
@@ -41,4 +41,4 @@ def industry_top_performing_companies(key: IndustryKeyType):
     """
     Get the top performing companies in the industry.
     """
-    return data_frame_to_list(yf.Industry(key).top_performing_companies)
+    return flatten_index(get_industry(key).top_performing_companies)
@@ -1,5 +1,7 @@
-import yfinance as yf
 from ..decorators import command
+from ..utils import lazy_import
+
+yf = lazy_import("yfinance")
 
 
 @command
@@ -1,7 +1,9 @@
-import yfinance as yf
 import typer
 import json
+from collections.abc import Callable, Iterator
+from itertools import chain
 from ..decorators import command
+from ..screen_index import get_index
 from ..typer import (
     ScreenFilterTypeOptional,
     ScreenPredefinedQueryTypeOptional,
@@ -13,18 +15,39 @@ from ..typer import (
     ScreenQueryFieldType,
     ScreenSortOrderType,
     default_sort_order,
+    AllResultsType,
+    default_all_results,
+    MaxResultsType,
+    ScreenLocalType,
+    default_local,
+    ScreenRegionsType,
+    WorkersType,
+    default_workers,
 )
-from ..utils import is_number, count_specified
-
-VALID_FIELDS_DICT = yf.const.EQUITY_SCREENER_FIELDS
-VALID_VALUES_DICT = yf.const.EQUITY_SCREENER_EQ_MAP
-VALID_FIELDS = set().union(*VALID_FIELDS_DICT.values())
-VALID_REGIONS = set(VALID_VALUES_DICT.get("region"))
-VALID_EXCHANGES = set().union(*VALID_VALUES_DICT.get("exchange").values())
-VALID_SECTORS = set(VALID_VALUES_DICT.get("sector"))
-VALID_INDUSTRIES = set().union(*VALID_VALUES_DICT.get("industry").values())
-VALID_PEER_GROUPS = set(VALID_VALUES_DICT.get("peer_group"))
-PREDEFINED_QUERIES = set(yf.PREDEFINED_SCREENER_QUERIES.keys())
+from ..utils import is_number, count_specified, imap_concurrently, lazy_import
+
+yf = lazy_import("yfinance")
+
+# Valid fields and values are looked up in a validation index compiled once from yfinance's
+# constants and kept on disk (see `screen_index`), so validation does not load yfinance.
+
+
+def valid_fields() -> frozenset[str]:
+    return get_index()["fields"]
+
+
+def valid_values(field: str) -> frozenset[str] | None:
+    """The fixed values a field takes (e.g. region, sector), or None for numeric fields."""
+    return get_index()["values"].get(field)
+
+
+def predefined_queries() -> frozenset[str]:
+    return get_index()["predefined"]
+
+
+# Largest page Yahoo serves for a screen
+MAX_PAGE_SIZE = 250
+
 VALID_OPERATORS = {
     "eq",
     "gt",
@@ -39,27 +62,15 @@ VALID_OPERATORS = {
 @command
 def screen_query_fields():
     """Get a list of all valid fields for screening."""
-    return [{"field": f} for f in sorted(list(VALID_FIELDS))]
+    return [{"field": f} for f in sorted(list(valid_fields()))]
 
 
 @command
 def screen_query_values(field: ScreenQueryFieldType):
     """Get a list of all valid values for a field."""
-    if field == "region":
-        values = list(VALID_REGIONS)
-    elif field == "exchange":
-        values = list(VALID_EXCHANGES)
-    elif field == "sector":
-        values = list(VALID_SECTORS)
-    elif field == "industry":
-        values = list(VALID_INDUSTRIES)
-    elif field == "peer_group":
-        values = list(VALID_PEER_GROUPS)
-    else:
-        validate_field(field)
-        values = None
-
+    values = valid_values(field)
     if values is None:
+        validate_field(field)
         return None
 
     return [{"value": v} for v in sorted(values)]
@@ -68,14 +79,14 @@ def screen_query_values(field: ScreenQueryFieldType):
 @command
 def screen_predefined_queries():
     """Get a list of all valid predefined queries."""
-    return [{"query": q} for q in sorted(list(PREDEFINED_QUERIES))]
+    return [{"query": q} for q in sorted(list(predefined_queries()))]
 
 
 def validate_field(field: str):
     """
     Validate the field.
     """
-    if field not in VALID_FIELDS:
+    if field not in valid_fields():
         raise typer.BadParameter(
             f"Invalid field: '{field}'. Valid fields can be found using `yfin screen-query-fields`."
         )
@@ -85,31 +96,12 @@ def parse_value(field: str, value: str) -> str | float:
     """
     Validate the value against the field, then return it into the correct type.
     """
-    if field in VALID_FIELDS_DICT.get("eq_fields"):
-        # fields in `eq_fields` should operate with fixed values
-        if field not in ["region", "exchange", "sector", "industry", "peer_group"]:
-            # This should never happen
-            raise ValueError(f"Invalid field '{field}' for eq_fields")
-
-        if field == "region" and value not in VALID_REGIONS:
-            raise typer.BadParameter(
-                f"Invalid value: '{value}' for 'region' field. Valid values can be found using `yfin screen-query-values --field region`."
-            )
-        elif field == "exchange" and value not in VALID_EXCHANGES:
-            raise typer.BadParameter(
-                f"Invalid value: '{value}' for 'exchange' field. Valid values can be found using `yfin screen-query-values --field exchange`."
-            )
-        elif field == "sector" and value not in VALID_SECTORS:
-            raise typer.BadParameter(
-                f"Invalid value: '{value}' for 'sector' field. Valid values can be found using `yfin screen-query-values --field sector`."
-            )
-        elif field == "industry" and value not in VALID_INDUSTRIES:
-            raise typer.BadParameter(
-                f"Invalid value: '{value}' for 'industry' field. Valid values can be found using `yfin screen-query-values --field industry`."
-            )
-        elif field == "peer_group" and value not in VALID_PEER_GROUPS:
+    values = valid_values(field)
+    if values is not None:
+        # Fields like region and sector operate with fixed values
+        if value not in values:
             raise typer.BadParameter(
-                f"Invalid value: '{value}' for 'peer_group' field. Valid values can be found using `yfin screen-query-values --field peer_group`."
+                f"Invalid value: '{value}' for '{field}' field. Valid values can be found using `yfin screen-query-values --field {field}`."
             )
         return value
 
@@ -121,7 +113,7 @@ def parse_value(field: str, value: str) -> str | float:
     return float(value)
 
 
-def parse_filter(filter_str: str) -> yf.EquityQuery:
+def parse_filter(filter_str: str) -> "yf.EquityQuery":
     """
     Parse a filter string like '<field> <operator> <value>' into an EquityQuery.
     Example: 'sector eq Technology' -> EquityQuery('eq', ['sector', 'Technology'])
@@ -154,7 +146,7 @@ def parse_filter(filter_str: str) -> yf.EquityQuery:
     return yf.EquityQuery(operator, [field] + values)
 
 
-def parse_json_query(json_query: str) -> yf.EquityQuery:
+def parse_json_query(json_query: str) -> "yf.EquityQuery":
     """
     Parse a JSON query into an EquityQuery.
     """
@@ -209,12 +201,18 @@ def screen(
     limit: LimitType = default_limit,
     sort_field: ScreenQueryFieldType = None,
     sort_order: ScreenSortOrderType = default_sort_order,
+    all_results: AllResultsType = default_all_results,
+    max_results: MaxResultsType = None,
+    workers: WorkersType = default_workers,
+    local: ScreenLocalType = default_local,
 ):
     """
     Run a stock screener.
 
     Supports predefined queries, simple filters (implicitly ANDed), or complex JSON queries.
     Options --predefined, --filter, and --json-query are mutually exclusive.
+    With --all or --max-results, result pages are fetched concurrently and streamed.
+    With --local, the query runs against the snapshot made by `yfin screen-snapshot`.
     """
     specified_count = count_specified(filters, predefined, json_query)
     if specified_count != 1:
@@ -223,7 +221,7 @@ def screen(
         )
 
     if predefined:
-        if predefined not in PREDEFINED_QUERIES:
+        if predefined not in predefined_queries():
             raise typer.BadParameter(
                 f"Invalid predefined query: '{predefined}'. Valid predefined queries can be found using `yfin screen-predefined-queries`."
             )
@@ -239,22 +237,111 @@ def screen(
     if sort_field:
         validate_field(sort_field)
 
-    # yfinance docs say that size is only for custom queries, count is only for predefined queries
-    if predefined:
-        response = yf.screen(
-            final_query,
-            offset=offset,
-            count=limit,
-            sortField=sort_field,
-            sortAsc=sort_order == "asc",
+    if local:
+        from ..snapshot import get_snapshot_path, load_snapshot, screen_local
+
+        if predefined:
+            definition = yf.PREDEFINED_SCREENER_QUERIES[predefined]
+            final_query = definition["query"]
+            # Like yfinance, predefined queries keep their own sort field unless one is given
+            sort_field = sort_field or definition["sortField"]
+        if max_results is not None:
+            limit = max_results
+        elif all_results:
+            limit = None
+        return screen_local(
+            load_snapshot(get_snapshot_path()),
+            final_query.to_dict(),
+            sort_field or "ticker",
+            sort_order == "asc",
+            offset,
+            limit,
         )
-    else:
-        response = yf.screen(
+
+    def fetch_page(page_offset: int, page_size: int) -> dict:
+        # yfinance docs say that size is only for custom queries, count is only for predefined queries
+        return yf.screen(
             final_query,
-            offset=offset,
-            size=limit,
+            offset=page_offset,
+            **({"count": page_size} if predefined else {"size": page_size}),
             sortField=sort_field,
             sortAsc=sort_order == "asc",
         )
 
-    return response["quotes"]
+    if all_results or max_results is not None:
+        return iter_screen_pages(fetch_page, offset, max_results, workers)
+    return fetch_page(offset, limit)["quotes"]
+
+
+@command
+def screen_snapshot(
+    regions: ScreenRegionsType = None,
+    workers: WorkersType = default_workers,
+):
+    """
+    Download every equity quote of one or more regions for `yfin screen --local`.
+
+    Pages of quotes are fetched concurrently and kept in a local snapshot under the cache directory.
+    """
+    regions = [r.lower() for r in regions or ["us"]]
+    for region in regions:
+        parse_value("region", region)
+    query = (
+        yf.EquityQuery("eq", ["region", regions[0]])
+        if len(regions) == 1
+        else yf.EquityQuery("is-in", ["region", *regions])
+    )
+
+    def fetch_page(page_offset: int, page_size: int) -> dict:
+        # Sort by ticker, which does not change while the pages are fetched
+        return yf.screen(
+            query, offset=page_offset, size=page_size, sortField="ticker", sortAsc=True
+        )
+
+    quotes = list(iter_screen_pages(fetch_page, 0, None, workers))
+    if len(quotes) == 0:
+        return None
+
+    from ..snapshot import get_snapshot_path, save_snapshot
+
+    return save_snapshot(get_snapshot_path(), quotes, {"regions": regions})
+
+
+def iter_screen_pages(
+    fetch_page: Callable[[int, int], dict],
+    offset: int,
+    max_results: int | None,
+    workers: int,
+) -> Iterator[dict]:
+    """
+    Yield the quotes of every page of a screen, in sort order and without duplicate symbols.
+
+    The first page tells the total number of results, the remaining pages are then fetched
+    concurrently (at most `workers` at a time) and yielded as soon as they arrive in order.
+    """
+    wanted = max_results if max_results is not None else float("inf")
+    first = fetch_page(offset, min(MAX_PAGE_SIZE, wanted))
+    end = min(first.get("total", 0), offset + wanted)
+    offsets = range(offset + MAX_PAGE_SIZE, end, MAX_PAGE_SIZE)
+    pages = chain(
+        [first],
+        imap_concurrently(
+            lambda page_offset: fetch_page(
+                page_offset, min(MAX_PAGE_SIZE, end - page_offset)
+            ),
+            offsets,
+            max_workers=workers,
+        ),
+    )
+
+    # Results can shift between pages while they are fetched, which repeats some symbols
+    seen = set()
+    for page in pages:
+        for quote in page.get("quotes", []):
+            symbol = quote.get("symbol")
+            if symbol in seen:
+                continue
+            seen.add(symbol)
+            yield quote
+            if len(seen) >= wanted:
+                return
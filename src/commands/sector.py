@@ -1,7 +1,23 @@
-import yfinance as yf
-from ..typer import SectorKeyType
+import typer
+from ..typer import (
+    SectorKeyType,
+    SectorKeysType,
+    WorkersType,
+    default_workers,
+    RateLimitType,
+)
 from ..decorators import command
-from ..utils import data_frame_to_list
+from ..domains import get_industry, get_sector
+from ..utils import (
+    RateLimiter,
+    data_frame_to_list,
+    flatten_index,
+    map_concurrently,
+    lazy_import,
+)
+
+pd = lazy_import("pandas")
+yf = lazy_import("yfinance")
 
 
 @command
@@ -17,7 +33,7 @@ def sector_industries(key: SectorKeyType):
     """
     Get the industries within a sector.
     """
-    return data_frame_to_list(yf.Sector(key).industries)
+    return flatten_index(get_sector(key).industries)
 
 
 @command
@@ -25,7 +41,7 @@ def sector_overview(key: SectorKeyType):
     """
     Get the overview information of the domain entity.
     """
-    return yf.Sector(key).overview
+    return get_sector(key).overview
 
 
 @command
@@ -33,7 +49,7 @@ def sector_research_reports(key: SectorKeyType):
     """
     Get research reports related to the domain entity.
     """
-    return yf.Sector(key).research_reports
+    return get_sector(key).research_reports
 
 
 @command
@@ -41,7 +57,7 @@ def sector_top_companies(key: SectorKeyType):
     """
     Get the top companies within the domain entity.
     """
-    return data_frame_to_list(yf.Sector(key).top_companies)
+    return flatten_index(get_sector(key).top_companies)
 
 
 @command
@@ -51,7 +67,7 @@ def sector_top_etfs(key: SectorKeyType):
     """
     return [
         {"symbol": symbol, "name": name}
-        for symbol, name in yf.Sector(key).top_etfs.items()
+        for symbol, name in get_sector(key).top_etfs.items()
     ]
 
 
@@ -62,5 +78,102 @@ def sector_top_mutual_funds(key: SectorKeyType):
     """
     return [
         {"symbol": symbol, "name": name}
-        for symbol, name in yf.Sector(key).top_mutual_funds.items()
+        for symbol, name in get_sector(key).top_mutual_funds.items()
     ]
+
+
+@command
+def sector_report(key: SectorKeyType):
+    """
+    Get every view of a sector from a single request.
+
+    Returns the overview, industries, top companies, top ETFs, top mutual funds and research reports.
+    """
+    sector = get_sector(key)
+    if sector.overview is None:
+        return None
+    return {
+        "key": key,
+        "name": sector.name,
+        "overview": sector.overview,
+        "industries": data_frame_to_list(flatten_index(sector.industries)),
+        "top_companies": data_frame_to_list(flatten_index(sector.top_companies)),
+        "top_etfs": [
+            {"symbol": symbol, "name": name}
+            for symbol, name in (sector.top_etfs or {}).items()
+        ],
+        "top_mutual_funds": [
+            {"symbol": symbol, "name": name}
+            for symbol, name in (sector.top_mutual_funds or {}).items()
+        ],
+        "research_reports": sector.research_reports,
+    }
+
+
+@command
+def sector_crawl(
+    sectors: SectorKeysType = None,
+    workers: WorkersType = default_workers,
+    rate_limit: RateLimitType = None,
+):
+    """
+    Crawl sectors and their industries into one table of each industry's top companies.
+
+    Every sector and industry is fetched concurrently, with one row per sector, industry and company.
+    """
+    mapping = yf.const.SECTOR_INDUSTY_MAPPING_LC
+    sectors = list(dict.fromkeys(sectors or mapping))
+    for key in sectors:
+        if key not in mapping:
+            raise typer.BadParameter(
+                f"Invalid sector key: '{key}'. Valid sector keys can be found using `yfin sector-keys`."
+            )
+    industries = list(dict.fromkeys(i for key in sectors for i in mapping[key]))
+    limiter = RateLimiter(rate_limit)
+
+    def fetch_sector(key: str) -> dict:
+        limiter.wait()
+        sector = get_sector(key)
+        industries = sector.industries
+        return {
+            "name": sector.name,
+            "industries": {}
+            if industries is None
+            else industries[["name", "market weight"]].to_dict("index"),
+        }
+
+    def fetch_industry(key: str) -> "pd.DataFrame | None":
+        limiter.wait()
+        return get_industry(key).top_companies
+
+    # One pool for both levels, so that industries do not wait for every sector to finish
+    tasks = [(fetch_sector, key) for key in sectors]
+    tasks += [(fetch_industry, key) for key in industries]
+    results = map_concurrently(lambda task: task[0](task[1]), tasks, workers)
+    companies = dict(zip(industries, results[len(sectors) :]))
+
+    frames = []
+    for sector, info in zip(sectors, results[: len(sectors)]):
+        for industry in mapping[sector]:
+            top_companies = companies[industry]
+            if top_companies is None or top_companies.empty:
+                continue
+            industry_info = info["industries"].get(industry, {})
+            frames.append(
+                flatten_index(top_companies).assign(
+                    **{
+                        "sector": sector,
+                        "sector name": info["name"],
+                        "industry": industry,
+                        "industry name": industry_info.get("name"),
+                        "industry market weight": industry_info.get("market weight"),
+                    }
+                )
+            )
+    if len(frames) == 0:
+        return None
+
+    data_frame = pd.concat(frames, ignore_index=True)
+    columns = list(data_frame.columns)
+    data_frame = data_frame[columns[-5:] + columns[:-5]]
+    return data_frame.drop_duplicates(["industry", "symbol"], ignore_index=True)
@@ -0,0 +1,53 @@
+import typer
+
+from ..typer import (
+    HostType,
+    PortType,
+    SocketPathType,
+    WorkersType,
+    default_host,
+    default_port,
+    default_workers,
+)
+from ..utils import console_print
+
+
+def serve(socket: SocketPathType):
+    """
+    Run a long-lived daemon that executes commands sent with `yfin --via-daemon <socket> ...`.
+
+    Keeps yfinance, its HTTP session and in-process caches warm between commands.
+    """
+    from ..daemon import DaemonServer
+
+    server = DaemonServer(socket)
+    console_print(f"Listening on {socket}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def http_serve(
+    ctx: typer.Context,
+    host: HostType = default_host,
+    port: PortType = default_port,
+    workers: WorkersType = default_workers,
+):
+    """
+    Run a local HTTP/JSON API exposing every command, e.g. `GET /history?tickers=AAPL&period=5d`.
+
+    Parameters are passed as query parameters or a JSON body and validated like on the command line.
+    Use `output=ndjson` for newline-delimited JSON. `GET /` lists the available commands.
+    """
+    from ..cli import app
+    from ..http_server import HttpApiServer
+
+    server = HttpApiServer(app, ctx.obj, host=host, port=port, workers=workers)
+    console_print(f"Listening on http://{host}:{port}")
+    try:
+        server.run()
+    except KeyboardInterrupt:
+        pass
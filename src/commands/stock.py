@@ -1,7 +1,17 @@
-import yfinance as yf
 import typer
+from collections.abc import Iterator
+from datetime import timedelta
 from ..typer import (
     TickerType,
+    TickersType,
+    TickersFileType,
+    WorkersType,
+    default_workers,
+    StoreType,
+    default_store,
+    ResampleFromType,
+    IndicatorsType,
+    FastInfoFieldsType,
     IntervalType,
     default_interval,
     StartDateTypeOptional,
@@ -15,22 +25,286 @@ from ..typer import (
     default_count,
 )
 from ..decorators import command
-from ..utils import count_specified, compact, data_frame_to_list, series_to_list
+from ..utils import (
+    count_specified,
+    compact,
+    console_print_warning,
+    flatten_index,
+    series_to_frame,
+    map_concurrently,
+    imap_concurrently,
+    read_tickers,
+    lazy_import,
+)
+
+pd = lazy_import("pandas")
+yf = lazy_import("yfinance")
+
+
+def concat_tickers(frames: dict[str, "pd.DataFrame"]) -> "pd.DataFrame":
+    """Stack per-ticker frames in long format with a leading Ticker index level, skipping empty ones."""
+    frames = {t: f for t, f in frames.items() if f is not None and not f.empty}
+    if len(frames) == 0:
+        return pd.DataFrame()
+    return pd.concat(frames, names=["Ticker"])
+
+
+def download_history(tickers: list[str], workers: int, **kwargs) -> "pd.DataFrame":
+    """
+    Download history for many tickers in one bulk request, in long format with a leading Ticker index level.
+
+    Tickers missing from the bulk response are re-fetched individually on a bounded thread pool.
+    """
+    data_frame = yf.download(
+        tickers,
+        group_by="ticker",
+        actions=True,
+        ignore_tz=False,
+        threads=workers,
+        progress=False,
+        **kwargs,
+    )
+
+    frames = {}
+    downloaded = (
+        set(data_frame.columns.get_level_values(0)) if data_frame is not None else set()
+    )
+    for ticker in tickers:
+        if ticker in downloaded:
+            frames[ticker] = data_frame[ticker].dropna(how="all")
+
+    missing = [t for t in tickers if t not in frames or frames[t].empty]
+    fallback = map_concurrently(
+        lambda t: yf.Ticker(t).history(**kwargs), missing, max_workers=workers
+    )
+    for ticker, frame in zip(missing, fallback):
+        frames[ticker] = frame
+
+    return concat_tickers({t: frames[t] for t in tickers})
+
+
+# Longest range Yahoo serves in a single intraday history request
+INTRADAY_CHUNK_SIZES = {
+    "1m": timedelta(days=7),
+    "2m": timedelta(days=59),
+    "5m": timedelta(days=59),
+    "15m": timedelta(days=59),
+    "30m": timedelta(days=59),
+    "60m": timedelta(days=59),
+    "90m": timedelta(days=59),
+    "1h": timedelta(days=729),
+}
+
+
+# How far back Yahoo keeps intraday bars, counted from now (a day short of the documented limit)
+INTRADAY_LOOKBACKS = {
+    "1m": timedelta(days=29),
+    "2m": timedelta(days=59),
+    "5m": timedelta(days=59),
+    "15m": timedelta(days=59),
+    "30m": timedelta(days=59),
+    "60m": timedelta(days=59),
+    "90m": timedelta(days=59),
+    "1h": timedelta(days=729),
+}
+
+
+def clamp_range(
+    interval: str, period: str | None, start: str | None, end: str | None
+) -> tuple:
+    """
+    Clamp the --period/--start/--end range to the intraday bars Yahoo still keeps.
+
+    A range starting earlier is cut with a warning on stderr, and a range ending earlier is
+    rejected. Returns the (period, start, end) to fetch.
+    """
+    lookback = INTRADAY_LOOKBACKS.get(interval)
+    if lookback is None:
+        return period, start, end
+
+    from ..store import requested_range, utc_now
+
+    range_start, range_end = requested_range(period, start, end)
+    oldest = utc_now() - lookback
+    if range_start is None or range_start >= oldest:
+        return period, start, end
+    if range_end is not None and range_end <= oldest:
+        raise typer.BadParameter(
+            f"{interval} bars are only available for the last {lookback.days} days."
+        )
+    console_print_warning(
+        f"{interval} bars are only available for the last {lookback.days} days, "
+        f"fetching from {oldest:%Y-%m-%d %H:%M} UTC.",
+        stderr=True,
+    )
+    return None, oldest, range_end
+
+
+def split_range(interval: str, start, end) -> list[tuple]:
+    """
+    Split [start, end) into consecutive ranges that Yahoo serves in one request for the interval.
+
+    An unbounded end means "until now"; the last range then keeps an open end.
+    """
+    size = INTRADAY_CHUNK_SIZES.get(interval)
+    if size is None or start is None:
+        return [(start, end)]
+
+    from ..store import utc_now
+
+    stop = end if end is not None else utc_now()
+    chunks = []
+    while stop - start > size:
+        chunks.append((start, start + size))
+        start = start + size
+    chunks.append((start, end))
+    return chunks
+
+
+def drop_seen(data_frame: "pd.DataFrame", last_seen: dict) -> "pd.DataFrame":
+    """Drop bars at or before the last bar already emitted for their ticker, then record the new last bars."""
+    if isinstance(data_frame.index, pd.MultiIndex):
+        groups = data_frame.groupby(level=0, sort=False)
+    else:
+        groups = [(None, data_frame)]
+
+    parts = []
+    for ticker, part in groups:
+        times = part.index.get_level_values(-1)
+        if ticker in last_seen:
+            part = part[times > last_seen[ticker]]
+            times = part.index.get_level_values(-1)
+        if not part.empty:
+            last_seen[ticker] = times.max()
+            parts.append(part)
+    if len(parts) == 0:
+        return data_frame.iloc[0:0]
+    return parts[0] if len(parts) == 1 else pd.concat(parts)
+
+
+def iter_history_chunks(
+    tickers: list[str], workers: int, interval: str, chunks: list[tuple]
+) -> Iterator["pd.DataFrame"]:
+    """
+    Fetch history chunk by chunk on a bounded thread pool, yielding de-duplicated chunks in time order.
+
+    Only a few chunks are held in memory at a time. Multiple tickers are fetched in bulk per chunk.
+    """
+
+    def fetch(chunk: tuple) -> "pd.DataFrame":
+        chunk_start, chunk_end = chunk
+        kwargs = compact(interval=interval, start=chunk_start, end=chunk_end)
+        if len(tickers) > 1:
+            return download_history(tickers, workers, **kwargs)
+        return yf.Ticker(tickers[0]).history(**kwargs)
+
+    last_seen = {}
+    for data_frame in imap_concurrently(fetch, chunks, max_workers=workers):
+        if data_frame is None or data_frame.empty:
+            continue
+        data_frame = drop_seen(data_frame.sort_index(), last_seen)
+        if not data_frame.empty:
+            yield data_frame
+
+
+def stored_history(
+    tickers: list[str],
+    workers: int,
+    interval: str,
+    period: str | None,
+    start: str | None,
+    end: str | None,
+) -> "pd.DataFrame":
+    """
+    Serve history from the local store, fetching only the bars each ticker is missing.
+
+    Gaps differ per ticker, so tickers are fetched individually on a bounded thread pool.
+    """
+    from ..store import get_history_store, requested_range
+
+    store = get_history_store()
+    range_start, range_end = requested_range(period, start, end)
+
+    def load(ticker: str) -> "pd.DataFrame":
+        def fetch(fetch_start, fetch_end):
+            chunks = split_range(interval, fetch_start, fetch_end)
+            if len(chunks) > 1:
+                frames = list(iter_history_chunks([ticker], 1, interval, chunks))
+                return pd.concat(frames) if len(frames) > 0 else pd.DataFrame()
+            kwargs = compact(interval=interval, start=fetch_start, end=fetch_end)
+            if fetch_start is None and fetch_end is None:
+                kwargs["period"] = "max"
+            return yf.Ticker(ticker).history(**kwargs)
+
+        return store.history(ticker, interval, range_start, range_end, fetch)
+
+    frames = map_concurrently(load, tickers, max_workers=workers)
+    return concat_tickers(dict(zip(tickers, frames)))
+
+
+def load_history(
+    tickers: list[str],
+    workers: int,
+    interval: str,
+    period: str | None,
+    start: str | None,
+    end: str | None,
+    store: bool,
+) -> "pd.DataFrame | Iterator[pd.DataFrame]":
+    """Fetch bars as indexed DataFrames, streamed in chunks for long intraday ranges."""
+    if store:
+        data_frame = stored_history(tickers, workers, interval, period, start, end)
+        if len(tickers) == 1 and not data_frame.empty:
+            data_frame = data_frame.droplevel("Ticker")
+        return data_frame
+
+    if interval in INTRADAY_CHUNK_SIZES:
+        from ..store import requested_range
+
+        chunks = split_range(interval, *requested_range(period, start, end))
+        if len(chunks) > 1:
+            return iter_history_chunks(tickers, workers, interval, chunks)
+
+    kwargs = compact(
+        interval=interval,
+        period=period,
+        start=start,
+        end=end,
+    )
+
+    if len(tickers) > 1:
+        return download_history(tickers, workers, **kwargs)
+
+    stock = yf.Ticker(tickers[0])
+    return stock.history(**kwargs)
 
 
 @command
 def history(
-    ticker: TickerType,
+    tickers: TickersType = None,
+    tickers_file: TickersFileType = None,
     interval: IntervalType = default_interval,
     period: PeriodTypeOptional = None,
     start: StartDateTypeOptional = None,
     end: EndDateTypeOptional = None,
+    workers: WorkersType = default_workers,
+    store: StoreType = default_store,
+    resample_from: ResampleFromType = None,
+    indicators: IndicatorsType = None,
 ):
     """
-    Get historical market data for a stock ticker.
+    Get historical market data for one or more stock tickers.
 
+    Multiple tickers are fetched in a single bulk request and returned with a leading Ticker column.
+    Intraday ranges longer than Yahoo serves at once are fetched in concurrent chunks and streamed.
+    Intraday ranges reaching further back than Yahoo keeps bars are cut to the bars it still has.
+    With --store, bars are kept locally and later calls only download the bars they are missing.
+    With --resample-from, bars are fetched at a finer interval and aggregated locally.
+    With --indicators, technical indicators are computed per ticker and added as columns.
     Note: period, start, and end - at most 2 of these can be specified together.
     """
+    tickers = read_tickers(tickers, tickers_file)
+
     specified_count = count_specified(period, start, end)
     if specified_count > 2:
         raise typer.BadParameter(
@@ -40,16 +314,35 @@ def history(
     if specified_count == 0:
         period = "1mo"
 
-    kwargs = compact(
-        interval=interval,
-        period=period,
-        start=start,
-        end=end,
-    )
+    if resample_from is not None:
+        from ..resample import can_resample
 
-    stock = yf.Ticker(ticker)
-    data_frame = stock.history(**kwargs)
-    return data_frame_to_list(data_frame)
+        if not can_resample(resample_from, interval):
+            raise typer.BadParameter(
+                f"Cannot build {interval} bars from {resample_from} bars."
+            )
+
+    fetch_interval = resample_from or interval
+    period, start, end = clamp_range(fetch_interval, period, start, end)
+    data = load_history(tickers, workers, fetch_interval, period, start, end, store)
+    if resample_from is None and indicators is None:
+        if isinstance(data, Iterator):
+            return (flatten_index(data_frame) for data_frame in data)
+        return flatten_index(data)
+
+    # Resampling and indicators need whole series, so streamed chunks are collected first
+    if isinstance(data, Iterator):
+        frames = list(data)
+        data = pd.concat(frames) if len(frames) > 0 else pd.DataFrame()
+    if resample_from is not None:
+        from ..resample import resample_bars
+
+        data = resample_bars(data, interval)
+    if indicators is not None:
+        from ..indicators import add_indicators, parse_indicators
+
+        data = add_indicators(data, parse_indicators(indicators))
+    return flatten_index(data)
 
 
 @command
@@ -62,24 +355,59 @@ def dividends(
     """
     stock = yf.Ticker(ticker)
     series = stock.get_dividends(period=period)
-    return series_to_list(series)
+    return series_to_frame(series)
+
+
+def get_fast_info(ticker: str, fields: list[str] | None) -> dict | None:
+    """
+    Read fast info for one ticker, touching only the requested keys (each one is fetched lazily).
+
+    Fields that are not fast info keys, e.g. Ticker when projecting with the global --fields, are skipped.
+    """
+    fast_info = yf.Ticker(ticker).get_fast_info()
+    if fast_info is None:
+        return None
+    keys = fast_info.keys()
+    if fields is not None:
+        keys = [field for field in fields if field in keys]
+    return {key: fast_info[key] for key in keys}
 
 
 @command
 def fast_info(
-    ticker: TickerType,
+    tickers: TickersType = None,
+    tickers_file: TickersFileType = None,
+    fields: FastInfoFieldsType = None,
+    workers: WorkersType = default_workers,
 ):
     """
-    Get fast info (15 min delayed) summary for a stock ticker.
+    Get fast info (15 min delayed) summary for one or more stock tickers.
 
     Returns key metrics like price, market cap, volume, and 52-week range.
+    Multiple tickers are fetched concurrently and returned one row each with a leading Ticker column.
+    With --fields, only the requested metrics are fetched.
     """
-    stock = yf.Ticker(ticker)
-    fast_info = stock.get_fast_info()
-    if fast_info is None:
+    tickers = read_tickers(tickers, tickers_file)
+    fields = fields.split(",") if fields else None
+    if len(tickers) == 1:
+        return get_fast_info(tickers[0], fields)
+
+    def fetch_row(ticker: str) -> dict | None:
+        # A symbol failing to load (e.g. delisted) is skipped like a symbol without data
+        try:
+            return get_fast_info(ticker, fields)
+        except Exception:  # noqa: BLE001
+            return None
+
+    rows = map_concurrently(fetch_row, tickers, max_workers=workers)
+    found = [(t, row) for t, row in zip(tickers, rows) if row is not None]
+    if len(found) == 0:
         return None
-    fast_info_dict = dict(fast_info)  # fast_info is a dict-like object
-    return fast_info_dict
+    data_frame = pd.DataFrame.from_records(
+        [row for _, row in found],
+        index=pd.Index([t for t, _ in found], name="Ticker"),
+    )
+    return flatten_index(data_frame)
 
 
 @command
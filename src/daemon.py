@@ -0,0 +1,308 @@
+"""
+Long-running daemon that executes yfin commands on behalf of thin clients over a Unix domain socket.
+
+The daemon keeps the Typer app, yfinance (with its HTTP session, cookie and crumb) and any
+in-process caches resident, so a forwarded command only costs a socket round trip.
+
+Protocol: the client sends one JSON line with its `argv`, working directory (`cwd`), whether its
+stdin and stdout are terminals (`stdin_isatty`, `stdout_isatty`) and its console's `width` and
+`color_system`. The daemon answers with a sequence of frames, each a 1-byte kind, a 4-byte
+big-endian length and a payload: `o` (stdout bytes), `e` (stderr bytes), and a final `x` (exit
+code as ASCII). Commands run in the client's working directory and format their output for the
+client's terminal. When a command reads stdin, the daemon sends an empty `i` frame and the client
+answers with its stdin as `i` frames, ending with an empty one.
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import threading
+import traceback
+
+from rich.console import Console
+
+from .utils import (
+    console_local,
+    console_print_error,
+    get_console,
+    load_lazy_modules,
+    working_dir,
+)
+
+FRAME_HEADER = struct.Struct(">cI")
+STDOUT = b"o"
+STDERR = b"e"
+EXIT = b"x"
+STDIN = b"i"
+STDIN_CHUNK_SIZE = 64 * 1024
+
+
+def send_frame(sock: socket.socket, kind: bytes, payload: bytes) -> None:
+    sock.sendall(FRAME_HEADER.pack(kind, len(payload)) + payload)
+
+
+def read_frame(reader) -> tuple[bytes, bytes]:
+    header = reader.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        raise ConnectionError("Connection closed unexpectedly")
+    kind, length = FRAME_HEADER.unpack(header)
+    return kind, reader.read(length)
+
+
+class FrameBuffer(io.RawIOBase):
+    """Binary stream that forwards every write over the socket as a frame of one kind."""
+
+    def __init__(self, sock: socket.socket, kind: bytes):
+        self.sock = sock
+        self.kind = kind
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        if len(data) > 0:
+            send_frame(self.sock, self.kind, data)
+        return len(data)
+
+
+class FrameStream(io.TextIOBase):
+    """
+    Text counterpart of `FrameBuffer`, exposing it as `buffer` for binary writers.
+
+    `tty` tells whether the client's stream it stands for is a terminal.
+    """
+
+    def __init__(self, sock: socket.socket, kind: bytes, tty: bool = False):
+        self.buffer = FrameBuffer(sock, kind)
+        self.tty = tty
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self.buffer.write(text.encode())
+        return len(text)
+
+    def isatty(self) -> bool:
+        return self.tty
+
+
+class ClientStdin(io.TextIOBase):
+    """Stdin of a forwarded command, requested from the client on the first read."""
+
+    def __init__(self, sock: socket.socket, reader, tty: bool):
+        self.sock = sock
+        self.reader = reader
+        self.tty = tty
+        self.text = None
+
+    def load(self) -> io.StringIO:
+        if self.text is None:
+            send_frame(self.sock, STDIN, b"")
+            chunks = []
+            while True:
+                kind, payload = read_frame(self.reader)
+                if kind != STDIN or len(payload) == 0:
+                    break
+                chunks.append(payload)
+            self.text = io.StringIO(b"".join(chunks).decode())
+        return self.text
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> str:
+        return self.load().read(size)
+
+    def readline(self, size: int | None = -1) -> str:
+        return self.load().readline(size)
+
+    def isatty(self) -> bool:
+        return self.tty
+
+
+class ThreadLocalStream(io.TextIOBase):
+    """
+    Stand-in for sys.stdin / sys.stdout / sys.stderr that uses a per-thread target stream.
+
+    This lets concurrent requests run in one process, each writing to its own client,
+    while code outside a request keeps writing to the original stream.
+    """
+
+    def __init__(self, default):
+        self.default = default
+        self.local = threading.local()
+
+    @property
+    def target(self):
+        return getattr(self.local, "stream", None) or self.default
+
+    @property
+    def encoding(self) -> str:
+        return getattr(self.target, "encoding", None) or "utf-8"
+
+    @property
+    def buffer(self):
+        return self.target.buffer
+
+    def readable(self) -> bool:
+        return self.target.readable()
+
+    def read(self, size: int | None = -1) -> str:
+        return self.target.read(size)
+
+    def readline(self, size: int | None = -1) -> str:
+        return self.target.readline(size)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        return self.target.write(text)
+
+    def flush(self) -> None:
+        self.target.flush()
+
+    def isatty(self) -> bool:
+        return self.target.isatty()
+
+    def fileno(self) -> int:
+        return self.target.fileno()
+
+    def close(self) -> None:
+        pass  # the wrapped streams are owned by someone else
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        request = json.loads(self.rfile.readline())
+        argv = [str(arg) for arg in request.get("argv", [])]
+
+        stdin = ClientStdin(self.request, self.rfile, bool(request.get("stdin_isatty")))
+        stdout_isatty = bool(request.get("stdout_isatty"))
+        self.server.stdin.local.stream = stdin
+        self.server.stdout.local.stream = FrameStream(
+            self.request, STDOUT, stdout_isatty
+        )
+        self.server.stderr.local.stream = FrameStream(self.request, STDERR)
+        working_dir.path = request.get("cwd")
+        # Output is formatted for the client's terminal, not the daemon's
+        console_local.console = Console(
+            color_system=request.get("color_system"),
+            width=request.get("width"),
+            force_terminal=stdout_isatty,
+        )
+        try:
+            code = self.server.run(argv)
+        finally:
+            self.server.stdin.local.stream = None
+            self.server.stdout.local.stream = None
+            self.server.stderr.local.stream = None
+            working_dir.path = None
+            console_local.console = None
+        send_frame(self.request, EXIT, str(code).encode())
+
+
+class DaemonServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str):
+        import typer.main
+
+        from .cli import app
+
+        self.command = typer.main.get_command(app)
+        load_lazy_modules()
+        if os.path.exists(socket_path) and stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.unlink(socket_path)  # stale socket from a previous run
+        super().__init__(socket_path, DaemonRequestHandler)
+        os.chmod(socket_path, 0o600)
+
+    def run(self, argv: list[str]) -> int:
+        """Run one command in-process and return its exit code."""
+        if len(argv) > 0 and argv[0] in ("serve", "http-serve"):
+            console_print_error("The daemon cannot start another server.")
+            return 2
+        try:
+            self.command.main(args=argv, prog_name="yfin", obj={"forwarded": True})
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception:  # noqa: BLE001
+            # Commands report their own errors; anything else must not take down the daemon
+            traceback.print_exc()
+            return 1
+        return 0
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        stdin, stdout, stderr = sys.stdin, sys.stdout, sys.stderr
+        self.stdin = ThreadLocalStream(stdin)
+        self.stdout, self.stderr = ThreadLocalStream(stdout), ThreadLocalStream(stderr)
+        sys.stdin, sys.stdout, sys.stderr = self.stdin, self.stdout, self.stderr
+        try:
+            super().serve_forever(poll_interval)
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def forward(socket_path: str, argv: list[str], stdin=None) -> int:
+    """
+    Send a command to the daemon, stream its output to stdout/stderr and return its exit code.
+
+    The command runs in the current working directory and reads `stdin` (a binary stream,
+    default sys.stdin) if it reads stdin at all.
+    """
+    stdin = stdin if stdin is not None else sys.stdin.buffer
+    console = get_console()
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "stdin_isatty": stdin.isatty(),
+        "stdout_isatty": sys.stdout.isatty(),
+        "width": console.width,
+        "color_system": console.color_system,
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        reader = sock.makefile("rb")
+        while True:
+            kind, payload = read_frame(reader)
+            if kind == EXIT:
+                return int(payload)
+            if kind == STDIN:
+                while chunk := stdin.read(STDIN_CHUNK_SIZE):
+                    send_frame(sock, STDIN, chunk)
+                send_frame(sock, STDIN, b"")
+                continue
+            stream = sys.stdout if kind == STDOUT else sys.stderr
+            stream.buffer.write(payload)
+            stream.buffer.flush()
+
+
+def strip_option(argv: list[str], option: str) -> list[str]:
+    """Remove an option and its value from argv, in either '--opt value' or '--opt=value' form."""
+    stripped = []
+    skip = False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg == option:
+            skip = True
+        elif not arg.startswith(f"{option}="):
+            stripped.append(arg)
+    return stripped
@@ -1,28 +1,81 @@
 import typer
 import click
+from collections.abc import Iterator
 from functools import wraps
-from .writer import WriterFactory
-from .utils import console_print_error, console_print_warning
+from .cache import get_cache, get_ttl, make_key
+from .writer import WriterFactory, project
+from .utils import (
+    console_print_error,
+    console_print_warning,
+    lazy_import,
+    resolve_tickers,
+)
 
+pd = lazy_import("pandas")
 
-def command(func):
-    """Decorator to handle standard errors and output writing in CLI commands."""
+
+def fetch(func, kwargs: dict, options: dict):
+    """
+    Call a command function, serving and storing its result through the response cache.
+
+    `options` are the global CLI options (see `cli.main`), which control whether the cache is used
+    and which fields of the result are kept. Commands with their own `fields` parameter (e.g.
+    `fast-info`) are given the requested fields, so they can skip fetching the others.
+    """
+    kwargs = resolve_tickers(kwargs)
+    fields = options.get("fields")
+    if fields and kwargs.get("fields", False) is None:
+        kwargs = {**kwargs, "fields": ",".join(fields)}
+    # The full result is cached, so that other projections of it are served from the cache too
+    return project(cached_fetch(func, kwargs, options), fields)
+
+
+def cached_fetch(func, kwargs: dict, options: dict):
+    ttl = get_ttl(func.__name__)
+    if not options.get("cache") or ttl <= 0:
+        return func(**kwargs)
+
+    cache = get_cache()
+    key = make_key(func.__name__, kwargs)
+    if not options.get("refresh"):
+        data = cache.get(key)
+        if data is not None:
+            return data
+
+    data = func(**kwargs)
+    if data is not None and not isinstance(data, Iterator):  # streams are not cached
+        cache.set(key, data, ttl)
+    return data
+
+
+def command(func=None, *, projected: bool = True):
+    """
+    Decorator to handle caching, standard errors and output writing in CLI commands.
+
+    With `projected=False`, the global --fields option is not applied to the command's own
+    output, e.g. for `batch`, which applies it to the data of every job instead.
+    """
+    if func is None:
+        return lambda f: command(f, projected=projected)
 
     @wraps(func)
-    def wrapper(*args, **kwargs):
+    def wrapper(**kwargs):
         try:
-            data = func(*args, **kwargs)
+            ctx = click.get_current_context()
+            # Create the writer first, so that output errors surface before any network request
+            writer = WriterFactory.get_writer(
+                ctx.obj.get("output"), out_file=ctx.obj.get("out_file")
+            )
+            options = ctx.obj if projected else {**ctx.obj, "fields": None}
+            data = fetch(func, kwargs, options)
 
             if data is None:
                 console_print_warning("No data found")
                 raise typer.Exit(code=1)
 
-            if not isinstance(data, (dict, list)):
+            if not isinstance(data, (dict, list, pd.DataFrame, Iterator)):
                 raise ValueError(f"Unsupported data type: {type(data).__name__}")
 
-            ctx = click.get_current_context()
-            output_type = ctx.obj.get("output")
-            writer = WriterFactory.get_writer(output_type)
             writer.write(data)
         except (typer.Exit, typer.Abort, typer.BadParameter):
             raise
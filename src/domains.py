@@ -0,0 +1,75 @@
+"""
+In-process registry of yfinance Sector and Industry objects.
+
+A Sector or Industry downloads its whole payload (overview, top companies, research reports, top
+ETFs, ...) in one request on first access. Keeping one object per key lets every sub-view command
+run by a batch, REPL or server process share that request, and concurrent callers asking for the
+same key wait for the one fetch in flight. Objects expire after a TTL, so long-running processes
+pick up fresh data.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .cache import MINUTE
+from .utils import lazy_import
+
+yf = lazy_import("yfinance")
+
+DOMAIN_TTL = 10 * MINUTE
+
+
+class DomainRegistry:
+    """Keep the object loaded for each key for `ttl` seconds, loading a key at most once at a time."""
+
+    def __init__(self, load: Callable[[str], Any], ttl: float = DOMAIN_TTL):
+        self.load = load
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries: dict[str, dict] = {}
+
+    def get(self, key: str) -> Any:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry["expires_at"] <= time.monotonic():
+                entry = {
+                    "lock": threading.Lock(),
+                    "value": None,
+                    "expires_at": math.inf,
+                }
+                self.entries[key] = entry
+
+        with entry["lock"]:
+            if entry["value"] is None:
+                # A failed load leaves the entry empty, so the next caller retries
+                entry["value"] = self.load(key)
+                entry["expires_at"] = time.monotonic() + self.ttl
+            return entry["value"]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+def load_domain(domain):
+    # Any property triggers the fetch; do it here, under the entry's lock. A failed fetch leaves
+    # the payload empty (yfinance logs it), which the commands report as missing data.
+    _ = domain.overview
+    return domain
+
+
+sectors = DomainRegistry(lambda key: load_domain(yf.Sector(key)))
+industries = DomainRegistry(lambda key: load_domain(yf.Industry(key)))
+
+
+def get_sector(key: str):
+    return sectors.get(key)
+
+
+def get_industry(key: str):
+    return industries.get(key)
@@ -0,0 +1,106 @@
+"""
+Programmatic access to the registered commands, shared by the HTTP server and batch mode.
+
+A `CommandEndpoint` parses parameters with the command's own click parser, so defaults and
+validators match the command line, and exposes the undecorated function that fetches the data.
+"""
+
+from collections.abc import Callable
+
+import click
+import typer.main
+
+import typer
+
+# Commands that run other commands
+EXCLUDED_COMMANDS = {"batch"}
+
+
+class CommandEndpoint:
+    """A registered command, with its click parser and undecorated data function."""
+
+    def __init__(
+        self,
+        name: str,
+        command: click.Command,
+        func: Callable,
+        excluded_params: frozenset[str] = frozenset(),
+    ):
+        self.name = name
+        self.command = command
+        self.func = func
+        self.params = [p for p in command.params if p.name not in excluded_params]
+
+    def describe(self) -> dict:
+        return {
+            "command": self.name,
+            "help": (self.command.help or "").strip().split("\n")[0],
+            "params": [
+                {
+                    "name": p.name,
+                    "required": p.required,
+                    "multiple": p.multiple or p.nargs == -1,
+                    "help": getattr(p, "help", None),
+                }
+                for p in self.params
+            ],
+        }
+
+    def to_argv(self, params: dict[str, list[str]]) -> list[str]:
+        """Translate request parameters into command-line arguments for the command's parser."""
+        by_name = {p.name: p for p in self.params}
+        options, arguments = [], []
+        for name, values in params.items():
+            param = by_name.get(name.replace("-", "_"))
+            if param is None:
+                raise click.UsageError(f"Unknown parameter for {self.name}: '{name}'")
+            if isinstance(param, click.Argument):
+                arguments.extend(values)
+            elif param.is_flag:
+                enabled = values[-1].lower() in ("1", "true", "yes", "on")
+                if enabled:
+                    options.append(param.opts[0])
+                elif param.secondary_opts:
+                    options.append(param.secondary_opts[0])
+            else:
+                for value in values if param.multiple else values[-1:]:
+                    options.extend([param.opts[0], value])
+        return options + ["--"] + arguments
+
+    def parse(self, params: dict[str, list[str]]) -> dict:
+        """Validate named parameters exactly like the CLI does and return the function kwargs."""
+        return self.parse_args(self.to_argv(params))
+
+    def parse_args(self, args: list[str]) -> dict:
+        """Parse command-line arguments with the command's own parser and return the function kwargs."""
+        ctx = self.command.make_context(self.name, args)
+        defaults = {p.name: p.default for p in self.command.params}
+        kwargs = {}
+        for name, value in ctx.params.items():
+            # Like Typer, pass variadic parameters as lists, or None when omitted without a default
+            if isinstance(value, tuple):
+                value = (
+                    None if len(value) == 0 and defaults[name] is None else list(value)
+                )
+            kwargs[name] = value
+        return kwargs
+
+
+def build_endpoints(
+    app: typer.Typer, excluded_params: frozenset[str] = frozenset()
+) -> dict[str, CommandEndpoint]:
+    """
+    Map command names to the data commands that can be run programmatically.
+
+    Parameters in `excluded_params` are neither described nor accepted.
+    """
+    group = typer.main.get_command(app)
+    endpoints = {}
+    for name, command in group.commands.items():
+        func = getattr(command.callback, "__wrapped__", None)
+        # Only data commands (wrapped by the `command` decorator) are exposed
+        data_func = getattr(func, "__wrapped__", None)
+        if name in EXCLUDED_COMMANDS or data_func is None:
+            continue
+        endpoints[name] = CommandEndpoint(name, command, data_func, excluded_params)
+    return endpoints
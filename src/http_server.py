@@ -0,0 +1,283 @@
+"""
+Local HTTP/JSON API exposing every registered command.
+
+`GET /<command>?<param>=<value>&...` runs a command with the same parameters, defaults and
+validators as the CLI (parameters are parsed by the command's own click parser), and
+`POST /<command>` accepts the same parameters as a JSON object. `GET /` lists the commands.
+
+Results are serialized as JSON (default) or NDJSON (`output=ndjson`), optionally projected to
+some fields (`fields=Date,Close`, like the global --fields option), and streamed with chunked
+transfer encoding. Identical requests that arrive while one is in flight share its fetch.
+"""
+
+import asyncio
+import json
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+import click
+
+import typer
+
+from .cache import make_key
+from .decorators import fetch
+from .endpoints import CommandEndpoint, build_endpoints
+from .utils import load_lazy_modules, resolve_tickers
+from .writer import iter_json, iter_ndjson, materialize
+
+HTTP_OUTPUT_TYPES = {
+    "json": ("application/json", iter_json),
+    "ndjson": ("application/x-ndjson", iter_ndjson),
+}
+
+# Parameters reading files or stdin on the server's side, which clients must not reach
+LOCAL_PARAMS = frozenset({"tickers_file"})
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+async def read_head(reader: asyncio.StreamReader) -> tuple[bytes, list[bytes]]:
+    """
+    Read the request line and the header lines of a request.
+
+    Raises ValueError for a line longer than the reader's limit.
+    """
+    request_line = await reader.readline()
+    header_lines = []
+    if request_line.strip():
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            header_lines.append(line)
+    return request_line, header_lines
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_params(target: str, body: bytes) -> tuple[str, dict[str, list[str]]]:
+    url = urlsplit(target)
+    params = parse_qs(url.query, keep_blank_values=True)
+    if body:
+        try:
+            payload = json.loads(body)
+        except json.JSONDecodeError:
+            raise HttpError(400, "Request body must be a JSON object")
+        if not isinstance(payload, dict):
+            raise HttpError(400, "Request body must be a JSON object")
+        for key, value in payload.items():
+            values = value if isinstance(value, list) else [value]
+            params[key] = [
+                json.dumps(v) if isinstance(v, bool) else str(v) for v in values
+            ]
+    return url.path.strip("/"), params
+
+
+class HttpApiServer:
+    """
+    Asyncio HTTP/1.1 server; commands run on a bounded thread pool.
+
+    `options` are the global CLI options the server was started with (e.g. cache settings).
+    """
+
+    def __init__(
+        self,
+        app: typer.Typer,
+        options: dict,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        workers: int = 8,
+    ):
+        self.endpoints = build_endpoints(app, LOCAL_PARAMS)
+        self.options = options
+        self.host = host
+        self.port = port
+        load_lazy_modules()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.inflight: dict[tuple, dict] = {}
+        self.started = threading.Event()
+        self.loop = None
+        self.stopped = None
+
+    def run(self) -> None:
+        """Serve until `stop` is called (or the process is interrupted)."""
+        asyncio.run(self._main())
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.stopped.set)
+
+    async def _main(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.stopped = asyncio.Event()
+        server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        self.started.set()
+        async with server:
+            await self.stopped.wait()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _handle_connection(self, reader, writer) -> None:
+        try:
+            while await self._handle_request(reader, writer):
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader, writer) -> bool:
+        """Handle one request, returning whether the connection should be kept alive."""
+        try:
+            request_line, header_lines = await read_head(reader)
+        except ValueError:
+            # readline() fails on a line over the stream's limit, leaving the request unparsable
+            await self._send_error(writer, 400, "Request line or header too long")
+            return False
+        if not request_line.strip():
+            return False
+        parts = request_line.decode("latin-1").split(maxsplit=2)
+        if len(parts) != 3:
+            await self._send_error(writer, 400, "Malformed request line")
+            return False
+        method, target, version = parts
+
+        headers = {}
+        for line in header_lines:
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+        length = headers.get("content-length", "0")
+        if not length.isdigit():
+            # The body cannot be delimited, so neither can the next request
+            await self._send_error(writer, 400, "Invalid Content-Length")
+            return False
+        length = int(length)
+        body = await reader.readexactly(length) if length > 0 else b""
+        keep_alive = (
+            headers.get("connection", "").lower() != "close"
+            and version.strip() == "HTTP/1.1"
+        )
+
+        try:
+            if method not in ("GET", "POST"):
+                raise HttpError(405, f"Method not allowed: {method}")
+            name, params = parse_params(target, body)
+            if name == "":
+                content = [e.describe() for e in self.endpoints.values()]
+                await self._send(writer, 200, "application/json", [json.dumps(content)])
+                return keep_alive
+
+            output = params.pop("output", ["json"])[-1]
+            if output not in HTTP_OUTPUT_TYPES:
+                raise HttpError(
+                    400,
+                    f"Unsupported output: {output}, should be one of {', '.join(HTTP_OUTPUT_TYPES)}",
+                )
+            fields = params.pop("fields", [None])[-1]
+            fields = fields.split(",") if fields else self.options.get("fields")
+            endpoint = self.endpoints.get(name.replace("_", "-"))
+            if endpoint is None:
+                raise HttpError(404, f"Unknown command: '{name}'")
+
+            try:
+                # Tickers come from the request only, never from the server's stdin
+                kwargs = resolve_tickers(endpoint.parse(params), stdin=False)
+            except click.ClickException as e:
+                raise HttpError(400, e.format_message())
+            data = await self._fetch(endpoint, kwargs, fields)
+        except HttpError as e:
+            await self._send_error(writer, e.status, str(e))
+            return keep_alive
+
+        content_type, serialize = HTTP_OUTPUT_TYPES[output]
+        await self._send(writer, 200, content_type, serialize(data))
+        return keep_alive
+
+    async def _fetch(
+        self, endpoint: CommandEndpoint, kwargs: dict, fields: list[str] | None
+    ):
+        """Run a command on the thread pool, coalescing identical concurrent requests."""
+        key = (make_key(endpoint.func.__name__, kwargs), tuple(fields or ()))
+        entry = self.inflight.get(key)
+        if entry is None:
+            future = self.loop.run_in_executor(
+                self.executor, self._run, endpoint, kwargs, fields
+            )
+            entry = {"future": future, "waiters": 0, "collected": None}
+            self.inflight[key] = entry
+            # Runs before the waiters resume, so that their count is final by then
+            future.add_done_callback(lambda _: self.inflight.pop(key, None))
+        entry["waiters"] += 1
+        data = await asyncio.shield(entry["future"])
+        if entry["waiters"] == 1 or not isinstance(data, Iterator):
+            return data
+        # Coalesced requests share the result, so a stream is collected once for all of them
+        if entry["collected"] is None:
+            entry["collected"] = self.loop.run_in_executor(
+                self.executor, self._collect, data
+            )
+        return await asyncio.shield(entry["collected"])
+
+    def _run(self, endpoint: CommandEndpoint, kwargs: dict, fields: list[str] | None):
+        try:
+            data = fetch(endpoint.func, kwargs, {**self.options, "fields": fields})
+        except (typer.BadParameter, click.ClickException) as e:
+            raise HttpError(400, e.format_message())
+        except Exception as e:  # noqa: BLE001
+            # Like the CLI, any other failure is reported as the request's error
+            raise HttpError(500, f"Unexpected error: {e}")
+        if data is None:
+            raise HttpError(404, "No data found")
+        return data
+
+    def _collect(self, data: Iterator):
+        try:
+            return materialize(data)
+        except Exception as e:  # noqa: BLE001
+            raise HttpError(500, f"Unexpected error: {e}")
+
+    async def _send_error(self, writer, status: int, message: str) -> None:
+        await self._send(
+            writer, status, "application/json", [json.dumps({"error": message})]
+        )
+
+    async def _send(
+        self, writer, status: int, content_type: str, chunks: Iterator[str]
+    ) -> None:
+        """Send a response with chunked transfer encoding, serializing chunks off the event loop."""
+        writer.write(
+            (
+                f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}; charset=utf-8\r\n"
+                "Transfer-Encoding: chunked\r\n"
+                "\r\n"
+            ).encode("latin-1")
+        )
+        chunks = iter(chunks)
+        while True:
+            try:
+                text = await self.loop.run_in_executor(
+                    self.executor, next, chunks, None
+                )
+            except Exception as e:
+                # Too late for an error status: drop the connection, leaving the response
+                # incomplete, so that the client does not take it for a whole one
+                raise ConnectionAbortedError(f"Streaming failed: {e}") from e
+            if text is None:
+                break
+            data = text.encode()
+            if data:
+                writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
@@ -0,0 +1,145 @@
+"""
+Technical indicators computed on history bars with vectorized pandas operations.
+
+Indicators are given as a comma-separated list of `name[:window]`, e.g. `sma:20,ema:50,rsi,atr`.
+With several tickers, every indicator is computed per ticker (the leading Ticker index level).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import typer
+
+from .utils import lazy_import
+
+if TYPE_CHECKING:
+    from pandas import DataFrame, Series
+
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+
+
+def returns(bars: DataFrame, window: int, by) -> Series:
+    """Percentage change of the close over `window` bars."""
+    close = bars["Close"]
+    previous = (
+        close.groupby(by).shift(window) if by is not None else close.shift(window)
+    )
+    return close / previous - 1
+
+
+def log_returns(bars: DataFrame, window: int, by) -> Series:
+    """Logarithmic change of the close over `window` bars."""
+    return np.log1p(returns(bars, window, by))
+
+
+def sma(bars: DataFrame, window: int, by) -> Series:
+    """Simple moving average of the close."""
+    return rolling(bars["Close"], by, lambda s: s.rolling(window).mean())
+
+
+def ema(bars: DataFrame, window: int, by) -> Series:
+    """Exponential moving average of the close, with span `window`."""
+    return rolling(
+        bars["Close"],
+        by,
+        lambda s: s.ewm(span=window, adjust=False, min_periods=window).mean(),
+    )
+
+
+def volatility(bars: DataFrame, window: int, by) -> Series:
+    """Rolling standard deviation of the 1-bar log returns (not annualized)."""
+    return rolling(log_returns(bars, 1, by), by, lambda s: s.rolling(window).std())
+
+
+def rsi(bars: DataFrame, window: int, by) -> Series:
+    """Relative strength index with Wilder's smoothing."""
+    close = bars["Close"]
+    delta = close.groupby(by).diff() if by is not None else close.diff()
+    gain = rolling(delta.clip(lower=0), by, lambda s: wilder(s, window))
+    loss = rolling(-delta.clip(upper=0), by, lambda s: wilder(s, window))
+    return 100 - 100 / (1 + gain / loss)
+
+
+def atr(bars: DataFrame, window: int, by) -> Series:
+    """Average true range with Wilder's smoothing."""
+    close = bars["Close"]
+    previous = close.groupby(by).shift(1) if by is not None else close.shift(1)
+    true_range = pd.concat(
+        [
+            bars["High"] - bars["Low"],
+            (bars["High"] - previous).abs(),
+            (bars["Low"] - previous).abs(),
+        ],
+        axis=1,
+    ).max(axis=1, skipna=False)
+    true_range = true_range.fillna(bars["High"] - bars["Low"])
+    return rolling(true_range, by, lambda s: wilder(s, window))
+
+
+def wilder(series: Series, window: int) -> Series:
+    return series.ewm(alpha=1 / window, adjust=False, min_periods=window).mean()
+
+
+def rolling(series: Series, by, func: Callable[[Series], Series]) -> Series:
+    """Apply a window function to the whole series, or to each ticker's slice of it."""
+    if by is None:
+        return func(series)
+    return series.groupby(by, group_keys=False).transform(func)
+
+
+# name: (function, column prefix, default window)
+INDICATORS = {
+    "returns": (returns, "Return", 1),
+    "logreturns": (log_returns, "LogReturn", 1),
+    "sma": (sma, "SMA", 20),
+    "ema": (ema, "EMA", 20),
+    "rsi": (rsi, "RSI", 14),
+    "atr": (atr, "ATR", 14),
+    "volatility": (volatility, "Volatility", 20),
+}
+
+
+def parse_indicators(value: str) -> list[tuple[str, int]]:
+    """Parse `name[:window],...` into (name, window) pairs, raising BadParameter on invalid specs."""
+    specs = []
+    for item in value.split(","):
+        name, _, window = item.strip().lower().partition(":")
+        if name not in INDICATORS:
+            raise typer.BadParameter(
+                f"Unknown indicator: '{name}', should be one of {', '.join(INDICATORS)}"
+            )
+        if window == "":
+            specs.append((name, INDICATORS[name][2]))
+            continue
+        if not window.isdigit() or int(window) < 1:
+            raise typer.BadParameter(
+                f"Invalid window for {name}: '{window}', should be a positive integer"
+            )
+        specs.append((name, int(window)))
+    return specs
+
+
+def validate_indicators(value: str | None) -> str | None:
+    if value:
+        parse_indicators(value)
+    return value or None
+
+
+def add_indicators(bars: DataFrame, specs: list[tuple[str, int]]) -> DataFrame:
+    """Return `bars` with one column per indicator, e.g. SMA_20, computed per ticker."""
+    if bars.empty:
+        return bars
+    bars = bars.sort_index()
+    by = (
+        bars.index.get_level_values(0)
+        if isinstance(bars.index, pd.MultiIndex)
+        else None
+    )
+    columns = {}
+    for name, window in specs:
+        func, prefix, _ = INDICATORS[name]
+        columns[f"{prefix}_{window}"] = func(bars, window, by)
+    return bars.assign(**columns)
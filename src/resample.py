@@ -0,0 +1,161 @@
+"""
+Derive coarser OHLCV bars from finer ones locally, e.g. 1h or 1d bars from 1m bars.
+
+Bars are aggregated like Yahoo builds them: the open of the first bar, the highest high, the
+lowest low, the close of the last bar and the total volume. Intraday bars are aligned to a grid
+starting at the exchange's regular session open and never span two sessions; daily and longer
+bars are labeled with the session date, the Monday of the week, or the first day of the month or quarter, at midnight in
+the exchange's timezone.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .utils import lazy_import
+
+if TYPE_CHECKING:
+    from pandas import DataFrame, DatetimeIndex, Timedelta
+
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+
+INTRADAY_MINUTES = {
+    "1m": 1,
+    "2m": 2,
+    "5m": 5,
+    "15m": 15,
+    "30m": 30,
+    "60m": 60,
+    "90m": 90,
+    "1h": 60,
+}
+
+# Regular session open of the main exchanges in each timezone, which intraday bins are aligned to
+SESSION_OPENS = {
+    "America/New_York": "09:30",
+    "America/Toronto": "09:30",
+    "America/Sao_Paulo": "10:00",
+    "Europe/London": "08:00",
+    "Europe/Paris": "09:00",
+    "Europe/Berlin": "09:00",
+    "Europe/Amsterdam": "09:00",
+    "Europe/Zurich": "09:00",
+    "Asia/Tokyo": "09:00",
+    "Asia/Hong_Kong": "09:30",
+    "Asia/Shanghai": "09:30",
+    "Asia/Kolkata": "09:15",
+    "Asia/Singapore": "09:00",
+    "Australia/Sydney": "10:00",
+}
+
+# Intervals a calendar interval can be built from, besides any intraday interval
+CALENDAR_SOURCES = {
+    "1d": set(),
+    "1wk": {"1d"},
+    "1mo": {"1d"},
+    "3mo": {"1d", "1mo"},
+}
+
+AGGREGATIONS = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Adj Close": "last",
+    "Volume": "sum",
+    "Dividends": "sum",
+    "Capital Gains": "sum",
+}
+
+
+def can_resample(source: str, target: str) -> bool:
+    """Whether `target` bars can be built exactly from `source` bars."""
+    if source == target:
+        return False
+    if target in INTRADAY_MINUTES:
+        return (
+            source in INTRADAY_MINUTES
+            and INTRADAY_MINUTES[target] % INTRADAY_MINUTES[source] == 0
+            and INTRADAY_MINUTES[target] > INTRADAY_MINUTES[source]
+        )
+    if target in CALENDAR_SOURCES:
+        return source in INTRADAY_MINUTES or source in CALENDAR_SOURCES[target]
+    return False
+
+
+def session_open(local: DatetimeIndex, days: DatetimeIndex, tz) -> Timedelta:
+    """
+    Time of day of the regular session open: the known one of the exchange's timezone, or else
+    the earliest bar of any session.
+    """
+    known = SESSION_OPENS.get(str(tz))
+    if known is not None:
+        return pd.Timedelta(f"{known}:00")
+    return (local - days).min()
+
+
+def bar_labels(index: DatetimeIndex, interval: str) -> DatetimeIndex:
+    """Return, for every bar, the start of the coarser bar it belongs to."""
+    tz = index.tz
+    local = index.tz_localize(None) if tz is not None else index
+    days = local.normalize()
+
+    if interval in INTRADAY_MINUTES:
+        # Align bins to the session open, like Yahoo's 09:30-based hourly bars, even for
+        # sessions whose first bars are missing
+        step = pd.Timedelta(minutes=INTRADAY_MINUTES[interval])
+        anchor = days + session_open(local, days, tz)
+        labels = anchor + ((local - anchor) // step) * step
+        # Bars before the open keep to the grid, without spilling into the previous day
+        labels = labels.where(labels >= days, days)
+    elif interval == "1d":
+        labels = days
+    elif interval == "1wk":
+        labels = days - pd.to_timedelta(days.dayofweek, unit="D")
+    elif interval == "1mo":
+        labels = days.to_period("M").to_timestamp()
+    else:
+        labels = days.to_period("Q").to_timestamp()
+
+    if tz is not None and interval in INTRADAY_MINUTES:
+        # Labels take the UTC offset of their bars, so that the hour repeated when DST ends
+        # gets bins of its own
+        offsets = local - index.tz_convert(None)
+        labels = (labels - offsets).tz_localize("UTC").tz_convert(tz)
+    elif tz is not None:
+        # A day starts at the first of two midnights when DST ends at midnight
+        labels = labels.tz_localize(
+            tz, ambiguous=np.ones(len(labels), dtype=bool), nonexistent="shift_forward"
+        )
+    return labels.rename("Datetime" if interval in INTRADAY_MINUTES else "Date")
+
+
+def resample_bars(data_frame: DataFrame, interval: str) -> DataFrame:
+    """
+    Aggregate bars into `interval` bars, per ticker when there is a leading Ticker index level.
+
+    Columns other than the OHLCV and action columns keep their last value.
+    """
+    if data_frame.empty:
+        return data_frame
+
+    data_frame = data_frame.sort_index()
+    times = pd.DatetimeIndex(data_frame.index.get_level_values(-1))
+    keys = [bar_labels(times, interval)]
+    if isinstance(data_frame.index, pd.MultiIndex):
+        keys.insert(0, data_frame.index.get_level_values(0))
+
+    columns = {c: AGGREGATIONS.get(c, "last") for c in data_frame.columns}
+    splits = "Stock Splits" in data_frame.columns
+    if splits:
+        # Split ratios compound; 0 means no split
+        data_frame = data_frame.assign(
+            **{"Stock Splits": data_frame["Stock Splits"].replace(0.0, 1.0)}
+        )
+        columns["Stock Splits"] = "prod"
+
+    resampled = data_frame.groupby(keys, sort=True).agg(columns)
+    if splits:
+        resampled["Stock Splits"] = resampled["Stock Splits"].replace(1.0, 0.0)
+    return resampled
@@ -0,0 +1,91 @@
+"""
+Validation index of screener fields, field values and predefined queries.
+
+Building the index from yfinance's constants means importing yfinance and set-unioning its nested
+maps, so it is built once and kept under the cache directory, keyed on the installed yfinance
+version. Later runs load it without importing yfinance, and every lookup is a set membership test.
+"""
+
+from __future__ import annotations
+
+import pickle
+from functools import cache
+from importlib.machinery import PathFinder
+from pathlib import Path
+
+from .cache import get_cache_dir, write_pickle
+from .utils import lazy_import
+
+yf = lazy_import("yfinance")
+
+INDEX_VERSION = 1
+
+
+def yfinance_version() -> str | None:
+    """
+    The installed yfinance version, read from its version module.
+
+    yfinance is located on sys.path without importing it, which is much cheaper than
+    `importlib.metadata` and keeps loading the index in the sub-millisecond range.
+    """
+    spec = PathFinder.find_spec("yfinance")
+    if spec is None or spec.origin is None:
+        return None
+    try:
+        text = (Path(spec.origin).parent / "version.py").read_text()
+    except OSError:
+        return None
+    return text.partition("=")[2].strip().strip("\"'") or None
+
+
+def build_index() -> dict:
+    """Compile yfinance's screener constants into flat sets."""
+    eq_map = yf.const.EQUITY_SCREENER_EQ_MAP
+    return {
+        "fields": frozenset().union(*yf.const.EQUITY_SCREENER_FIELDS.values()),
+        # Fields that only take fixed values, and the values each one takes
+        "values": {
+            "region": frozenset(eq_map["region"]),
+            "exchange": frozenset().union(*eq_map["exchange"].values()),
+            "sector": frozenset(eq_map["sector"]),
+            "industry": frozenset().union(*eq_map["industry"].values()),
+            "peer_group": frozenset(eq_map["peer_group"]),
+        },
+        "predefined": frozenset(yf.PREDEFINED_SCREENER_QUERIES),
+    }
+
+
+def get_index_path() -> Path:
+    return get_cache_dir() / "screen" / "index.pkl"
+
+
+def load_index(path: Path, key: tuple) -> dict | None:
+    try:
+        with open(path, "rb") as f:
+            entry = pickle.load(f)
+    except Exception:  # noqa: BLE001
+        # Missing, truncated, or pickled by incompatible versions
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+    return entry["index"]
+
+
+def save_index(path: Path, key: tuple, index: dict) -> None:
+    """Write the index through a temporary file; a failed write only costs a rebuild next time."""
+    try:
+        write_pickle(path, {"key": key, "index": index})
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+@cache
+def get_index() -> dict:
+    """Return the index, loading it from disk, or building and persisting it if it is stale."""
+    key = (INDEX_VERSION, yfinance_version())
+    path = get_index_path()
+    index = load_index(path, key)
+    if index is None:
+        index = build_index()
+        save_index(path, key, index)
+    return index
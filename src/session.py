@@ -0,0 +1,184 @@
+"""
+Shared HTTP session for every yfinance request the CLI makes.
+
+yfinance sends all requests through one process-wide curl_cffi session, but that session keeps a
+curl handle, and with it the open connections, per thread. Concurrent fetches run on short-lived
+thread pools, so every pool paid for new TLS handshakes. The pooled session installed here lends
+handles to requests from whichever thread makes them, so connections outlive the threads and are
+reused across pools, commands, batch jobs and server requests.
+
+The session is installed when yfinance is first used, so that commands answered from the cache or
+from local data still do not import it.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from functools import cache
+
+from .typer import default_http2, default_pool_size
+from .utils import console_print, lazy_import, on_load
+
+yf = lazy_import("yfinance")
+
+settings = {"pool_size": default_pool_size, "timeout": None, "http2": default_http2}
+
+# The session given to yfinance, None until yfinance is loaded
+session = None
+
+
+class ConnectionStats:
+    """Process-wide counters of requests and of the connections they opened or reused."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+        self.reused = 0
+        self.http2 = 0
+
+    def record(self, connects: int, http_version: int) -> None:
+        with self.lock:
+            self.requests += 1
+            self.connections += connects
+            self.reused += connects == 0
+            self.http2 += http_version >= 3  # CURL_HTTP_VERSION_2_0
+
+    def summary(self) -> str:
+        return (
+            f"Connections: {self.requests} requests, {self.connections} new connections, "
+            f"{self.reused} reused, {self.http2} over HTTP/2"
+        )
+
+
+stats = ConnectionStats()
+
+
+class Slots:
+    """
+    Context manager admitting at most `limit` holders at once, whose limit can be changed while
+    slots are held: after lowering it, new holders wait until enough slots are released.
+    """
+
+    def __init__(self, limit: int):
+        self.condition = threading.Condition()
+        self.limit = limit
+        self.held = 0
+
+    def __enter__(self):
+        with self.condition:
+            self.condition.wait_for(lambda: self.held < self.limit)
+            self.held += 1
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        with self.condition:
+            self.held -= 1
+            self.condition.notify()
+
+    def resize(self, limit: int) -> None:
+        with self.condition:
+            self.limit = limit
+            self.condition.notify_all()
+
+
+@cache
+def pooled_session_class() -> type:
+    from curl_cffi import Curl, CurlInfo
+    from curl_cffi.requests import Session
+
+    class PooledSession(Session):
+        """
+        A curl_cffi session lending curl handles from a pool to requests from any thread.
+
+        At most `pool_size` requests are in flight at once; the others wait for a free handle.
+        """
+
+        def __init__(self, **kwargs):
+            super().__init__(curl_infos=[CurlInfo.NUM_CONNECTS], **kwargs)
+            # Last in, first out: the most recently used handles have live connections
+            self.handles = queue.LifoQueue()
+            self.slots = Slots(default_pool_size)
+            self.checked_out = threading.local()
+            self.request_timeout = None
+
+        @property
+        def curl(self):
+            handle = getattr(self.checked_out, "handle", None)
+            return handle if handle is not None else super().curl
+
+        def request(self, method, url, **kwargs):
+            if kwargs.get("stream"):
+                # A stream keeps its handle busy after returning
+                return super().request(method, url, **kwargs)
+            if self.request_timeout is not None:
+                # yfinance passes its own timeout to every request
+                kwargs["timeout"] = self.request_timeout
+
+            with self.slots:
+                try:
+                    handle = self.handles.get_nowait()
+                except queue.Empty:
+                    handle = Curl(debug=self.debug)
+                self.checked_out.handle = handle
+                try:
+                    response = super().request(method, url, **kwargs)
+                finally:
+                    self.checked_out.handle = None
+                    self.handles.put(handle)
+
+            stats.record(
+                response.infos.get(CurlInfo.NUM_CONNECTS, 0), response.http_version
+            )
+            return response
+
+        def close(self) -> None:
+            super().close()
+            while not self.handles.empty():
+                self.handles.get_nowait().close()
+
+    return PooledSession
+
+
+def create_session():
+    from curl_cffi import CurlOpt
+
+    return pooled_session_class()(
+        impersonate="chrome",  # as yfinance's own session
+        curl_options={CurlOpt.TCP_KEEPALIVE: 1},
+    )
+
+
+def apply_settings(pooled_session) -> None:
+    pooled_session.slots.resize(settings["pool_size"])
+    pooled_session.request_timeout = settings["timeout"]
+    pooled_session.http_version = "v2" if settings["http2"] else "v1"
+
+
+def install() -> None:
+    """Create the session and hand it to yfinance's shared data client."""
+    global session
+    session = create_session()
+    apply_settings(session)
+    yf.data.YfData(session=session)
+
+
+def configure(pool_size: int, timeout: float | None, http2: bool) -> None:
+    """
+    Update the session settings. An installed session is updated in place, keeping its
+    connections and yfinance's cookie.
+    """
+    changes = {"pool_size": pool_size, "timeout": timeout, "http2": http2}
+    if changes == settings:
+        return
+    settings.update(changes)
+    if session is not None:
+        apply_settings(session)
+
+
+def print_stats() -> None:
+    console_print(stats.summary(), stderr=True)
+
+
+on_load("yfinance", lambda module: install())
@@ -0,0 +1,190 @@
+"""
+Local snapshot of the screener's quote universe, for `screen --local`.
+
+`screen-snapshot` downloads every quote of a universe (e.g. all US equities) once and keeps it as a
+DataFrame under the cache directory. `screen --local` then evaluates the same queries as Yahoo's
+screener against the snapshot with vectorized NumPy masks, with the same sort, offset and limit
+semantics, without any network request.
+
+Screener fields are named differently from the quote keys they filter on (e.g. intradaymarketcap
+filters marketCap), so fields are mapped to snapshot columns; a field that is not mapped is looked
+up as a column of the same name.
+"""
+
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+
+from .cache import get_cache_dir, write_pickle
+from .utils import lazy_import
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+
+SNAPSHOT_VERSION = 1
+
+# Screener query fields and the quote keys they filter on
+FIELD_COLUMNS = {
+    "ticker": "symbol",
+    "intradaymarketcap": "marketCap",
+    "intradayprice": "regularMarketPrice",
+    "intradaypricechange": "regularMarketChange",
+    "percentchange": "regularMarketChangePercent",
+    "dayvolume": "regularMarketVolume",
+    "avgdailyvol3m": "averageDailyVolume3Month",
+    "eodprice": "regularMarketPreviousClose",
+    "fiftytwowkpercentchange": "fiftyTwoWeekChangePercent",
+    "peratio.lasttwelvemonths": "trailingPE",
+    "pricebookratio.quarterly": "priceToBook",
+    "epsttm": "epsTrailingTwelveMonths",
+}
+
+
+def get_snapshot_path() -> Path:
+    return get_cache_dir() / "screen" / "snapshot.pkl"
+
+
+def compact_frame(data_frame: DataFrame) -> DataFrame:
+    """Store repetitive string columns (exchange, region, currency, ...) as categoricals."""
+    columns = {}
+    for name in data_frame.columns:
+        column = data_frame[name]
+        if not pd.api.types.is_string_dtype(column) or len(column) == 0:
+            continue
+        values = column.dropna()
+        if values.map(type).eq(str).all() and values.nunique() <= len(column) // 2:
+            columns[name] = column.astype("category")
+    return data_frame.assign(**columns)
+
+
+def save_snapshot(path: Path, quotes: list[dict], universe: dict) -> dict:
+    """Write the quotes to `path` through a temporary file, and return a summary of the snapshot."""
+    data_frame = compact_frame(pd.DataFrame.from_records(quotes))
+    created = pd.Timestamp.now("UTC").isoformat(timespec="seconds")
+    entry = {
+        "version": SNAPSHOT_VERSION,
+        "created": created,
+        "universe": universe,
+        "frame": data_frame,
+    }
+    write_pickle(path, entry)
+    return {
+        "path": str(path),
+        "created": created,
+        "quotes": len(data_frame),
+        "fields": len(data_frame.columns),
+    }
+
+
+def load_snapshot(path: Path) -> DataFrame:
+    try:
+        with open(path, "rb") as f:
+            entry = pickle.load(f)
+    except Exception:  # noqa: BLE001
+        # Missing, truncated, or pickled by incompatible pandas versions
+        entry = None
+    if not isinstance(entry, dict) or entry.get("version") != SNAPSHOT_VERSION:
+        raise typer.BadParameter(
+            "No local screen snapshot found, create one with `yfin screen-snapshot`."
+        )
+    return entry["frame"]
+
+
+def resolve_column(data_frame: DataFrame, field: str) -> str:
+    column = FIELD_COLUMNS.get(field, field)
+    if column not in data_frame.columns:
+        raise typer.BadParameter(
+            f"Field '{field}' is not available in the local screen snapshot."
+        )
+    return column
+
+
+class QueryEvaluator:
+    """Evaluate screener query trees (`EquityQuery.to_dict()`) as boolean masks over a snapshot."""
+
+    def __init__(self, data_frame: DataFrame):
+        self.data_frame = data_frame
+        self.numbers = {}
+        self.strings = {}
+
+    def number_column(self, field: str):
+        column = resolve_column(self.data_frame, field)
+        if column not in self.numbers:
+            self.numbers[column] = pd.to_numeric(
+                self.data_frame[column], errors="coerce"
+            ).to_numpy(dtype=float, na_value=np.nan)
+        return self.numbers[column]
+
+    def string_column(self, field: str):
+        column = resolve_column(self.data_frame, field)
+        if column not in self.strings:
+            # Yahoo matches values case-insensitively, e.g. region 'us' matches 'US'
+            values = self.data_frame[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # Lower-case each category once, then look the values up by code
+                categories = np.array(
+                    [c.lower() for c in values.cat.categories] + [None], dtype=object
+                )
+                self.strings[column] = categories[values.cat.codes.to_numpy()]
+            else:
+                self.strings[column] = values.str.lower().to_numpy(
+                    dtype=object, na_value=None
+                )
+        return self.strings[column]
+
+    def mask(self, node: dict):
+        operator = node["operator"].upper()
+        operands = node["operands"]
+        if operator in ("AND", "OR"):
+            masks = [self.mask(operand) for operand in operands]
+            reduce = np.logical_and if operator == "AND" else np.logical_or
+            return reduce.reduce(masks)
+
+        field, *values = operands
+        if operator == "EQ" and isinstance(values[0], str):
+            return self.string_column(field) == values[0].lower()
+
+        column = self.number_column(field)
+        # Comparisons with NaN are False, so quotes without the field never match
+        with np.errstate(invalid="ignore"):
+            if operator == "EQ":
+                return column == float(values[0])
+            if operator == "GT":
+                return column > float(values[0])
+            if operator == "GTE":
+                return column >= float(values[0])
+            if operator == "LT":
+                return column < float(values[0])
+            if operator == "LTE":
+                return column <= float(values[0])
+            if operator == "BTWN":
+                low, high = sorted(float(v) for v in values)
+                return (column >= low) & (column <= high)
+        raise typer.BadParameter(f"Unsupported operator in local screen: {operator}")
+
+
+def screen_local(
+    data_frame: DataFrame,
+    query: dict,
+    sort_field: str,
+    sort_asc: bool,
+    offset: int,
+    limit: int | None,
+) -> DataFrame:
+    """Return one page of the quotes matching `query`, sorted like Yahoo's screener."""
+    matched = data_frame[QueryEvaluator(data_frame).mask(query)]
+    matched = matched.sort_values(
+        resolve_column(data_frame, sort_field),
+        ascending=sort_asc,
+        na_position="last",
+        kind="stable",
+    )
+    end = None if limit is None else offset + limit
+    return matched.iloc[offset:end].reset_index(drop=True)
@@ -0,0 +1,252 @@
+"""
+Incremental on-disk store of OHLCV bars for `history --store`.
+
+Bars are kept per ticker and interval, together with the time ranges they cover. A request only
+fetches the gaps between what is stored and what is asked for, starting a little before each gap
+so that revised or still-forming bars are refreshed, then merges and serves the answer from disk.
+
+Ranges are wall-clock times without a timezone, like the --start and --end dates, which yfinance
+interprets in the exchange's timezone.
+"""
+
+from __future__ import annotations
+
+import math
+import pickle
+from collections.abc import Callable
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .cache import get_cache_dir, write_pickle
+from .utils import lazy_import
+
+if TYPE_CHECKING:
+    from pandas import DataFrame, Timestamp
+
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+
+STORE_VERSION = 1
+
+# How far before a gap to start fetching, to pick up adjusted and still-forming bars
+INTRADAY_OVERLAP = timedelta(days=1)
+OVERLAPS = {
+    "1d": timedelta(days=7),
+    "5d": timedelta(days=14),
+    "1wk": timedelta(days=14),
+    "1mo": timedelta(days=62),
+    "3mo": timedelta(days=184),
+}
+
+PERIOD_OFFSETS = {
+    "1d": {"days": 1},
+    "5d": {"days": 5},
+    "1mo": {"months": 1},
+    "3mo": {"months": 3},
+    "6mo": {"months": 6},
+    "1y": {"years": 1},
+    "2y": {"years": 2},
+    "5y": {"years": 5},
+    "10y": {"years": 10},
+}
+
+# A fetch function takes a start and an end (None for unbounded) and returns bars in that range
+Fetch = Callable[["Timestamp | None", "Timestamp | None"], "DataFrame"]
+
+
+def utc_now() -> Timestamp:
+    return pd.Timestamp.now("UTC").tz_localize(None)
+
+
+def requested_range(
+    period: str | None, start: str | None, end: str | None, now: Timestamp | None = None
+) -> tuple[Timestamp | None, Timestamp | None]:
+    """Translate history's --period/--start/--end into a [start, end) range, None meaning unbounded."""
+    start = pd.Timestamp(start) if start else None
+    end = pd.Timestamp(end) if end else None
+    if period is None or period == "max":
+        return start, end
+    if period == "ytd":
+        return pd.Timestamp(year=(end or now or utc_now()).year, month=1, day=1), end
+
+    offset = pd.DateOffset(**PERIOD_OFFSETS[period])
+    if start is not None:
+        return start, start + offset
+    return (end or now or utc_now()) - offset, end
+
+
+def subtract_ranges(
+    start: float, end: float, ranges: list[tuple[float, float]]
+) -> list[tuple[float, float]]:
+    """Return the parts of [start, end) not covered by any of `ranges`."""
+    gaps = []
+    for lo, hi in sorted(ranges):
+        if hi <= start:
+            continue
+        if lo >= end:
+            break
+        if lo > start:
+            gaps.append((start, lo))
+        start = max(start, hi)
+    if start < end:
+        gaps.append((start, end))
+    return gaps
+
+
+def merge_ranges(ranges: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    merged = []
+    for lo, hi in sorted(ranges):
+        if merged and lo <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+def to_seconds(timestamp: Timestamp | None, default: float) -> float:
+    return default if timestamp is None else timestamp.timestamp()
+
+
+def from_seconds(seconds: float) -> Timestamp | None:
+    return None if math.isinf(seconds) else pd.Timestamp(seconds, unit="s")
+
+
+def is_consistent(stored: DataFrame, fetched: DataFrame) -> bool:
+    """
+    Check that re-fetched bars match the stored ones.
+
+    A mismatch means past prices were adjusted (e.g. for a dividend or split), so the stored
+    bars are stale. The last stored bar may still have been forming and is not compared.
+    """
+    if "Close" not in stored.columns or "Close" not in fetched.columns:
+        return True
+    common = stored.index.intersection(fetched.index)
+    common = common[common < stored.index[-1]]
+    if len(common) == 0:
+        return True
+    return bool(
+        np.allclose(
+            stored.loc[common, "Close"].to_numpy(dtype=float),
+            fetched.loc[common, "Close"].to_numpy(dtype=float),
+            rtol=1e-6,
+            equal_nan=True,
+        )
+    )
+
+
+def select(
+    data_frame: DataFrame | None, start: Timestamp | None, end: Timestamp | None
+) -> DataFrame:
+    """Return the bars in [start, end), comparing in the exchange's wall-clock time."""
+    if data_frame is None or data_frame.empty:
+        return pd.DataFrame()
+    index = data_frame.index
+    local = index.tz_localize(None) if getattr(index, "tz", None) is not None else index
+    mask = np.ones(len(index), dtype=bool)
+    if start is not None:
+        mask &= local >= start
+    if end is not None:
+        mask &= local < end
+    return data_frame[mask]
+
+
+class HistoryStore:
+    """
+    Bars per ticker and interval, pickled to `<root>/<interval>/<ticker>.pkl`.
+
+    Store errors are never fatal: an unreadable entry is refetched and a failed write is dropped.
+    Writes go through a temporary file, so concurrent runs never see a partial entry.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def path(self, ticker: str, interval: str) -> Path:
+        return self.root / interval / f"{ticker.replace('/', '_')}.pkl"
+
+    def load(self, ticker: str, interval: str) -> dict | None:
+        try:
+            with open(self.path(ticker, interval), "rb") as f:
+                entry = pickle.load(f)
+        except Exception:  # noqa: BLE001
+            # Missing, truncated, or pickled by incompatible pandas/yfinance versions
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != STORE_VERSION:
+            return None
+        return entry
+
+    def save(self, ticker: str, interval: str, entry: dict) -> None:
+        try:
+            write_pickle(self.path(ticker, interval), entry)
+        except (OSError, pickle.PicklingError):
+            pass  # a failed write only costs a refetch
+
+    def history(
+        self,
+        ticker: str,
+        interval: str,
+        start: Timestamp | None,
+        end: Timestamp | None,
+        fetch: Fetch,
+        now: Timestamp | None = None,
+    ) -> DataFrame:
+        """Return bars in [start, end), fetching only the ranges that are not stored yet."""
+        now = now or utc_now()
+        now_seconds = now.timestamp()
+        lo = to_seconds(start, -math.inf)
+        hi = min(to_seconds(end, now_seconds), now_seconds)
+
+        entry = self.load(ticker, interval) or {
+            "version": STORE_VERSION,
+            "frame": None,
+            "ranges": [],
+        }
+        gaps = subtract_ranges(lo, hi, entry["ranges"])
+        if len(gaps) == 0:
+            return select(entry["frame"], start, end)
+
+        overlap = OVERLAPS.get(interval, INTRADAY_OVERLAP)
+        stored = entry["frame"]
+        frames = [] if stored is None or stored.empty else [stored]
+        # yfinance answers failed requests with no bars, so only gaps that got bars are covered
+        covered = []
+        consistent = True
+        for gap_start, gap_end in gaps:
+            fetch_start = from_seconds(gap_start)
+            fetched = fetch(
+                None if fetch_start is None else fetch_start - overlap,
+                None if gap_end >= now_seconds else from_seconds(gap_end),
+            )
+            if fetched is None or fetched.empty:
+                continue
+            if len(frames) > 0 and not is_consistent(frames[0], fetched):
+                consistent = False
+                break
+            frames.append(fetched)
+            covered.append((gap_start, gap_end))
+
+        if consistent:
+            ranges = merge_ranges(entry["ranges"] + covered)
+        else:
+            # Past bars were adjusted, replace the stale bars with the requested range
+            fetched = fetch(start, end)
+            frames = [] if fetched is None or fetched.empty else [fetched]
+            ranges = [(lo, hi)] if len(frames) > 0 else []
+
+        data_frame = None
+        if len(frames) > 0:
+            data_frame = pd.concat(frames)
+            data_frame = data_frame[
+                ~data_frame.index.duplicated(keep="last")
+            ].sort_index()
+        self.save(
+            ticker,
+            interval,
+            {"version": STORE_VERSION, "frame": data_frame, "ranges": ranges},
+        )
+        return select(data_frame, start, end)
+
+
+def get_history_store() -> HistoryStore:
+    return HistoryStore(get_cache_dir() / "history")
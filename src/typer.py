@@ -1,9 +1,12 @@
 import typer
 from typing import Annotated
+from .cache import get_cache_dir
+from .indicators import validate_indicators
 from .utils import (
     get_today_date_string,
     validate_date_string,
     validate_value_in_list,
+    validate_values_in_list,
 )
 
 TickerType = Annotated[
@@ -13,7 +16,35 @@ TickerType = Annotated[
     ),
 ]
 
-VALID_OUTPUT_TYPES = ["json", "table"]
+TickersType = Annotated[
+    list[str] | None,
+    typer.Argument(
+        help="One or more stock ticker symbols (e.g., TSLA AAPL), also read from --tickers-file or stdin",
+        callback=lambda xs: [x.upper() for x in xs] if xs else xs,
+        show_default=False,
+    ),
+]
+
+TickersFileType = Annotated[
+    str | None,
+    typer.Option(
+        help="File with ticker symbols separated by whitespace or commas, '-' for stdin",
+    ),
+]
+
+default_workers = 8
+
+WorkersType = Annotated[
+    int,
+    typer.Option(
+        min=1,
+        help="Maximum number of concurrent requests",
+    ),
+]
+
+VALID_OUTPUT_TYPES = ["json", "table", "ndjson", "parquet", "arrow", "feather"]
+
+BINARY_OUTPUT_TYPES = ["parquet", "arrow", "feather"]
 
 default_output = VALID_OUTPUT_TYPES[0]
 
@@ -25,6 +56,124 @@ OutputType = Annotated[
     ),
 ]
 
+OutFileType = Annotated[
+    str | None,
+    typer.Option(
+        help=f"File to write {', '.join(BINARY_OUTPUT_TYPES)} output to, default stdout",
+    ),
+]
+
+default_cache = True
+
+CacheType = Annotated[
+    bool,
+    typer.Option(
+        "--cache/--no-cache",
+        help="Serve responses from the on-disk cache when they are still fresh",
+    ),
+]
+
+default_refresh = False
+
+RefreshType = Annotated[
+    bool,
+    typer.Option(
+        "--refresh",
+        help="Ignore cached responses and fetch fresh data (the cache is still updated)",
+    ),
+]
+
+FieldsType = Annotated[
+    str | None,
+    typer.Option(
+        help="Comma-separated fields (columns or keys) to keep in the output, e.g. Date,Close",
+    ),
+]
+
+default_pool_size = 10
+
+PoolSizeType = Annotated[
+    int,
+    typer.Option(
+        min=1,
+        help="Maximum number of concurrent HTTP requests, each reusing a pooled connection",
+    ),
+]
+
+TimeoutType = Annotated[
+    float | None,
+    typer.Option(
+        min=0.1,
+        help="Timeout of every HTTP request in seconds, default yfinance's own timeouts",
+    ),
+]
+
+default_http2 = True
+
+Http2Type = Annotated[
+    bool,
+    typer.Option(
+        "--http2/--no-http2",
+        help="Use HTTP/2 where the server supports it",
+    ),
+]
+
+default_debug_connections = False
+
+DebugConnectionsType = Annotated[
+    bool,
+    typer.Option(
+        help="Print counters of HTTP requests and new or reused connections to stderr on exit",
+    ),
+]
+
+ViaDaemonType = Annotated[
+    str | None,
+    typer.Option(
+        help="Forward the command to a daemon listening on this socket (see `yfin serve`)",
+    ),
+]
+
+SocketPathType = Annotated[
+    str,
+    typer.Option(
+        default_factory=lambda: str(get_cache_dir() / "daemon.sock"),
+        help="Unix domain socket path to listen on, default <cache dir>/daemon.sock",
+        show_default=False,
+    ),
+]
+
+JobsFileType = Annotated[
+    str,
+    typer.Argument(
+        help="File with one job per line, as a command line or a JSON object, '-' for stdin",
+    ),
+]
+
+default_store = False
+
+StoreType = Annotated[
+    bool,
+    typer.Option(
+        "--store/--no-store",
+        help="Keep bars in a local store under the cache directory and only fetch missing ranges",
+    ),
+]
+
+default_host = "127.0.0.1"
+
+HostType = Annotated[
+    str,
+    typer.Option(help="Address to bind the HTTP server to"),
+]
+
+default_port = 8080
+
+PortType = Annotated[
+    int,
+    typer.Option(min=0, max=65535, help="Port to bind the HTTP server to"),
+]
+
 default_frequency = "yearly"
 
 FrequencyType = Annotated[
@@ -43,6 +192,42 @@ ExtendedFrequencyType = Annotated[
     ),
 ]
 
+STATEMENTS = ["income", "balance", "cashflow"]
+
+StatementsType = Annotated[
+    str | None,
+    typer.Option(
+        callback=validate_values_in_list(STATEMENTS),
+        help="Comma-separated statements to fetch (income, balance, cashflow), default all",
+    ),
+]
+
+ANALYSIS_SECTIONS = [
+    "recommendations",
+    "upgrades-downgrades",
+    "price-targets",
+    "earnings-estimate",
+    "revenue-estimate",
+    "earnings-history",
+    "eps-trend",
+    "eps-revisions",
+    "growth-estimates",
+    "insider-purchases",
+    "insider-transactions",
+    "insider-roster-holders",
+    "major-holders",
+    "institutional-holders",
+    "mutualfund-holders",
+]
+
+AnalysisSectionsType = Annotated[
+    str | None,
+    typer.Option(
+        callback=validate_values_in_list(ANALYSIS_SECTIONS),
+        help="Comma-separated sections to fetch, named after the analysis commands, default all",
+    ),
+]
+
 StartDateType = Annotated[
     str,
     typer.Option(
@@ -115,6 +300,32 @@ OffsetType = Annotated[
     ),
 ]
 
+default_all_results = False
+
+AllResultsType = Annotated[
+    bool,
+    typer.Option(
+        "--all",
+        help="Fetch every page of results from --offset on, concurrently (--limit is ignored)",
+    ),
+]
+
+MaxResultsType = Annotated[
+    int | None,
+    typer.Option(
+        min=1,
+        help="Fetch pages of results concurrently until this many results (--limit is ignored)",
+    ),
+]
+
+CalendarAllType = Annotated[
+    bool,
+    typer.Option(
+        "--all",
+        help="Fetch every event from start to end, in concurrent date-range shards (--limit and --offset are ignored)",
+    ),
+]
+
 default_market_cap = 0
 
 MarketCapType = Annotated[
@@ -150,6 +361,54 @@ IntervalType = Annotated[
     ),
 ]
 
+ResampleFromType = Annotated[
+    str | None,
+    typer.Option(
+        callback=lambda x: validate_value_in_list(VALID_INTERVALS)(x) if x else None,
+        help="Fetch bars at this finer interval and aggregate them to --interval locally",
+    ),
+]
+
+IndicatorsType = Annotated[
+    str | None,
+    typer.Option(
+        callback=validate_indicators,
+        help="Comma-separated indicators to add as columns, as name[:window] (returns, logreturns, sma, ema, rsi, atr, volatility), e.g. sma:20,ema:50,rsi:14",
+    ),
+]
+
+# Keys of yfinance's FastInfo, each one a lazily fetched property
+FAST_INFO_FIELDS = [
+    "currency",
+    "dayHigh",
+    "dayLow",
+    "exchange",
+    "fiftyDayAverage",
+    "lastPrice",
+    "lastVolume",
+    "marketCap",
+    "open",
+    "previousClose",
+    "quoteType",
+    "regularMarketPreviousClose",
+    "shares",
+    "tenDayAverageVolume",
+    "threeMonthAverageVolume",
+    "timezone",
+    "twoHundredDayAverage",
+    "yearChange",
+    "yearHigh",
+    "yearLow",
+]
+
+FastInfoFieldsType = Annotated[
+    str | None,
+    typer.Option(
+        callback=validate_values_in_list(FAST_INFO_FIELDS),
+        help="Comma-separated fields to fetch, e.g. lastPrice,marketCap, default all",
+    ),
+]
+
 default_count = 10
 
 CountType = Annotated[
@@ -176,6 +435,22 @@ SectorKeyType = Annotated[
     ),
 ]
 
+SectorKeysType = Annotated[
+    list[str] | None,
+    typer.Option(
+        "--sector",  # parameter name is plural
+        help="Sector key to crawl, can be specified multiple times, default all (see `yfin sector-keys`)",
+    ),
+]
+
+RateLimitType = Annotated[
+    float | None,
+    typer.Option(
+        min=0.1,
+        help="Maximum number of requests per second, default unlimited",
+    ),
+]
+
 IndustryKeyType = Annotated[
     str,
     typer.Argument(
@@ -212,6 +487,24 @@ ScreenQueryFieldType = Annotated[
     ),
 ]
 
+default_local = False
+
+ScreenLocalType = Annotated[
+    bool,
+    typer.Option(
+        "--local",
+        help="Screen the local snapshot made by `yfin screen-snapshot` instead of querying Yahoo",
+    ),
+]
+
+ScreenRegionsType = Annotated[
+    list[str] | None,
+    typer.Option(
+        "--region",  # parameter name is plural
+        help="Region of the quotes to download, can be specified multiple times, default us",
+    ),
+]
+
 default_sort_order = "desc"
 
 ScreenSortOrderType = Annotated[
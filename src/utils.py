@@ -1,23 +1,118 @@
-import json
+from __future__ import annotations
+
+import importlib.util
+import math
+import os
+import sys
+import threading
+import time
 import typer
-from typing import Any, Callable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
 from datetime import datetime, timedelta
-from pandas import DataFrame, Series
 from rich.console import Console
 
-console = Console()
+if TYPE_CHECKING:
+    from pandas import DataFrame, Series
+
+
+# Callbacks to run once a lazily imported module is executed, see `on_load`
+load_hooks: dict[str, list[Callable[[ModuleType], None]]] = {}
+# Names of the modules imported with `lazy_import`
+lazy_modules: list[str] = []
+
+
+class HookedLoader:
+    """Wrap a module loader to run the module's `on_load` hooks right after executing it."""
+
+    def __init__(self, loader):
+        self.loader = loader
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self.loader.exec_module(module)
+        for hook in load_hooks.pop(module.__spec__.name, []):
+            hook(module)
+
+    def __getattr__(self, name: str):
+        return getattr(self.loader, name)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module lazily: the module is only executed on its first attribute access.
+
+    Used for heavy dependencies (pandas, numpy, yfinance), so that `--help` and shell
+    completion do not pay for importing them.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(HookedLoader(spec.loader))
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    lazy_modules.append(name)
+    return module
+
+
+def load_lazy_modules() -> None:
+    """
+    Execute the lazily imported modules not used yet.
+
+    The first use of a lazy module is not thread-safe before Python 3.12.3, so this is called
+    before work is handed to threads.
+    """
+    for name in lazy_modules:
+        module = sys.modules.get(name)
+        if module is not None and type(module) is not ModuleType:
+            _ = module.__dict__  # any attribute access executes the module
+
+
+def on_load(name: str, hook: Callable[[ModuleType], None]) -> None:
+    """
+    Run `hook` with the module `name` once it is executed: right away if it already is,
+    otherwise on the first use of the lazily imported module.
+    """
+    module = sys.modules.get(name)
+    if module is not None and type(module) is ModuleType:
+        hook(module)
+    else:
+        load_hooks.setdefault(name, []).append(hook)
+
 
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
 
-def console_print(content: Any):
-    console.print(content)
+default_console = Console()
+# Notes that must not mix with the output, e.g. warnings about partial data
+error_console = Console(stderr=True, soft_wrap=True)
+# Console of the running command, when it is not the process's own, see `get_console`
+console_local = threading.local()
 
 
-def console_print_error(content: Any):
-    console.print(f"[red]{content}[/red]")
+def get_console(stderr: bool = False) -> Console:
+    """Return the console of the running command: the client's for commands run by the daemon."""
+    if stderr:
+        return error_console
+    return getattr(console_local, "console", None) or default_console
 
 
-def console_print_warning(content: Any):
-    console.print(f"[yellow]{content}[/yellow]")
+def console_print(content: Any, stderr: bool = False):
+    get_console(stderr).print(content)
+
+
+def console_print_error(content: Any, stderr: bool = False):
+    get_console(stderr).print(f"[red]{content}[/red]")
+
+
+def console_print_warning(content: Any, stderr: bool = False):
+    get_console(stderr).print(f"[yellow]{content}[/yellow]")
 
 
 def count_specified(*args: str | None) -> int:
@@ -30,6 +125,113 @@ def compact(**kwargs):
     return {k: v for k, v in kwargs.items() if v is not None}
 
 
+def map_concurrently(func: Callable, items: Iterable, max_workers: int) -> list:
+    """Apply `func` to every item on a bounded thread pool, returning results in input order."""
+    items = list(items)
+    if len(items) <= 1 or max_workers <= 1:
+        return [func(item) for item in items]
+    load_lazy_modules()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def imap_concurrently(func: Callable, items: Iterable, max_workers: int) -> Iterator:
+    """
+    Like `map_concurrently`, but yield results in input order as soon as they are ready.
+
+    At most `max_workers` items are in flight or waiting to be consumed, which bounds memory.
+    """
+    items = iter(items)
+    load_lazy_modules()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(
+            executor.submit(func, item) for _, item in zip(range(max_workers), items)
+        )
+        try:
+            while pending:
+                result = pending.popleft().result()
+                for item in items:
+                    pending.append(executor.submit(func, item))
+                    break
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class RateLimiter:
+    """Space calls to `wait` at least 1/rate seconds apart across threads, no limit for None."""
+
+    def __init__(self, rate: float | None):
+        self.interval = 1 / rate if rate else 0.0
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def wait(self) -> None:
+        if self.interval == 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_time)
+            self.next_time = start + self.interval
+        time.sleep(start - now)
+
+
+# Directory that relative paths of the running command are resolved against, see `resolve_path`
+working_dir = threading.local()
+
+
+def resolve_path(path: str) -> str:
+    """
+    Resolve a path given on the command line against the command's working directory: the
+    process's own, or the client's for commands forwarded to a daemon.
+    """
+    cwd = getattr(working_dir, "path", None)
+    return path if cwd is None else os.path.join(cwd, path)
+
+
+def read_tickers(
+    tickers: list[str] | None, tickers_file: str | None, stdin: bool = True
+) -> list[str]:
+    """
+    Collect ticker symbols from positional arguments, a file ('-' for stdin), or piped stdin.
+
+    Symbols are upper-cased and de-duplicated, preserving their first-seen order. With
+    `stdin=False`, piped stdin is not read when no tickers are given (e.g. in a server).
+    """
+    symbols = list(tickers or [])
+    if tickers_file == "-":
+        symbols += sys.stdin.read().replace(",", " ").split()
+    elif tickers_file is not None:
+        try:
+            with open(resolve_path(tickers_file)) as f:
+                symbols += f.read().replace(",", " ").split()
+        except OSError as e:
+            raise typer.BadParameter(f"Cannot read tickers file: {e}")
+    elif stdin and not symbols and not sys.stdin.isatty():
+        symbols += sys.stdin.read().replace(",", " ").split()
+
+    symbols = list(dict.fromkeys(s.upper() for s in symbols))
+    if len(symbols) == 0:
+        raise typer.BadParameter(
+            "At least one ticker is required, as arguments, via --tickers-file, or on stdin."
+        )
+    return symbols
+
+
+def resolve_tickers(kwargs: dict, stdin: bool = True) -> dict:
+    """
+    Return the arguments of a multi-ticker command with its tickers read (see `read_tickers`).
+
+    Results are keyed on the arguments, so that they must name the tickers themselves, not the
+    file or stdin they were read from.
+    """
+    if "tickers_file" not in kwargs:
+        return kwargs
+    tickers = read_tickers(kwargs.get("tickers"), kwargs["tickers_file"], stdin)
+    return {**kwargs, "tickers": tickers, "tickers_file": None}
+
+
 def get_today_date_string() -> str:
     return format_datetime(datetime.now())
 
@@ -53,20 +255,105 @@ def is_number(s: str) -> bool:
         return False
 
 
-def data_frame_to_list(data_frame: DataFrame, index_name: str | None = None) -> list:
+def flatten_index(
+    data_frame: DataFrame | None, index_name: str | None = None
+) -> DataFrame | None:
+    """Move the index into regular columns, so that every row maps onto one output record."""
     if data_frame is None:
         return None
-    return json.loads(
-        data_frame.reset_index(names=index_name).to_json(
-            orient="records", date_format="iso"
-        )
-    )
+    return data_frame.reset_index(names=index_name)
 
 
-def series_to_list(series: Series) -> list:
+def series_to_frame(series: Series | None) -> DataFrame | None:
+    """Convert a Series to a DataFrame with its index as the first column."""
     if series is None:
         return None
-    return json.loads(series.reset_index().to_json(orient="records", date_format="iso"))
+    return series.reset_index()
+
+
+def _format_datetime_column(column: Series) -> Series:
+    """
+    Format a datetime64 column as ISO-8601 strings with millisecond precision, NaT as None.
+
+    Timezone-aware values are converted to UTC and suffixed with 'Z', matching `DataFrame.to_json`.
+    """
+    suffix = ""
+    if column.dt.tz is not None:
+        column = column.dt.tz_convert(None)
+        suffix = "Z"
+    values = np.datetime_as_string(column.to_numpy("datetime64[ms]"), unit="ms")
+    formatted = pd.Series(values, index=column.index, dtype=object) + suffix
+    return formatted.where(column.notna().to_numpy(), None)
+
+
+def _format_datetime_columns(data_frame: DataFrame) -> DataFrame:
+    """Replace every datetime64 column with its ISO-8601 string representation."""
+    datetime_columns = [
+        i
+        for i, dtype in enumerate(data_frame.dtypes)
+        if pd.api.types.is_datetime64_any_dtype(dtype)
+    ]
+    if len(datetime_columns) == 0:
+        return data_frame
+    data_frame = data_frame.copy(deep=False)
+    for i in datetime_columns:
+        data_frame.isetitem(i, _format_datetime_column(data_frame.iloc[:, i]))
+    return data_frame
+
+
+def _to_native(value: Any) -> Any:
+    """Convert a single value from an object column to a JSON-compatible Python value."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, datetime):
+        value = pd.Timestamp(value)
+        if value.tz is not None:
+            return value.tz_convert(None).isoformat(timespec="milliseconds") + "Z"
+        return value.isoformat(timespec="milliseconds")
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _column_to_list(column: Series) -> list:
+    """Convert a column to a list of JSON-compatible Python values."""
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iub":
+            return column.tolist()
+        if dtype.kind == "f":
+            values = column.to_numpy()
+            return column.astype(object).where(np.isfinite(values), None).tolist()
+    elif dtype.kind in "iubf":  # nullable extension dtypes, e.g. Int64
+        return column.astype(object).where(column.notna().to_numpy(), None).tolist()
+    return [_to_native(v) for v in column.tolist()]
+
+
+def data_frame_to_list(data_frame: DataFrame | None) -> list | None:
+    """
+    Convert a DataFrame to a list of records with JSON-compatible values, column by column.
+
+    Datetimes become ISO-8601 strings, NaN/NaT/inf become None, and numpy scalars become Python scalars.
+    """
+    if data_frame is None:
+        return None
+    data_frame = _format_datetime_columns(data_frame)
+    keys = [str(c) for c in data_frame.columns]
+    columns = [_column_to_list(data_frame.iloc[:, i]) for i in range(len(keys))]
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+def data_frame_to_json(
+    data_frame: DataFrame, indent: int | None = None, lines: bool = False
+) -> str:
+    """Serialize a DataFrame to a JSON array of records, or newline-delimited records, in a single pass."""
+    if lines and data_frame.empty:
+        return ""
+    return _format_datetime_columns(data_frame).to_json(
+        orient="records", date_format="iso", indent=indent, lines=lines
+    )
 
 
 def validate_value_in_list(valid_values: list[str]) -> Callable[[str], str]:
@@ -80,6 +367,24 @@ def validate_value_in_list(valid_values: list[str]) -> Callable[[str], str]:
     return _validator
 
 
+def validate_values_in_list(
+    valid_values: list[str],
+) -> Callable[[str | None], str | None]:
+    """Validate a comma-separated list of values, e.g. `lastPrice,marketCap`."""
+
+    def _validator(x: str | None) -> str | None:
+        if not x:
+            return None
+        for value in x.split(","):
+            if value not in valid_values:
+                raise typer.BadParameter(
+                    f"Invalid value: {value}, should be one of {', '.join(valid_values)}"
+                )
+        return x
+
+    return _validator
+
+
 def validate_date_string(value: str) -> str:
     """Validate date string format (YYYY-MM-DD)"""
     try:
@@ -1,33 +1,170 @@
+from __future__ import annotations
+
 import json
-from typing import Protocol
+import typer
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Protocol, Union
 from rich.table import Table
-from .utils import console_print
+from .utils import (
+    console_print,
+    data_frame_to_json,
+    data_frame_to_list,
+    get_console,
+    lazy_import,
+    resolve_path,
+)
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+pd = lazy_import("pandas")
+
+# Commands return a dict, a list of records or a DataFrame, or stream any
+# sequence of records and DataFrame chunks from an iterator.
+OutputData = Union[dict, list, "DataFrame", Iterator]
+
+NDJSON_CHUNK_SIZE = 10_000
 
 
 class OutputWriter(Protocol):
-    def write(self, data: dict | list) -> None: ...
+    def write(self, data: OutputData) -> None: ...
 
 
 class WriterFactory:
     @staticmethod
-    def get_writer(writer_type: str) -> OutputWriter:
+    def get_writer(writer_type: str, out_file: str | None = None) -> OutputWriter:
         if writer_type == "json":
             return JsonWriter()
         if writer_type == "table":
             return TableWriter()
+        if writer_type == "ndjson":
+            return NdjsonWriter()
+        if writer_type == "parquet":
+            return ParquetWriter(out_file)
+        if writer_type == "arrow":
+            return ArrowWriter(out_file)
+        if writer_type == "feather":
+            return FeatherWriter(out_file)
         raise ValueError(f"Unsupported writer type: {writer_type}")
 
 
+def materialize(data: OutputData) -> dict | list | DataFrame:
+    """Collect a streamed result into a single DataFrame, or a list of records."""
+    if not isinstance(data, Iterator):
+        return data
+
+    chunks = list(data)
+    if len(chunks) > 0 and all(isinstance(c, pd.DataFrame) for c in chunks):
+        return pd.concat(chunks, ignore_index=True)
+
+    records = []
+    for chunk in chunks:
+        if isinstance(chunk, pd.DataFrame):
+            records.extend(data_frame_to_list(chunk))
+        else:
+            records.append(chunk)
+    return records
+
+
+def project(data: OutputData, fields: list[str] | None) -> OutputData:
+    """
+    Keep only `fields` (in that order) of every record, before anything is serialized.
+
+    DataFrames are projected by column, records by key; fields a record does not have are
+    skipped. Streams are projected lazily, chunk by chunk.
+    """
+    if not fields:
+        return data
+    if isinstance(data, Iterator):
+        return (project(chunk, fields) for chunk in data)
+    if isinstance(data, pd.DataFrame):
+        columns = {str(c): c for c in data.columns}
+        return data[[columns[f] for f in fields if f in columns]]
+    if isinstance(data, dict):
+        return {f: data[f] for f in fields if f in data}
+    if isinstance(data, list):
+        return [
+            project(item, fields) if isinstance(item, dict) else item for item in data
+        ]
+    return data
+
+
 class JsonWriter(OutputWriter):
-    def write(self, data: dict | list) -> None:
-        console_print(json.dumps(data, indent=2, default=str))
+    def write(self, data: OutputData) -> None:
+        data = materialize(data)
+        if isinstance(data, pd.DataFrame):
+            # Serialize the frame in one pass instead of converting it to records first
+            content = data_frame_to_json(data, indent=2)
+        else:
+            content = json.dumps(data, indent=2, default=str)
+
+        console = get_console()
+        if console.is_terminal:
+            console.print(content)
+        else:
+            # Rich markup, highlighting and wrapping are costly on large outputs and
+            # would corrupt long strings, so plain JSON goes straight to the stream.
+            console.file.write(content + "\n")
+
+
+def iter_ndjson(data: OutputData) -> Iterator[str]:
+    """
+    Serialize a result as newline-delimited JSON, yielding one text chunk per record or block of rows.
+
+    Streamed results are consumed lazily and large DataFrames are serialized in bounded chunks of rows.
+    """
+    if isinstance(data, (dict, pd.DataFrame)):
+        data = [data]
+
+    for chunk in data:
+        if isinstance(chunk, pd.DataFrame):
+            for start in range(0, len(chunk), NDJSON_CHUNK_SIZE):
+                rows = chunk.iloc[start : start + NDJSON_CHUNK_SIZE]
+                yield data_frame_to_json(rows, lines=True)
+        else:
+            yield json.dumps(chunk, separators=(",", ":"), default=str) + "\n"
+
+
+def iter_json(data: OutputData) -> Iterator[str]:
+    """Serialize a result as compact JSON, yielding arrays of records in bounded chunks."""
+    if isinstance(data, dict):
+        yield json.dumps(data, separators=(",", ":"), default=str)
+        return
+
+    yield "["
+    first = True
+    for text in iter_ndjson(data):
+        records = text.rstrip("\n").replace("\n", ",")
+        if records:
+            yield records if first else "," + records
+            first = False
+    yield "]"
+
+
+class NdjsonWriter(OutputWriter):
+    """
+    Write one compact JSON record per line, bypassing Rich.
+
+    Records are flushed as soon as they are produced, so streamed results reach the consumer
+    incrementally and large DataFrames are serialized in bounded chunks of rows.
+    """
+
+    def write(self, data: OutputData) -> None:
+        stream = get_console().file
+        for text in iter_ndjson(data):
+            stream.write(text)
+            stream.flush()
 
 
 class TableWriter(OutputWriter):
-    def write(self, data: dict | list) -> None:
+    def write(self, data: OutputData) -> None:
         table = Table(header_style="bold cyan")
 
-        if isinstance(data, dict):
+        data = materialize(data)
+        if isinstance(data, pd.DataFrame):
+            data = data_frame_to_list(data)
+        elif isinstance(data, dict):
             data = [data]
 
         if len(data) == 0:
@@ -41,3 +178,82 @@ class TableWriter(OutputWriter):
             table.add_row(*[str(value) for value in record.values()])
 
         console_print(table)
+
+
+def import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise typer.BadParameter(
+            "Columnar output requires pyarrow, install it with `pip install 'yfin-cli[arrow]'`."
+        )
+    return pyarrow
+
+
+def to_data_frame(data: OutputData) -> DataFrame:
+    """Convert any command result to a DataFrame, keeping DataFrame results untouched."""
+    data = materialize(data)
+    if isinstance(data, pd.DataFrame):
+        return data
+    if isinstance(data, dict):
+        data = [data]
+    return pd.DataFrame.from_records(data)
+
+
+class ColumnarWriter(OutputWriter, ABC):
+    """
+    Base class for binary columnar writers.
+
+    The DataFrame returned by a command is converted to an Arrow table as is, preserving
+    datetime and numeric dtypes, and written to `out_file` or to a redirected stdout.
+    """
+
+    def __init__(self, out_file: str | None = None):
+        self.pa = import_pyarrow()
+        if out_file is None and get_console().is_terminal:
+            raise typer.BadParameter(
+                "Refusing to write binary output to a terminal, use --out-file or redirect stdout."
+            )
+        self.out_file = resolve_path(out_file) if out_file is not None else None
+
+    def write(self, data: OutputData) -> None:
+        data_frame = to_data_frame(data).rename(columns=str)
+        table = self.pa.Table.from_pandas(data_frame, preserve_index=False)
+
+        if self.out_file is not None:
+            self.write_table(table, self.out_file)
+            return
+
+        sink = self.pa.BufferOutputStream()
+        self.write_table(table, sink)
+        stream = get_console().file.buffer
+        stream.write(sink.getvalue().to_pybytes())
+        stream.flush()
+
+    @abstractmethod
+    def write_table(self, table, sink) -> None:
+        """Write the Arrow table to a path or an Arrow output stream in the writer's format."""
+
+
+class ParquetWriter(ColumnarWriter):
+    def write_table(self, table, sink) -> None:
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(table, sink)
+
+
+class ArrowWriter(ColumnarWriter):
+    """Write an Arrow IPC stream."""
+
+    def write_table(self, table, sink) -> None:
+        with self.pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+class FeatherWriter(ColumnarWriter):
+    """Write a Feather (Arrow IPC file) file."""
+
+    def write_table(self, table, sink) -> None:
+        import pyarrow.feather
+
+        pyarrow.feather.write_feather(table, sink)
@@ -3,9 +3,25 @@
 import json
 import pytest
 from typer.testing import CliRunner
+from src import domains
 from src.cli import app
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Isolate the on-disk response cache per test."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("YFIN_CACHE_DIR", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def domain_registries():
+    """Start every test without Sector and Industry objects memoized by earlier tests."""
+    domains.sectors.clear()
+    domains.industries.clear()
+
+
 @pytest.fixture
 def runner():
     return CliRunner()
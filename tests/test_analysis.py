@@ -1,8 +1,11 @@
 """Tests for analysis commands (recommendations, estimates, holders, etc.)."""
 
+import json
+import threading
 import pandas as pd
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+from src.typer import ANALYSIS_SECTIONS
 
 
 # ── Mock data factories ───────────────────────────────────────────────
@@ -262,3 +265,132 @@ def test_major_holders_basic(mock_ticker, invoke_json):
 
     assert code == 0
     assert isinstance(data, list)
+
+
+# ── analysis-bundle ──────────────────────────────────────────────────
+
+
+MOCK_SECTIONS = {
+    "get_recommendations": MOCK_RECOMMENDATIONS,
+    "get_upgrades_downgrades": MOCK_UPGRADES_DOWNGRADES,
+    "get_analyst_price_targets": MOCK_PRICE_TARGETS,
+    "get_earnings_estimate": MOCK_ESTIMATES,
+    "get_revenue_estimate": MOCK_ESTIMATES,
+    "get_earnings_history": MOCK_EARNINGS_HISTORY,
+    "get_eps_trend": MOCK_ESTIMATES,
+    "get_eps_revisions": MOCK_ESTIMATES,
+    "get_growth_estimates": MOCK_ESTIMATES,
+    "get_insider_purchases": MOCK_INSIDER_PURCHASES,
+    "get_insider_transactions": MOCK_HOLDERS_DF,
+    "get_insider_roster_holders": MOCK_HOLDERS_DF,
+    "get_major_holders": MOCK_MAJOR_HOLDERS,
+    "get_institutional_holders": MOCK_HOLDERS_DF,
+    "get_mutualfund_holders": MOCK_HOLDERS_DF,
+}
+
+
+def create_mock_stock(ticker, calls=None):
+    stock = MagicMock()
+    for method, data in MOCK_SECTIONS.items():
+
+        def get(method=method, data=data):
+            if calls is not None:
+                calls.append((ticker, method, threading.get_ident()))
+            return data
+
+        setattr(stock, method, get)
+    return stock
+
+
+@patch("src.commands.analysis.yf.Ticker", side_effect=create_mock_stock)
+def test_analysis_bundle_single_ticker(mock_ticker, invoke_json):
+    code, data = invoke_json("analysis-bundle", "AAPL")
+
+    assert code == 0
+    mock_ticker.assert_called_once_with("AAPL")
+    assert list(data) == ["ticker", *ANALYSIS_SECTIONS]
+    assert data["ticker"] == "AAPL"
+    assert data["price-targets"]["mean"] == 195.0
+    assert len(data["eps-trend"]) == 2
+    assert data["major-holders"][0]["Breakdown"] == 0
+
+
+@patch("src.commands.analysis.yf.Ticker")
+def test_analysis_bundle_many_tickers(mock_ticker, invoke_json):
+    calls = []
+    mock_ticker.side_effect = lambda ticker: create_mock_stock(ticker, calls)
+    code, data = invoke_json(
+        "analysis-bundle",
+        "AAPL",
+        "MSFT",
+        "NVDA",
+        "--sections",
+        "major-holders,eps-trend,institutional-holders",
+    )
+
+    assert code == 0
+    assert [d["ticker"] for d in data] == ["AAPL", "MSFT", "NVDA"]
+    assert list(data[0]) == [
+        "ticker",
+        "eps-trend",
+        "major-holders",
+        "institutional-holders",
+    ]
+    assert mock_ticker.call_count == 3
+    # Sections served by one request are fetched in order on the same thread
+    for ticker in ("AAPL", "MSFT", "NVDA"):
+        holders = [c for c in calls if c[0] == ticker and "holders" in c[1]]
+        assert [c[1] for c in holders] == [
+            "get_major_holders",
+            "get_institutional_holders",
+        ]
+        assert holders[0][2] == holders[1][2]
+
+
+@patch("src.commands.analysis.yf.Ticker", side_effect=create_mock_stock)
+def test_analysis_bundle_ndjson(mock_ticker, invoke):
+    result = invoke(
+        "--output",
+        "ndjson",
+        "analysis-bundle",
+        "AAPL",
+        "MSFT",
+        "--sections",
+        "eps-trend",
+    )
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert [line["ticker"] for line in lines] == ["AAPL", "MSFT"]
+
+
+@patch("src.commands.analysis.yf.Ticker")
+def test_analysis_bundle_section_error(mock_ticker, invoke_json):
+    def create_stock(ticker):
+        stock = create_mock_stock(ticker)
+        stock.get_upgrades_downgrades = MagicMock(
+            side_effect=Exception("No data found")
+        )
+        return stock
+
+    mock_ticker.side_effect = create_stock
+    code, data = invoke_json(
+        "analysis-bundle",
+        "AAPL",
+        "MSFT",
+        "--sections",
+        "eps-trend,upgrades-downgrades",
+    )
+
+    assert code == 0
+    assert [d["ticker"] for d in data] == ["AAPL", "MSFT"]
+    for document in data:
+        assert document["upgrades-downgrades"] == {"error": "No data found"}
+        assert len(document["eps-trend"]) == 2
+
+
+def test_analysis_bundle_invalid_section(invoke):
+    result = invoke("analysis-bundle", "AAPL", "--sections", "eps-trend,news")
+
+    assert result.exit_code == 2
+    assert "Invalid value: news" in result.output
@@ -0,0 +1,160 @@
+"""Tests for the batch command."""
+
+import json
+from unittest.mock import patch
+
+import pandas as pd
+
+from src.cli import app
+
+
+def create_mock_history_data():
+    index = pd.DatetimeIndex(["2026-02-05", "2026-02-06"], name="Date")
+    return pd.DataFrame({"Close": [104.0, 107.0]}, index=index)
+
+
+def write_jobs(tmp_path, *lines):
+    path = tmp_path / "jobs.txt"
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+@patch("src.commands.market.yf.Market")
+@patch("src.commands.stock.yf.Ticker")
+def test_batch_command_lines(mock_ticker, mock_market, invoke_json, tmp_path):
+    mock_ticker.return_value.history.return_value = create_mock_history_data()
+    mock_market.return_value.status = {"market_state": "REGULAR"}
+    jobs = write_jobs(
+        tmp_path, "# nightly jobs", "history AAPL --period 5d", "", "market-status"
+    )
+    code, data = invoke_json("batch", jobs)
+
+    assert code == 0
+    results = {r["id"]: r for r in data}
+    assert results["2"]["command"] == "history"
+    assert [row["Close"] for row in results["2"]["data"]] == [104.0, 107.0]
+    assert results["4"] == {
+        "id": "4",
+        "command": "market-status",
+        "data": {"market_state": "REGULAR"},
+    }
+    mock_ticker.return_value.history.assert_called_once_with(interval="1d", period="5d")
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_batch_json_jobs(mock_ticker, invoke_json, tmp_path):
+    mock_ticker.return_value.get_news.return_value = []
+    jobs = write_jobs(
+        tmp_path,
+        '{"id": "tsla", "command": "news", "args": ["TSLA", "--count", "3"]}',
+        '{"id": "aapl", "command": "news", "args": {"ticker": "aapl", "count": 5}}',
+    )
+    code, data = invoke_json("batch", jobs)
+
+    assert code == 0
+    assert sorted(r["id"] for r in data) == ["aapl", "tsla"]
+    assert sorted(c.args for c in mock_ticker.call_args_list) == [("AAPL",), ("TSLA",)]
+
+
+@patch("src.commands.market.yf.Market")
+def test_batch_deduplicates_jobs(mock_market, invoke_json, tmp_path):
+    mock_market.return_value.status = {"market_state": "REGULAR"}
+    jobs = write_jobs(
+        tmp_path,
+        "market-status",
+        '{"id": "again", "command": "market_status"}',
+    )
+    code, data = invoke_json("--no-cache", "batch", jobs)
+
+    assert code == 0
+    assert sorted(r["id"] for r in data) == ["1", "again"]
+    assert mock_market.call_count == 1
+
+
+@patch("src.commands.market.yf.Market")
+@patch("src.commands.stock.yf.Ticker")
+def test_batch_job_errors(mock_ticker, mock_market, invoke_json, tmp_path):
+    mock_ticker.return_value.get_news.side_effect = Exception("API Error")
+    mock_market.return_value.status = None
+    jobs = write_jobs(tmp_path, "news TSLA", "market-status")
+    code, data = invoke_json("batch", jobs)
+
+    assert code == 0
+    results = {r["id"]: r for r in data}
+    assert results["1"]["error"] == "Unexpected error: API Error"
+    assert results["2"]["error"] == "No data found"
+
+
+@patch("src.commands.market.yf.Market")
+@patch("src.commands.screen.yf.screen")
+def test_batch_stream_error(mock_screen, mock_market, invoke_json, tmp_path):
+    """A streamed job failing partway through only fails that job."""
+
+    def screen(query, offset, **kwargs):
+        if offset > 0:
+            raise ConnectionError("API Error")
+        return {"total": 500, "quotes": [{"symbol": "AAPL"}]}
+
+    mock_screen.side_effect = screen
+    mock_market.return_value.status = {"market_state": "REGULAR"}
+    jobs = write_jobs(
+        tmp_path, "screen --predefined day_gainers --all", "market-status"
+    )
+    code, data = invoke_json("batch", jobs)
+
+    assert code == 0
+    results = {r["id"]: r for r in data}
+    assert results["1"]["error"] == "Unexpected error: API Error"
+    assert results["2"]["data"] == {"market_state": "REGULAR"}
+
+
+@patch("src.commands.screen.yf.screen")
+def test_batch_omitted_multiple_option(mock_screen, invoke_json, tmp_path):
+    """Omitted multi-value options are passed as None, like on the command line."""
+    mock_screen.return_value = {"quotes": [{"symbol": "AAPL"}]}
+    code, data = invoke_json(
+        "batch", write_jobs(tmp_path, "screen --predefined day_gainers")
+    )
+
+    assert code == 0
+    assert data[0]["data"] == [{"symbol": "AAPL"}]
+
+
+def test_batch_validates_jobs_up_front(invoke, tmp_path):
+    jobs = write_jobs(tmp_path, "market-status", "history AAPL --interval invalid")
+    result = invoke("batch", jobs)
+
+    assert result.exit_code == 2
+    assert "Line 2" in result.output
+
+
+def test_batch_unknown_command(invoke, tmp_path):
+    result = invoke("batch", write_jobs(tmp_path, "no-such-command"))
+
+    assert result.exit_code == 2
+    assert "Unknown command" in result.output
+
+
+@patch("src.commands.market.yf.Market")
+def test_batch_stdin_ndjson(mock_market, runner):
+    mock_market.return_value.status = {"market_state": "CLOSED"}
+    result = runner.invoke(
+        app, ["--output", "ndjson", "batch", "-"], input="market-status\n"
+    )
+
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.output.splitlines()] == [
+        {"id": "1", "command": "market-status", "data": {"market_state": "CLOSED"}}
+    ]
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_batch_fields(mock_ticker, invoke_json, tmp_path):
+    mock_ticker.return_value.history.return_value = create_mock_history_data()
+    jobs = write_jobs(tmp_path, "history AAPL --period 5d")
+    code, data = invoke_json("--fields", "Close", "batch", jobs)
+
+    assert code == 0
+    assert data == [
+        {"id": "1", "command": "history", "data": [{"Close": 104.0}, {"Close": 107.0}]}
+    ]
@@ -0,0 +1,169 @@
+"""Tests for the on-disk response cache."""
+
+import pickle
+import threading
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.cache import DEFAULT_TTL, ResponseCache, get_ttl, make_key, write_pickle
+from src.cli import app
+
+
+def create_mock_income_stmt():
+    index = ["Total Revenue", "Net Income"]
+    columns = pd.DatetimeIndex(["2025-09-30", "2024-09-30"])
+    return pd.DataFrame([[100.0, 90.0], [25.0, 20.0]], index=index, columns=columns)
+
+
+# ── ResponseCache ─────────────────────────────────────────────────────
+
+
+def test_cache_set_get(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    cache.set("key", [{"a": 1}], ttl=60)
+
+    assert cache.get("key") == [{"a": 1}]
+
+
+def test_cache_miss(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+
+    assert cache.get("missing") is None
+
+
+def test_cache_expired(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    with patch("src.cache.time.time", return_value=1000.0):
+        cache.set("key", {"a": 1}, ttl=60)
+    with patch("src.cache.time.time", return_value=1061.0):
+        assert cache.get("key") is None
+
+
+def test_cache_unreadable_entry_is_dropped(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    cache.set("key", {"a": 1}, ttl=60)
+    # A pickle referring to a class that no longer exists raises AttributeError on load
+    with cache._connect() as conn:
+        conn.execute(
+            "UPDATE entries SET value = ?",
+            (
+                b"\x80\x04\x95\x0f\x00\x00\x00\x00\x00\x00\x00\x8c\x03src\x94\x8c\x04Gone\x94\x93\x94.",
+            ),
+        )
+
+    assert cache.get("key") is None
+    with cache._connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0
+
+
+def test_cache_lru_eviction(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3", max_size=250)
+    value = "x" * 100
+
+    with patch("src.cache.time.time", return_value=1000.0):
+        cache.set("a", value, ttl=60)
+    with patch("src.cache.time.time", return_value=1001.0):
+        cache.set("b", value, ttl=60)
+    with patch("src.cache.time.time", return_value=1002.0):
+        cache.get("a")  # "a" is now more recently used than "b"
+    with patch("src.cache.time.time", return_value=1003.0):
+        cache.set("c", value, ttl=60)
+        assert cache.get("a") == value
+        assert cache.get("b") is None
+        assert cache.get("c") == value
+
+
+def test_make_key_order_independent():
+    key1 = make_key("history", {"ticker": "AAPL", "period": "1y"})
+    key2 = make_key("history", {"period": "1y", "ticker": "AAPL"})
+
+    assert key1 == key2
+    assert key1 != make_key("dividends", {"ticker": "AAPL", "period": "1y"})
+
+
+def test_write_pickle(tmp_path):
+    path = tmp_path / "dir" / "entry.pkl"
+    write_pickle(path, {"a": 1})
+    with pytest.raises(TypeError):
+        write_pickle(path, {"a": threading.Lock()})
+
+    assert pickle.loads(path.read_bytes()) == {"a": 1}
+    assert [p.name for p in path.parent.iterdir()] == ["entry.pkl"]
+
+
+def test_get_ttl():
+    assert get_ttl("fast_info") < get_ttl("sec_filings")
+    assert get_ttl("screen_query_fields") == 0
+    assert get_ttl("unknown_command") == DEFAULT_TTL
+
+
+# ── CLI integration ───────────────────────────────────────────────────
+
+
+@patch("src.commands.financials.yf.Ticker")
+def test_cli_cache_hit(mock_ticker, invoke_json):
+    mock_ticker.return_value.get_income_stmt.return_value = create_mock_income_stmt()
+    _, first = invoke_json("income-stmt", "AAPL")
+    _, second = invoke_json("income-stmt", "AAPL")
+
+    assert first == second
+    assert mock_ticker.return_value.get_income_stmt.call_count == 1
+
+
+@patch("src.commands.financials.yf.Ticker")
+def test_cli_cache_keyed_by_arguments(mock_ticker, invoke_json):
+    mock_ticker.return_value.get_income_stmt.return_value = create_mock_income_stmt()
+    invoke_json("income-stmt", "AAPL")
+    invoke_json("income-stmt", "AAPL", "--frequency", "quarterly")
+    invoke_json("income-stmt", "MSFT")
+
+    assert mock_ticker.return_value.get_income_stmt.call_count == 3
+
+
+@patch("src.commands.financials.yf.Ticker")
+def test_cli_no_cache(mock_ticker, invoke_json):
+    mock_ticker.return_value.get_income_stmt.return_value = create_mock_income_stmt()
+    invoke_json("--no-cache", "income-stmt", "AAPL")
+    invoke_json("--no-cache", "income-stmt", "AAPL")
+
+    assert mock_ticker.return_value.get_income_stmt.call_count == 2
+
+
+@patch("src.commands.financials.yf.Ticker")
+def test_cli_refresh(mock_ticker, invoke_json):
+    mock_ticker.return_value.get_income_stmt.return_value = create_mock_income_stmt()
+    invoke_json("income-stmt", "AAPL")
+    invoke_json("--refresh", "income-stmt", "AAPL")
+    invoke_json("income-stmt", "AAPL")
+
+    assert mock_ticker.return_value.get_income_stmt.call_count == 2
+
+
+@patch("src.commands.financials.yf.Ticker")
+def test_cli_none_not_cached(mock_ticker, invoke):
+    mock_ticker.return_value.get_income_stmt.return_value = None
+    invoke("income-stmt", "AAPL")
+    invoke("income-stmt", "AAPL")
+
+    assert mock_ticker.return_value.get_income_stmt.call_count == 2
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_cli_cache_keyed_by_tickers_read(mock_ticker, invoke_json, runner, tmp_path):
+    mock_ticker.return_value.get_fast_info.return_value = {"lastPrice": 1.0}
+    tickers_file = tmp_path / "tickers.txt"
+    tickers_file.write_text("AAPL\n")
+    invoke_json("fast-info", "--tickers-file", str(tickers_file))
+    tickers_file.write_text("MSFT\n")
+    invoke_json("fast-info", "--tickers-file", str(tickers_file))
+    runner.invoke(app, ["fast-info", "--tickers-file", "-"], input="TSLA\n")
+
+    assert [c.args[0] for c in mock_ticker.call_args_list] == ["AAPL", "MSFT", "TSLA"]
+
+
+def test_make_key_ignores_tuning_arguments():
+    assert make_key("history", {"tickers": ["AAPL"], "workers": 4}) == make_key(
+        "history", {"tickers": ["AAPL"], "workers": 16}
+    )
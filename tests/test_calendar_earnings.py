@@ -82,3 +82,40 @@ def test_calendar_earnings_api_error(mock_calendars, invoke):
 
     assert result.exit_code == 1
     assert "Unexpected error" in result.output
+
+
+@patch("src.commands.calendar.MAX_PAGE_SIZE", 2)
+@patch("src.commands.calendar.yf.Calendars")
+def test_calendar_earnings_all(mock_calendars, invoke_json):
+    """Every shard is paged until a short page, and rows on a shared boundary date are de-duplicated."""
+
+    def get_earnings_calendar(start, end, limit, offset, **kwargs):
+        data_frame = create_mock_earnings_data()
+        if start == "2026-02-01":
+            # Two full pages, then an empty one
+            return data_frame if offset < 4 else data_frame.iloc[:0]
+        # The second shard repeats one row of the first one
+        return data_frame.iloc[:1]
+
+    mock_calendars.return_value.get_earnings_calendar.side_effect = (
+        get_earnings_calendar
+    )
+    code, data = invoke_json(
+        "calendar-earnings", "--start", "2026-02-01", "--end", "2026-02-10", "--all"
+    )
+
+    assert code == 0
+    assert [row["index"] for row in data] == ["TEST", "ANOTHER"]
+    calls = [
+        (c.kwargs["start"], c.kwargs["end"], c.kwargs["offset"])
+        for c in mock_calendars.return_value.get_earnings_calendar.call_args_list
+    ]
+    assert sorted(calls) == [
+        ("2026-02-01", "2026-02-08", 0),
+        ("2026-02-01", "2026-02-08", 2),
+        ("2026-02-01", "2026-02-08", 4),
+        ("2026-02-08", "2026-02-10", 0),
+    ]
+    call_kwargs = mock_calendars.return_value.get_earnings_calendar.call_args[1]
+    assert call_kwargs["filter_most_active"] is False
+    assert call_kwargs["limit"] == 2
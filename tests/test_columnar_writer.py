@@ -0,0 +1,97 @@
+"""Tests for the Parquet, Arrow IPC and Feather writers."""
+
+import io
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.cli import app
+from src.writer import (
+    ArrowWriter,
+    ColumnarWriter,
+    FeatherWriter,
+    ParquetWriter,
+    WriterFactory,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+
+def create_mock_history_data():
+    index = pd.DatetimeIndex(["2026-02-05", "2026-02-06"], name="Date").tz_localize(
+        "America/New_York"
+    )
+    return pd.DataFrame(
+        {"Close": [104.0, 107.0], "Volume": [1000000, 1200000]}, index=index
+    )
+
+
+def read_arrow_stream(data: bytes) -> pd.DataFrame:
+    return pa.ipc.open_stream(io.BytesIO(data)).read_all().to_pandas()
+
+
+@pytest.mark.parametrize(
+    "output, writer_class",
+    [("parquet", ParquetWriter), ("arrow", ArrowWriter), ("feather", FeatherWriter)],
+)
+def test_factory_columnar(output, writer_class, tmp_path):
+    writer = WriterFactory.get_writer(output, out_file=str(tmp_path / "out"))
+    assert isinstance(writer, writer_class)
+
+
+def test_columnar_writer_requires_format(tmp_path):
+    with pytest.raises(TypeError):
+        ColumnarWriter(str(tmp_path / "out"))
+
+
+@pytest.mark.parametrize(
+    "output, read",
+    [
+        ("parquet", pd.read_parquet),
+        ("feather", pd.read_feather),
+        ("arrow", lambda path: read_arrow_stream(path.read_bytes())),
+    ],
+)
+@patch("src.commands.stock.yf.Ticker")
+def test_cli_columnar_out_file(mock_ticker, invoke, tmp_path, output, read):
+    mock_ticker.return_value.history.return_value = create_mock_history_data()
+    path = tmp_path / f"history.{output}"
+    result = invoke("--output", output, "--out-file", str(path), "history", "AAPL")
+
+    assert result.exit_code == 0
+    data_frame = read(path)
+    assert list(data_frame.columns) == ["Date", "Close", "Volume"]
+    assert str(data_frame["Date"].dt.tz) == "America/New_York"
+    assert data_frame["Volume"].dtype == "int64"
+    assert data_frame["Close"].tolist() == [104.0, 107.0]
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_cli_arrow_stdout(mock_ticker, runner):
+    mock_ticker.return_value.history.return_value = create_mock_history_data()
+    result = runner.invoke(app, ["--output", "arrow", "history", "AAPL"])
+
+    assert result.exit_code == 0
+    data_frame = read_arrow_stream(result.stdout_bytes)
+    assert data_frame["Close"].tolist() == [104.0, 107.0]
+
+
+@patch("src.commands.market.yf.Market")
+def test_cli_columnar_records(mock_market, invoke, tmp_path):
+    """Commands returning records are written as a single-row table."""
+    mock_market.return_value.status = {"market_state": "REGULAR", "open": True}
+    path = tmp_path / "status.parquet"
+    result = invoke("--output", "parquet", "--out-file", str(path), "market-status")
+
+    assert result.exit_code == 0
+    assert pd.read_parquet(path).to_dict(orient="records") == [
+        {"market_state": "REGULAR", "open": True}
+    ]
+
+
+def test_cli_out_file_requires_columnar_output(invoke, tmp_path):
+    result = invoke("--out-file", str(tmp_path / "out.json"), "market-status")
+
+    assert result.exit_code == 2
+    assert "--out-file is only supported" in result.output
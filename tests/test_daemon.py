@@ -0,0 +1,176 @@
+"""Tests for the daemon server and the --via-daemon client."""
+
+import io
+import json
+import socket
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src import session
+from src.daemon import EXIT, STDOUT, DaemonServer, forward, read_frame, strip_option
+
+
+@pytest.fixture
+def daemon_server(tmp_path, capsysbinary):
+    """Run a daemon on a temporary socket in a background thread, capturing its output."""
+    server = DaemonServer(str(tmp_path / "daemon.sock"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def daemon(daemon_server):
+    return daemon_server.server_address
+
+
+@patch("src.commands.market.yf.Market")
+def test_daemon_forwards_command(mock_market, daemon, capsysbinary):
+    mock_market.return_value.status = {"market_state": "REGULAR"}
+    code = forward(daemon, ["market-status"])
+    output = capsysbinary.readouterr().out
+
+    assert code == 0
+    assert json.loads(output) == {"market_state": "REGULAR"}
+
+
+@patch("src.commands.market.yf.Market")
+def test_daemon_forwards_global_options(mock_market, daemon, capsysbinary):
+    mock_market.return_value.status = {"market_state": "REGULAR"}
+    code = forward(daemon, ["--output", "ndjson", "market-status"])
+    output = capsysbinary.readouterr().out
+
+    assert code == 0
+    assert output == b'{"market_state":"REGULAR"}\n'
+
+
+@patch("src.commands.market.yf.Market")
+def test_daemon_exit_code(mock_market, daemon, capsysbinary):
+    mock_market.return_value.status = None
+    code = forward(daemon, ["market-status"])
+
+    assert code == 1
+    assert b"No data found" in capsysbinary.readouterr().out
+
+
+def test_daemon_usage_error(daemon, capsysbinary):
+    code = forward(daemon, ["history", "AAPL", "--interval", "invalid"])
+
+    assert code == 2
+    assert b"Invalid" in capsysbinary.readouterr().err
+
+
+@patch("src.commands.market.yf.Market")
+def test_daemon_keeps_session_settings(mock_market, daemon, capsysbinary, monkeypatch):
+    mock_market.return_value.status = {"market_state": "REGULAR"}
+    monkeypatch.setattr(session, "settings", dict(session.settings))
+    before = dict(session.settings)
+    code = forward(daemon, ["--pool-size", "1", "--timeout", "3", "market-status"])
+    captured = capsysbinary.readouterr()
+
+    assert code == 0
+    assert session.settings == before
+    assert b"set when the daemon starts" in captured.err
+    assert json.loads(captured.out) == {"market_state": "REGULAR"}
+
+
+def test_daemon_rejects_nested_server(daemon, capsysbinary):
+    code = forward(daemon, ["serve", "--socket", "other.sock"])
+
+    assert code == 2
+
+
+@patch("src.cli.forward", return_value=0)
+def test_cli_via_daemon(mock_forward, invoke):
+    argv = ["yfin", "--via-daemon", "/tmp/yfin.sock", "fast-info", "TSLA"]
+    with patch("sys.argv", argv):
+        result = invoke("--via-daemon", "/tmp/yfin.sock", "fast-info", "TSLA")
+
+    assert result.exit_code == 0
+    mock_forward.assert_called_once_with("/tmp/yfin.sock", ["fast-info", "TSLA"])
+
+
+@patch("src.cli.forward", side_effect=FileNotFoundError("No such file"))
+def test_cli_via_daemon_unreachable(mock_forward, invoke):
+    result = invoke("--via-daemon", "/tmp/missing.sock", "fast-info", "TSLA")
+
+    assert result.exit_code == 1
+    assert "Cannot reach daemon" in result.output
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["--via-daemon", "s.sock", "history", "AAPL"], ["history", "AAPL"]),
+        (["--via-daemon=s.sock", "history", "AAPL"], ["history", "AAPL"]),
+        (
+            ["--output", "table", "--via-daemon", "s.sock", "news", "X"],
+            ["--output", "table", "news", "X"],
+        ),
+    ],
+    ids=["separate_value", "inline_value", "between_options"],
+)
+def test_strip_option(argv, expected):
+    assert strip_option(argv, "--via-daemon") == expected
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_daemon_forwards_stdin(mock_ticker, daemon, capsysbinary):
+    mock_ticker.return_value.get_fast_info.return_value = {"lastPrice": 1.0}
+    code = forward(daemon, ["fast-info", "--tickers-file", "-"], io.BytesIO(b"tsla\n"))
+
+    assert code == 0
+    mock_ticker.assert_called_once_with("TSLA")
+
+
+def send_request(socket_path: str, request: dict) -> tuple[int, bytes]:
+    """Send a raw request to the daemon and return its exit code and stdout."""
+    stdout = b""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        reader = sock.makefile("rb")
+        kind, payload = read_frame(reader)
+        while kind != EXIT:
+            stdout += payload if kind == STDOUT else b""
+            kind, payload = read_frame(reader)
+    return int(payload), stdout
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_daemon_resolves_paths_in_client_directory(mock_ticker, daemon, tmp_path):
+    mock_ticker.return_value.get_fast_info.return_value = {"lastPrice": 1.0}
+    (tmp_path / "tickers.txt").write_text("MSFT\n")
+    code, _ = send_request(
+        daemon,
+        {"argv": ["fast-info", "--tickers-file", "tickers.txt"], "cwd": str(tmp_path)},
+    )
+
+    assert code == 0
+    mock_ticker.assert_called_once_with("MSFT")
+
+
+@patch("src.commands.market.yf.Market")
+def test_daemon_formats_for_client_terminal(mock_market, daemon_server, monkeypatch):
+    # pytest's capturing replaced the daemon's streams when the test started
+    monkeypatch.setattr("sys.stdout", daemon_server.stdout)
+    monkeypatch.setattr("sys.stderr", daemon_server.stderr)
+    daemon = daemon_server.server_address
+    mock_market.return_value.status = {"market_state": "REGULAR"}
+    argv = ["--output", "parquet", "market-status"]
+    code, stdout = send_request(daemon, {"argv": argv, "stdout_isatty": True})
+
+    # Binary output is refused on the client's terminal, like without the daemon
+    assert code == 2
+    assert b"PAR1" not in stdout
+
+    code, stdout = send_request(
+        daemon, {"argv": ["market-status"], "stdout_isatty": True, "color_system": None}
+    )
+    assert code == 0
+    assert json.loads(stdout) == {"market_state": "REGULAR"}
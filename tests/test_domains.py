@@ -0,0 +1,76 @@
+"""Tests for the in-process registry of Sector and Industry objects."""
+
+import threading
+import time
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from src.domains import DomainRegistry, load_domain
+
+
+def test_registry_memoizes_per_key():
+    loads = []
+    registry = DomainRegistry(lambda key: loads.append(key) or object())
+
+    first = registry.get("technology")
+    assert registry.get("technology") is first
+    assert registry.get("energy") is not first
+    assert loads == ["technology", "energy"]
+
+
+def test_registry_expires_entries():
+    loads = []
+    registry = DomainRegistry(lambda key: loads.append(key) or object(), ttl=60)
+
+    first = registry.get("technology")
+    with patch("src.domains.time.monotonic", return_value=time.monotonic() + 61):
+        assert registry.get("technology") is not first
+    assert len(loads) == 2
+
+
+def test_registry_loads_each_key_once_under_concurrency():
+    loads = []
+
+    def load(key):
+        loads.append(key)
+        time.sleep(0.05)
+        return object()
+
+    registry = DomainRegistry(load)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get("technology")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == ["technology"]
+    assert len({id(r) for r in results}) == 1
+
+
+def test_registry_retries_failed_loads():
+    calls = []
+
+    def load(key):
+        calls.append(key)
+        if len(calls) == 1:
+            raise ConnectionError("timeout")
+        return key.upper()
+
+    registry = DomainRegistry(load)
+    with pytest.raises(ConnectionError):
+        registry.get("technology")
+    assert registry.get("technology") == "TECHNOLOGY"
+
+
+def test_load_domain_fetches_payload():
+    domain = MagicMock()
+    overview = PropertyMock(return_value={"name": "Technology"})
+    type(domain).overview = overview
+
+    assert load_domain(domain) is domain
+    overview.assert_called_once_with()
@@ -1,6 +1,6 @@
 """Tests for the fast-info command."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 
 MOCK_FAST_INFO = {
@@ -67,3 +67,84 @@ def test_fast_info_help(invoke):
     result = invoke("fast-info", "--help")
     assert result.exit_code == 0
     assert "TICKER" in result.output
+
+
+class RecordingFastInfo(dict):
+    """Dict-like FastInfo that records which keys were read."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.read = []
+
+    def __getitem__(self, key):
+        self.read.append(key)
+        return super().__getitem__(key)
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_fast_info_fields(mock_ticker, invoke_json):
+    fast_info = RecordingFastInfo(MOCK_FAST_INFO)
+    mock_ticker.return_value.get_fast_info.return_value = fast_info
+    code, data = invoke_json("fast-info", "TSLA", "--fields", "lastPrice,marketCap")
+
+    assert code == 0
+    assert data == {"lastPrice": 411.11, "marketCap": 1320000000000}
+    assert fast_info.read == ["lastPrice", "marketCap"]
+
+
+def test_fast_info_invalid_field(invoke):
+    result = invoke("fast-info", "TSLA", "--fields", "lastPrice,price")
+
+    assert result.exit_code == 2
+    assert "Invalid value: price" in result.output
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_fast_info_multiple_tickers(mock_ticker, invoke_json):
+    prices = {"TSLA": 411.11, "AAPL": 250.5}
+
+    def ticker(symbol):
+        stock = MagicMock()
+        if symbol == "MSFT":
+            stock.get_fast_info.return_value = None
+        elif symbol == "GONE":
+            stock.get_fast_info.side_effect = KeyError("currentTradingPeriod")
+        else:
+            stock.get_fast_info.return_value = {"lastPrice": prices[symbol]}
+        return stock
+
+    mock_ticker.side_effect = ticker
+    code, data = invoke_json(
+        "fast-info",
+        "tsla",
+        "msft",
+        "gone",
+        "aapl",
+        "--fields",
+        "lastPrice",
+        "--workers",
+        "2",
+    )
+
+    assert code == 0
+    assert data == [
+        {"Ticker": "TSLA", "lastPrice": 411.11},
+        {"Ticker": "AAPL", "lastPrice": 250.5},
+    ]
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_fast_info_global_fields(mock_ticker, invoke_json):
+    fast_info = RecordingFastInfo(MOCK_FAST_INFO)
+    mock_ticker.return_value.get_fast_info.return_value = fast_info
+    code, data = invoke_json(
+        "--fields", "Ticker,lastPrice", "fast-info", "TSLA", "AAPL"
+    )
+
+    assert code == 0
+    assert data == [
+        {"Ticker": "TSLA", "lastPrice": 411.11},
+        {"Ticker": "AAPL", "lastPrice": 411.11},
+    ]
+    # The global fields are passed down, so other keys are never read
+    assert fast_info.read == ["lastPrice", "lastPrice"]
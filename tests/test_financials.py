@@ -0,0 +1,107 @@
+"""Tests for the financials command."""
+
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+
+def create_mock_statement(items, scale=1.0):
+    dates = [pd.Timestamp("2025-09-30"), pd.Timestamp("2024-09-30")]
+    return pd.DataFrame(
+        {
+            dates[0]: [v * scale for v in items.values()],
+            dates[1]: [v * scale / 2 for v in items.values()],
+        },
+        index=list(items),
+    )
+
+
+def create_mock_ticker(symbol):
+    scale = {"AAPL": 1.0, "MSFT": 10.0}[symbol]
+    stock = MagicMock()
+    stock.get_income_stmt.return_value = create_mock_statement(
+        {"Total Revenue": 1000.0, "Net Income": 200.0}, scale
+    )
+    stock.get_balance_sheet.return_value = create_mock_statement(
+        {"Total Assets": 5000.0}, scale
+    )
+    stock.get_cashflow.return_value = pd.DataFrame()
+    return stock
+
+
+@patch("src.commands.financials.yf.Ticker", side_effect=create_mock_ticker)
+def test_financials_long_format(mock_ticker, invoke_json):
+    code, data = invoke_json("financials", "AAPL", "MSFT")
+
+    assert code == 0
+    assert list(data[0]) == ["Ticker", "Statement", "Date", "Line Item", "Value"]
+    assert data[0] == {
+        "Ticker": "AAPL",
+        "Statement": "income",
+        "Date": "2025-09-30T00:00:00.000",
+        "Line Item": "Total Revenue",
+        "Value": 1000.0,
+    }
+    # 2 tickers x (4 income + 2 balance) rows, the empty cash flow statement adds none
+    assert len(data) == 12
+    assert [(r["Ticker"], r["Statement"]) for r in data[::2]] == [
+        ("AAPL", "income"),
+        ("AAPL", "income"),
+        ("AAPL", "balance"),
+        ("MSFT", "income"),
+        ("MSFT", "income"),
+        ("MSFT", "balance"),
+    ]
+    assert data[-1]["Value"] == 25000.0
+    assert mock_ticker.call_count == 2
+
+
+@patch("src.commands.financials.yf.Ticker")
+def test_financials_statements_and_frequency(mock_ticker, invoke_json):
+    stock = mock_ticker.return_value
+    stock.get_balance_sheet.return_value = create_mock_statement({"Total Assets": 1.0})
+    code, data = invoke_json(
+        "financials", "AAPL", "--statements", "balance", "--frequency", "quarterly"
+    )
+
+    assert code == 0
+    assert {r["Statement"] for r in data} == {"balance"}
+    stock.get_balance_sheet.assert_called_once_with(pretty=True, freq="quarterly")
+    stock.get_income_stmt.assert_not_called()
+    stock.get_cashflow.assert_not_called()
+
+
+@patch("src.commands.financials.yf.Ticker")
+def test_financials_trailing_skips_balance_sheet(mock_ticker, invoke_json):
+    stock = mock_ticker.return_value
+    stock.get_income_stmt.return_value = create_mock_statement({"EPS": 1.5})
+    stock.get_cashflow.return_value = create_mock_statement({"Free Cash Flow": 7.0})
+    code, data = invoke_json("financials", "AAPL", "--frequency", "trailing")
+
+    assert code == 0
+    assert [r["Statement"] for r in data] == [
+        "income",
+        "income",
+        "cashflow",
+        "cashflow",
+    ]
+    stock.get_balance_sheet.assert_not_called()
+    stock.get_income_stmt.assert_called_once_with(pretty=True, freq="trailing")
+
+
+@patch("src.commands.financials.yf.Ticker")
+def test_financials_none_data(mock_ticker, invoke):
+    mock_ticker.return_value.get_income_stmt.return_value = None
+    mock_ticker.return_value.get_balance_sheet.return_value = pd.DataFrame()
+    mock_ticker.return_value.get_cashflow.return_value = None
+    result = invoke("financials", "AAPL")
+
+    assert result.exit_code == 1
+    assert "No data found" in result.output
+
+
+def test_financials_invalid_statement(invoke):
+    result = invoke("financials", "AAPL", "--statements", "income,profit")
+
+    assert result.exit_code == 2
+    assert "Invalid value: profit" in result.output
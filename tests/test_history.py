@@ -1,8 +1,12 @@
 """Tests for the history command."""
 
+import json
+from itertools import pairwise
 import pandas as pd
 import pytest
 from unittest.mock import patch
+from src.cli import app
+from src.commands.stock import split_range
 
 
 def create_mock_history_data():
@@ -132,3 +136,195 @@ def test_history_api_error(mock_ticker, invoke):
 
     assert result.exit_code == 1
     assert "Unexpected error" in result.output
+
+
+# ── multiple tickers ──────────────────────────────────────────────────
+
+
+def create_mock_download_data(*tickers):
+    return pd.concat({t: create_mock_history_data() for t in tickers}, axis=1)
+
+
+@patch("src.commands.stock.yf.Ticker")
+@patch("src.commands.stock.yf.download")
+def test_history_multiple_tickers(mock_download, mock_ticker, invoke_json):
+    mock_download.return_value = create_mock_download_data("AAPL", "MSFT")
+    code, data = invoke_json("history", "aapl", "msft", "--period", "5d")
+
+    assert code == 0
+    assert len(data) == 4
+    assert [d["Ticker"] for d in data] == ["AAPL", "AAPL", "MSFT", "MSFT"]
+    assert data[2]["Close"] == 104.0
+
+    call_args, call_kwargs = mock_download.call_args
+    assert call_args[0] == ["AAPL", "MSFT"]
+    assert call_kwargs["period"] == "5d"
+    mock_ticker.assert_not_called()
+
+
+@patch("src.commands.stock.yf.Ticker")
+@patch("src.commands.stock.yf.download")
+def test_history_multiple_tickers_fallback(mock_download, mock_ticker, invoke_json):
+    """Tickers missing from the bulk download are fetched individually."""
+    mock_download.return_value = create_mock_download_data("AAPL")
+    mock_ticker.return_value.history.return_value = create_mock_history_data()
+    code, data = invoke_json("history", "AAPL", "MSFT")
+
+    assert code == 0
+    assert [d["Ticker"] for d in data] == ["AAPL", "AAPL", "MSFT", "MSFT"]
+    mock_ticker.assert_called_once_with("MSFT")
+
+
+@patch("src.commands.stock.yf.Ticker")
+@patch("src.commands.stock.yf.download")
+def test_history_multiple_tickers_empty(mock_download, mock_ticker, invoke_json):
+    mock_download.return_value = pd.DataFrame()
+    mock_ticker.return_value.history.return_value = pd.DataFrame()
+    code, data = invoke_json("history", "AAPL", "MSFT")
+
+    assert code == 0
+    assert data == []
+
+
+@patch("src.commands.stock.yf.download")
+def test_history_tickers_file(mock_download, invoke_json, tmp_path):
+    tickers_file = tmp_path / "tickers.txt"
+    tickers_file.write_text("aapl\nMSFT, AAPL\n")
+    mock_download.return_value = create_mock_download_data("AAPL", "MSFT")
+    code, _ = invoke_json("history", "--tickers-file", str(tickers_file))
+
+    assert code == 0
+    assert mock_download.call_args[0][0] == ["AAPL", "MSFT"]
+
+
+@patch("src.commands.stock.yf.download")
+def test_history_tickers_stdin(mock_download, runner):
+    mock_download.return_value = create_mock_download_data("AAPL", "MSFT")
+    result = runner.invoke(app, ["history"], input="AAPL MSFT\n")
+
+    assert result.exit_code == 0
+    assert mock_download.call_args[0][0] == ["AAPL", "MSFT"]
+
+
+def test_history_no_tickers(invoke):
+    result = invoke("history")
+
+    assert result.exit_code != 0
+    assert "At least one ticker is required" in result.output
+
+
+def create_mock_minute_bars(start, end):
+    """1-minute bars in [start, end) plus the first bar after `end`, like an inclusive upstream."""
+    index = pd.date_range(
+        start, end, freq="1min", tz="America/New_York", name="Datetime"
+    )
+    return pd.DataFrame({"Close": range(len(index))}, index=index, dtype=float)
+
+
+def minute_history(start, end, **kwargs):
+    start = start.strftime("%Y-%m-%d %H:%M")
+    end = end.strftime("%Y-%m-%d %H:%M")
+    return create_mock_minute_bars(start, end)
+
+
+@patch("src.store.utc_now", return_value=pd.Timestamp("2026-01-25"))
+@patch("src.commands.stock.yf.Ticker")
+def test_history_intraday_chunks(mock_ticker, mock_now, runner):
+    mock_ticker.return_value.history.side_effect = minute_history
+    result = runner.invoke(
+        app,
+        [
+            "--output",
+            "ndjson",
+            "history",
+            "AAPL",
+            "--interval",
+            "1m",
+            "--start",
+            "2026-01-01",
+            "--end",
+            "2026-01-20",
+        ],
+    )
+
+    assert result.exit_code == 0
+    calls = [c[1] for c in mock_ticker.return_value.history.call_args_list]
+    assert [(c["start"], c["end"]) for c in calls] == [
+        (pd.Timestamp("2026-01-01"), pd.Timestamp("2026-01-08")),
+        (pd.Timestamp("2026-01-08"), pd.Timestamp("2026-01-15")),
+        (pd.Timestamp("2026-01-15"), pd.Timestamp("2026-01-20")),
+    ]
+    dates = [json.loads(line)["Datetime"] for line in result.output.splitlines()]
+    # Stitched in order, without the bars shared by adjacent chunks
+    assert dates == sorted(dates)
+    assert len(dates) == len(set(dates)) == 19 * 24 * 60 + 1
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_history_intraday_short_range(mock_ticker, invoke_json):
+    """Ranges Yahoo serves in one request are passed through unchanged."""
+    mock_ticker.return_value.history.return_value = create_mock_history_data()
+    code, _ = invoke_json("history", "AAPL", "--interval", "1m", "--period", "5d")
+
+    assert code == 0
+    mock_ticker.return_value.history.assert_called_once_with(interval="1m", period="5d")
+
+
+@patch("src.store.utc_now", return_value=pd.Timestamp("2026-03-01"))
+@patch("src.commands.stock.yf.Ticker")
+def test_history_intraday_lookback(mock_ticker, mock_now, invoke):
+    """Ranges reaching past the bars Yahoo keeps start from the oldest bar it still has."""
+    mock_ticker.return_value.history.return_value = create_mock_history_data()
+    result = invoke(
+        "history",
+        "AAPL",
+        "--interval",
+        "1m",
+        "--start",
+        "2026-01-01",
+        "--end",
+        "2026-02-05",
+    )
+
+    assert result.exit_code == 0
+    assert "only available for the last 29 days" in result.stderr
+    calls = [c[1] for c in mock_ticker.return_value.history.call_args_list]
+    assert calls[0]["start"] == pd.Timestamp("2026-01-31")
+    assert calls[-1]["end"] == pd.Timestamp("2026-02-05")
+    json.loads(result.stdout)
+
+
+@patch("src.store.utc_now", return_value=pd.Timestamp("2026-03-01"))
+def test_history_intraday_beyond_lookback(mock_now, invoke):
+    result = invoke(
+        "history",
+        "AAPL",
+        "--interval",
+        "5m",
+        "--start",
+        "2025-06-01",
+        "--end",
+        "2025-07-01",
+    )
+
+    assert result.exit_code == 2
+    assert "only available for the last 59 days" in result.output
+
+
+@pytest.mark.parametrize(
+    "interval, start, end, expected",
+    [
+        ("1d", "2020-01-01", "2026-01-01", 1),
+        ("1m", "2026-01-01", "2026-01-08", 1),
+        ("1m", "2026-01-01", "2026-01-30", 5),
+        ("5m", "2026-01-01", "2026-06-01", 3),
+        ("1h", "2020-01-01", "2026-01-01", 4),
+    ],
+)
+def test_split_range(interval, start, end, expected):
+    chunks = split_range(interval, pd.Timestamp(start), pd.Timestamp(end))
+
+    assert len(chunks) == expected
+    assert chunks[0][0] == pd.Timestamp(start)
+    assert chunks[-1][1] == pd.Timestamp(end)
+    assert all(a[1] == b[0] for a, b in pairwise(chunks))
@@ -0,0 +1,242 @@
+"""Tests for the HTTP/JSON API server."""
+
+import io
+import json
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+import typer
+from src.cli import app
+from src.decorators import command
+from src.http_server import HttpApiServer
+from src.writer import materialize
+
+
+def run_server(app):
+    """Run the API server for `app` on an ephemeral port in a background thread."""
+    server = HttpApiServer(app, {"cache": False, "refresh": False}, port=0)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    server.started.wait(timeout=5)
+    yield server
+    server.stop()
+    thread.join(timeout=5)
+
+
+@pytest.fixture
+def server():
+    yield from run_server(app)
+
+
+@pytest.fixture
+def stream_server():
+    """Run the API server for an app with a slow command streaming its records."""
+    stream_app = typer.Typer()
+
+    @stream_app.callback()
+    def main():
+        pass
+
+    @stream_app.command()
+    @command
+    def records(count: int = 3):
+        time.sleep(0.3)  # so that identical requests overlap
+        return ({"n": i} for i in range(count))
+
+    yield from run_server(stream_app)
+
+
+def raw_request(server, data: bytes) -> bytes:
+    with socket.create_connection(("127.0.0.1", server.port), timeout=5) as sock:
+        sock.sendall(data)
+        return sock.makefile("rb").read()
+
+
+def request(server, path, body=None):
+    """Return (status, content type, body) for a request to the server."""
+    url = f"http://127.0.0.1:{server.port}{path}"
+    data = json.dumps(body).encode() if body is not None else None
+    try:
+        with urllib.request.urlopen(url, data=data, timeout=5) as response:
+            return response.status, response.headers["Content-Type"], response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers["Content-Type"], e.read()
+
+
+def create_mock_history_data():
+    index = pd.DatetimeIndex(["2026-02-05", "2026-02-06"], name="Date")
+    return pd.DataFrame({"Close": [104.0, 107.0], "Volume": [1000, 1200]}, index=index)
+
+
+def test_list_commands(server):
+    status, _, body = request(server, "/")
+    commands = {c["command"]: c for c in json.loads(body)}
+
+    assert status == 200
+    assert "history" in commands
+    assert "serve" not in commands and "http-serve" not in commands
+    assert "interval" in [p["name"] for p in commands["history"]["params"]]
+    assert "tickers_file" not in [p["name"] for p in commands["history"]["params"]]
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_query_parameters(mock_ticker, server):
+    mock_ticker.return_value.history.return_value = create_mock_history_data()
+    status, content_type, body = request(server, "/history?tickers=aapl&period=5d")
+
+    assert status == 200
+    assert content_type.startswith("application/json")
+    assert json.loads(body) == [
+        {"Date": "2026-02-05T00:00:00.000", "Close": 104.0, "Volume": 1000},
+        {"Date": "2026-02-06T00:00:00.000", "Close": 107.0, "Volume": 1200},
+    ]
+    mock_ticker.assert_called_once_with("AAPL")
+    mock_ticker.return_value.history.assert_called_once_with(interval="1d", period="5d")
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_json_body(mock_ticker, server):
+    mock_ticker.return_value.get_news.return_value = []
+    status, _, body = request(
+        server, "/news", body={"ticker": "tsla", "count": 5, "tab": "press releases"}
+    )
+
+    assert status == 200
+    assert json.loads(body) == []
+    mock_ticker.assert_called_once_with("TSLA")
+    mock_ticker.return_value.get_news.assert_called_once_with(5, "press releases")
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_ndjson_output(mock_ticker, server):
+    mock_ticker.return_value.history.return_value = create_mock_history_data()
+    status, content_type, body = request(server, "/history?tickers=AAPL&output=ndjson")
+
+    assert status == 200
+    assert content_type.startswith("application/x-ndjson")
+    assert [json.loads(line)["Close"] for line in body.splitlines()] == [104.0, 107.0]
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_fields(mock_ticker, server):
+    mock_ticker.return_value.history.return_value = create_mock_history_data()
+    status, _, body = request(server, "/history?tickers=AAPL&fields=Close,Date")
+
+    assert status == 200
+    assert json.loads(body) == [
+        {"Close": 104.0, "Date": "2026-02-05T00:00:00.000"},
+        {"Close": 107.0, "Date": "2026-02-06T00:00:00.000"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "path, status, message",
+    [
+        ("/history?tickers=AAPL&interval=invalid", 400, "Invalid"),
+        ("/history?tickers=AAPL&unknown=1", 400, "Unknown parameter"),
+        ("/history?tickers_file=/etc/hosts", 400, "Unknown parameter"),
+        ("/history?tickers=AAPL&output=table", 400, "Unsupported output"),
+        ("/no-such-command", 404, "Unknown command"),
+    ],
+    ids=[
+        "invalid_value",
+        "unknown_param",
+        "tickers_file",
+        "unsupported_output",
+        "unknown_command",
+    ],
+)
+def test_errors(server, path, status, message):
+    code, _, body = request(server, path)
+
+    assert code == status
+    assert message in json.loads(body)["error"]
+
+
+def test_tickers_not_read_from_stdin(server, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("AAPL\n"))
+    code, _, body = request(server, "/history")
+
+    assert code == 400
+    assert "At least one ticker is required" in json.loads(body)["error"]
+
+
+@patch("src.commands.market.yf.Market")
+def test_no_data(mock_market, server):
+    mock_market.return_value.status = None
+    status, _, body = request(server, "/market-status")
+
+    assert status == 404
+    assert json.loads(body) == {"error": "No data found"}
+
+
+@patch("src.commands.market.yf.Market")
+def test_coalesces_identical_requests(mock_market, server):
+    calls = []
+
+    class SlowMarket:
+        def __init__(self, market):
+            calls.append(market)
+
+        @property
+        def status(self):
+            time.sleep(0.3)
+            return {"market_state": "REGULAR"}
+
+    mock_market.side_effect = SlowMarket
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda _: request(server, "/market-status"), range(4))
+        )
+
+    assert [status for status, _, _ in results] == [200] * 4
+    assert all(
+        json.loads(body) == {"market_state": "REGULAR"} for _, _, body in results
+    )
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"GARBAGE\r\n\r\n",
+        b"POST /news HTTP/1.1\r\nContent-Length: abc\r\n\r\n",
+        b"GET /" + b"a" * 100_000 + b" HTTP/1.1\r\n\r\n",
+        b"GET / HTTP/1.1\r\nCookie: " + b"a" * 100_000 + b"\r\n\r\n",
+    ],
+    ids=["request_line", "content_length", "long_request_line", "long_header"],
+)
+def test_malformed_request(server, data):
+    response = raw_request(server, data)
+
+    assert response.startswith(b"HTTP/1.1 400 Bad Request")
+
+
+def test_streams_result(stream_server):
+    with patch("src.http_server.materialize", wraps=materialize) as mock_materialize:
+        status, _, body = request(stream_server, "/records?count=3")
+
+    assert status == 200
+    assert json.loads(body) == [{"n": 0}, {"n": 1}, {"n": 2}]
+    mock_materialize.assert_not_called()
+
+
+def test_coalesced_requests_share_collected_stream(stream_server):
+    with (
+        patch("src.http_server.materialize", wraps=materialize) as mock_materialize,
+        ThreadPoolExecutor(max_workers=3) as executor,
+    ):
+        results = list(
+            executor.map(lambda _: request(stream_server, "/records?count=2"), range(3))
+        )
+
+    assert [json.loads(body) for _, _, body in results] == [[{"n": 0}, {"n": 1}]] * 3
+    mock_materialize.assert_called_once()
@@ -0,0 +1,91 @@
+"""Tests for the technical indicators."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import typer
+from src.indicators import add_indicators, parse_indicators
+
+
+def create_bars(closes, ticker=None):
+    index = pd.date_range("2026-01-05", periods=len(closes), freq="B", name="Date")
+    closes = np.asarray(closes, dtype=float)
+    return pd.DataFrame(
+        {"High": closes + 1, "Low": closes - 1, "Close": closes, "Volume": 100},
+        index=index.tz_localize("America/New_York"),
+    )
+
+
+def test_parse_indicators():
+    assert parse_indicators("sma:20, EMA:50,rsi,atr:7") == [
+        ("sma", 20),
+        ("ema", 50),
+        ("rsi", 14),
+        ("atr", 7),
+    ]
+
+
+@pytest.mark.parametrize("value", ["macd", "sma:0", "sma:x", ""])
+def test_parse_indicators_invalid(value):
+    with pytest.raises(typer.BadParameter):
+        parse_indicators(value)
+
+
+def test_moving_averages_and_returns():
+    bars = add_indicators(
+        create_bars([1, 2, 3, 4, 5]), [("sma", 3), ("ema", 2), ("returns", 1)]
+    )
+
+    assert bars["SMA_3"].tolist()[2:] == [2.0, 3.0, 4.0]
+    assert np.isnan(bars["SMA_3"].iloc[1])
+    # EMA with span 2: alpha = 2/3
+    assert bars["EMA_2"].iloc[1] == pytest.approx(1 + (2 - 1) * 2 / 3)
+    assert bars["Return_1"].iloc[1] == pytest.approx(1.0)
+
+
+def test_rsi_bounds():
+    rising = add_indicators(create_bars(range(1, 31)), [("rsi", 14)])
+    falling = add_indicators(create_bars(range(30, 0, -1)), [("rsi", 14)])
+
+    assert rising["RSI_14"].iloc[-1] == 100
+    assert falling["RSI_14"].iloc[-1] == pytest.approx(0)
+    assert rising["RSI_14"].iloc[:14].isna().all()
+
+
+def test_atr_constant_range():
+    bars = add_indicators(create_bars([10.0] * 20), [("atr", 14)])
+
+    assert bars["ATR_14"].iloc[-1] == pytest.approx(2.0)
+
+
+def test_indicators_per_ticker():
+    bars = pd.concat(
+        {"AAPL": create_bars([1, 2, 3]), "MSFT": create_bars([100, 200, 300])},
+        names=["Ticker"],
+    )
+    bars = add_indicators(bars, [("sma", 2), ("returns", 1)])
+
+    # Windows never span two tickers
+    assert np.isnan(bars.loc["MSFT", "SMA_2"].iloc[0])
+    assert bars.loc["MSFT", "SMA_2"].iloc[1] == 150.0
+    assert np.isnan(bars.loc["MSFT", "Return_1"].iloc[0])
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_cli_history_indicators(mock_ticker, invoke_json):
+    mock_ticker.return_value.history.return_value = create_bars([1, 2, 3, 4])
+    code, data = invoke_json("history", "AAPL", "--indicators", "sma:2,volatility:2")
+
+    assert code == 0
+    assert [row["SMA_2"] for row in data] == [None, 1.5, 2.5, 3.5]
+    assert "Volatility_2" in data[-1]
+
+
+def test_cli_history_invalid_indicator(invoke):
+    result = invoke("history", "AAPL", "--indicators", "sma:20,foo")
+
+    assert result.exit_code == 2
+    assert "Unknown indicator: 'foo'" in result.output
@@ -46,7 +46,7 @@ MOCK_PERFORMING_COMPANIES = pd.DataFrame(
 # ── industry-overview ────────────────────────────────────────────────
 
 
-@patch("src.commands.industry.yf.Industry")
+@patch("src.domains.yf.Industry")
 def test_industry_overview_basic(mock_industry, invoke_json):
     mock_industry.return_value.overview = MOCK_OVERVIEW
     code, data = invoke_json("industry-overview", "software-infrastructure")
@@ -56,7 +56,7 @@ def test_industry_overview_basic(mock_industry, invoke_json):
     assert data["companyCount"] == 120
 
 
-@patch("src.commands.industry.yf.Industry")
+@patch("src.domains.yf.Industry")
 def test_industry_overview_none_data(mock_industry, invoke):
     mock_industry.return_value.overview = None
     result = invoke("industry-overview", "software-infrastructure")
@@ -65,7 +65,7 @@ def test_industry_overview_none_data(mock_industry, invoke):
     assert "No data found" in result.output
 
 
-@patch("src.commands.industry.yf.Industry")
+@patch("src.domains.yf.Industry")
 def test_industry_overview_api_error(mock_industry, invoke):
     mock_industry.side_effect = Exception("API Error")
     result = invoke("industry-overview", "software-infrastructure")
@@ -77,7 +77,7 @@ def test_industry_overview_api_error(mock_industry, invoke):
 # ── industry-research-reports ────────────────────────────────────────
 
 
-@patch("src.commands.industry.yf.Industry")
+@patch("src.domains.yf.Industry")
 def test_industry_research_reports_basic(mock_industry, invoke_json):
     mock_industry.return_value.research_reports = MOCK_RESEARCH_REPORTS
     code, data = invoke_json("industry-research-reports", "software-infrastructure")
@@ -87,7 +87,7 @@ def test_industry_research_reports_basic(mock_industry, invoke_json):
     assert data[0]["reportTitle"] == "Software Outlook"
 
 
-@patch("src.commands.industry.yf.Industry")
+@patch("src.domains.yf.Industry")
 def test_industry_research_reports_none_data(mock_industry, invoke):
     mock_industry.return_value.research_reports = None
     result = invoke("industry-research-reports", "software-infrastructure")
@@ -99,7 +99,7 @@ def test_industry_research_reports_none_data(mock_industry, invoke):
 # ── industry-top-companies ───────────────────────────────────────────
 
 
-@patch("src.commands.industry.yf.Industry")
+@patch("src.domains.yf.Industry")
 def test_industry_top_companies_basic(mock_industry, invoke_json):
     mock_industry.return_value.top_companies = MOCK_TOP_COMPANIES
     code, data = invoke_json("industry-top-companies", "software-infrastructure")
@@ -108,7 +108,7 @@ def test_industry_top_companies_basic(mock_industry, invoke_json):
     assert len(data) == 2
 
 
-@patch("src.commands.industry.yf.Industry")
+@patch("src.domains.yf.Industry")
 def test_industry_top_companies_none_data(mock_industry, invoke):
     mock_industry.return_value.top_companies = None
     result = invoke("industry-top-companies", "software-infrastructure")
@@ -120,7 +120,7 @@ def test_industry_top_companies_none_data(mock_industry, invoke):
 # ── industry-top-growth-companies ────────────────────────────────────
 
 
-@patch("src.commands.industry.yf.Industry")
+@patch("src.domains.yf.Industry")
 def test_industry_top_growth_companies_basic(mock_industry, invoke_json):
     mock_industry.return_value.top_growth_companies = MOCK_GROWTH_COMPANIES
     code, data = invoke_json("industry-top-growth-companies", "software-infrastructure")
@@ -129,7 +129,7 @@ def test_industry_top_growth_companies_basic(mock_industry, invoke_json):
     assert len(data) == 2
 
 
-@patch("src.commands.industry.yf.Industry")
+@patch("src.domains.yf.Industry")
 def test_industry_top_growth_companies_none_data(mock_industry, invoke):
     mock_industry.return_value.top_growth_companies = None
     result = invoke("industry-top-growth-companies", "software-infrastructure")
@@ -141,7 +141,7 @@ def test_industry_top_growth_companies_none_data(mock_industry, invoke):
 # ── industry-top-performing-companies ────────────────────────────────
 
 
-@patch("src.commands.industry.yf.Industry")
+@patch("src.domains.yf.Industry")
 def test_industry_top_performing_companies_basic(mock_industry, invoke_json):
     mock_industry.return_value.top_performing_companies = MOCK_PERFORMING_COMPANIES
     code, data = invoke_json(
@@ -152,7 +152,7 @@ def test_industry_top_performing_companies_basic(mock_industry, invoke_json):
     assert len(data) == 2
 
 
-@patch("src.commands.industry.yf.Industry")
+@patch("src.domains.yf.Industry")
 def test_industry_top_performing_companies_none_data(mock_industry, invoke):
     mock_industry.return_value.top_performing_companies = None
     result = invoke("industry-top-performing-companies", "software-infrastructure")
@@ -161,7 +161,7 @@ def test_industry_top_performing_companies_none_data(mock_industry, invoke):
     assert "No data found" in result.output
 
 
-@patch("src.commands.industry.yf.Industry")
+@patch("src.domains.yf.Industry")
 def test_industry_top_performing_companies_api_error(mock_industry, invoke):
     mock_industry.side_effect = Exception("API Error")
     result = invoke("industry-top-performing-companies", "software-infrastructure")
@@ -0,0 +1,193 @@
+"""Tests for local resampling of history bars."""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.resample import can_resample, resample_bars
+
+
+def create_minute_bars():
+    """Two short sessions of 1-minute bars: 09:30-10:59 on two days."""
+    index = pd.DatetimeIndex(
+        [
+            *pd.date_range("2026-01-05 09:30", periods=90, freq="1min"),
+            *pd.date_range("2026-01-06 09:30", periods=90, freq="1min"),
+        ],
+        name="Datetime",
+    ).tz_localize("America/New_York")
+    n = len(index)
+    return pd.DataFrame(
+        {
+            "Open": [float(i) for i in range(n)],
+            "High": [float(i) + 0.5 for i in range(n)],
+            "Low": [float(i) - 0.5 for i in range(n)],
+            "Close": [float(i) + 0.25 for i in range(n)],
+            "Volume": [10] * n,
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=index,
+    )
+
+
+def test_resample_hourly_anchored_at_session_open():
+    bars = resample_bars(create_minute_bars(), "1h")
+
+    assert list(bars.index.strftime("%m-%d %H:%M")) == [
+        "01-05 09:30",
+        "01-05 10:30",
+        "01-06 09:30",
+        "01-06 10:30",
+    ]
+    first = bars.iloc[0]
+    assert (first["Open"], first["High"], first["Low"], first["Close"]) == (
+        0.0,
+        59.5,
+        -0.5,
+        59.25,
+    )
+    assert first["Volume"] == 600
+    # The last bin of a session is partial and never spills into the next session
+    assert bars.iloc[1]["Volume"] == 300
+    assert bars.iloc[2]["Open"] == 90.0
+
+
+def test_resample_hourly_anchored_without_first_bar():
+    minute_bars = create_minute_bars().iloc[5:]  # the session opens at 09:35
+    bars = resample_bars(minute_bars, "1h")
+
+    assert list(bars.index.strftime("%m-%d %H:%M")) == [
+        "01-05 09:30",
+        "01-05 10:30",
+        "01-06 09:30",
+        "01-06 10:30",
+    ]
+    assert bars.iloc[0]["Volume"] == 550
+
+
+def test_resample_hourly_anchored_at_earliest_bar_for_unknown_timezone():
+    minute_bars = create_minute_bars().tz_convert("UTC").tz_localize(None).iloc[5:]
+    bars = resample_bars(minute_bars, "1h")
+
+    assert list(bars.index.strftime("%m-%d %H:%M")) == [
+        "01-05 14:30",
+        "01-05 15:30",
+        "01-06 14:30",
+        "01-06 15:30",
+    ]
+
+
+def test_resample_hourly_across_dst_end():
+    """The hour repeated when DST ends gives two bars, one per UTC offset."""
+    index = pd.date_range(
+        "2025-11-02 04:00", "2025-11-02 08:59", freq="1min", tz="UTC", name="Datetime"
+    ).tz_convert("America/New_York")
+    minute_bars = pd.DataFrame({"Volume": 1}, index=index)
+    bars = resample_bars(minute_bars, "1h")
+
+    assert bars["Volume"].sum() == len(index)
+    assert list(bars.index.strftime("%H:%M%z")) == [
+        "00:00-0400",
+        "00:30-0400",
+        "01:30-0400",
+        "01:30-0500",
+        "02:30-0500",
+        "03:30-0500",
+    ]
+    assert list(bars["Volume"]) == [30, 60, 60, 60, 60, 30]
+
+
+def test_resample_daily():
+    bars = resample_bars(create_minute_bars(), "1d")
+
+    assert bars.index.name == "Date"
+    assert list(bars.index) == [
+        pd.Timestamp("2026-01-05", tz="America/New_York"),
+        pd.Timestamp("2026-01-06", tz="America/New_York"),
+    ]
+    assert list(bars["Close"]) == [89.25, 179.25]
+    assert list(bars["Volume"]) == [900, 900]
+
+
+def test_resample_actions():
+    data_frame = create_minute_bars()
+    data_frame.iloc[100, data_frame.columns.get_loc("Dividends")] = 0.25
+    data_frame.iloc[120, data_frame.columns.get_loc("Stock Splits")] = 2.0
+    bars = resample_bars(data_frame, "1d")
+
+    assert list(bars["Dividends"]) == [0.0, 0.25]
+    assert list(bars["Stock Splits"]) == [0.0, 2.0]
+
+
+def test_resample_weekly_and_monthly():
+    index = pd.bdate_range("2026-01-26", "2026-02-06", name="Date").tz_localize(
+        "America/New_York"
+    )
+    data_frame = pd.DataFrame(
+        {"Open": 1.0, "High": 2.0, "Low": 0.5, "Close": 1.5, "Volume": 100},
+        index=index,
+    )
+
+    weekly = resample_bars(data_frame, "1wk")
+    monthly = resample_bars(data_frame, "1mo")
+
+    assert list(weekly.index.strftime("%Y-%m-%d")) == [
+        "2026-01-26",
+        "2026-02-02",
+    ]
+    assert list(monthly.index.strftime("%Y-%m-%d")) == ["2026-01-01", "2026-02-01"]
+    assert list(monthly["Volume"]) == [500, 500]
+
+
+def test_resample_per_ticker():
+    data_frame = pd.concat(
+        {"AAPL": create_minute_bars(), "MSFT": create_minute_bars()},
+        names=["Ticker"],
+    )
+    bars = resample_bars(data_frame, "1d")
+
+    assert bars.index.names == ["Ticker", "Date"]
+    assert len(bars) == 4
+    assert list(bars.loc["MSFT", "Volume"]) == [900, 900]
+
+
+@pytest.mark.parametrize(
+    "source, target, expected",
+    [
+        ("1m", "5m", True),
+        ("30m", "90m", True),
+        ("60m", "90m", False),
+        ("5m", "1m", False),
+        ("1m", "1d", True),
+        ("1d", "1wk", True),
+        ("1wk", "1mo", False),
+        ("1mo", "3mo", True),
+        ("1d", "5d", False),
+        ("1d", "1d", False),
+    ],
+)
+def test_can_resample(source, target, expected):
+    assert can_resample(source, target) is expected
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_cli_history_resample_from(mock_ticker, invoke_json):
+    mock_ticker.return_value.history.return_value = create_minute_bars()
+    code, data = invoke_json(
+        "history", "AAPL", "--interval", "1h", "--resample-from", "1m", "--period", "5d"
+    )
+
+    assert code == 0
+    assert len(data) == 4
+    assert data[0]["Datetime"] == "2026-01-05T14:30:00.000Z"
+    assert data[0]["Volume"] == 600
+    mock_ticker.return_value.history.assert_called_once_with(interval="1m", period="5d")
+
+
+def test_cli_history_resample_invalid(invoke):
+    result = invoke("history", "AAPL", "--interval", "1m", "--resample-from", "1h")
+
+    assert result.exit_code == 2
+    assert "Cannot build 1m bars from 1h bars" in result.output
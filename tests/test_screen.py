@@ -7,6 +7,7 @@ from unittest.mock import patch
 from src.commands import screen as screen_cmd
 from src.typer import default_limit, default_offset
 from src.commands.screen import parse_filter, parse_json_query
+from src.snapshot import get_snapshot_path, save_snapshot
 
 
 # ── parse_filter ──────────────────────────────────────────────────────
@@ -166,7 +167,7 @@ def test_screen_query_values_valid_field_with_fixed_values(invoke):
 
 
 def test_screen_query_fields_basic(invoke_json):
-    with patch("src.commands.screen.VALID_FIELDS", {"beta", "marketcap"}):
+    with patch("src.commands.screen.valid_fields", return_value={"beta", "marketcap"}):
         code, data = invoke_json("screen-query-fields")
 
     assert code == 0
@@ -174,7 +175,7 @@ def test_screen_query_fields_basic(invoke_json):
 
 
 def test_screen_predefined_queries_basic(invoke_json):
-    with patch("src.commands.screen.PREDEFINED_QUERIES", {"q2", "q1"}):
+    with patch("src.commands.screen.predefined_queries", return_value={"q2", "q1"}):
         code, data = invoke_json("screen-predefined-queries")
 
     assert code == 0
@@ -185,15 +186,15 @@ def test_screen_predefined_queries_basic(invoke_json):
 
 
 def _pick_predefined_query():
-    if not screen_cmd.PREDEFINED_QUERIES:
+    if not screen_cmd.predefined_queries():
         pytest.skip("No predefined queries available in yfinance")
-    return sorted(screen_cmd.PREDEFINED_QUERIES)[0]
+    return sorted(screen_cmd.predefined_queries())[0]
 
 
 def _pick_valid_sort_field():
-    if "beta" in screen_cmd.VALID_FIELDS:
+    if "beta" in screen_cmd.valid_fields():
         return "beta"
-    return sorted(screen_cmd.VALID_FIELDS)[0]
+    return sorted(screen_cmd.valid_fields())[0]
 
 
 @patch("src.commands.screen.yf.screen")
@@ -329,3 +330,127 @@ def test_screen_api_error(mock_screen, invoke):
 
     assert result.exit_code == 1
     assert "Unexpected error" in result.output
+
+
+def create_screen_pages(total):
+    """A fake yf.screen serving `total` results, with one symbol repeated across pages."""
+
+    def screen(query, offset, size, sortField, sortAsc):
+        symbols = [f"S{i}" for i in range(offset, min(offset + size, total))]
+        if offset == 250:
+            symbols[0] = "S249"
+        return {"total": total, "quotes": [{"symbol": s} for s in symbols]}
+
+    return screen
+
+
+@patch("src.commands.screen.yf.screen")
+def test_screen_all_pages(mock_screen, invoke_json):
+    mock_screen.side_effect = create_screen_pages(600)
+    code, data = invoke_json("screen", "--filter", "sector eq Technology", "--all")
+
+    assert code == 0
+    symbols = [quote["symbol"] for quote in data]
+    assert len(symbols) == 599
+    assert symbols[:2] == ["S0", "S1"] and symbols[-1] == "S599"
+    assert sorted(c.kwargs["offset"] for c in mock_screen.call_args_list) == [
+        0,
+        250,
+        500,
+    ]
+    assert mock_screen.call_args_list[-1].kwargs["size"] == 100
+
+
+@patch("src.commands.screen.yf.screen")
+def test_screen_max_results(mock_screen, invoke_json):
+    mock_screen.side_effect = create_screen_pages(600)
+    code, data = invoke_json(
+        "screen",
+        "--filter",
+        "sector eq Technology",
+        "--offset",
+        "10",
+        "--max-results",
+        "300",
+    )
+
+    assert code == 0
+    assert len(data) == 300
+    assert data[0]["symbol"] == "S10"
+    assert [
+        (c.kwargs["offset"], c.kwargs["size"]) for c in mock_screen.call_args_list
+    ] == [
+        (10, 250),
+        (260, 50),
+    ]
+
+
+# ── local screening ───────────────────────────────────────────────────
+
+LOCAL_QUOTES = [
+    {"symbol": "AAPL", "region": "US", "exchange": "NMS", "marketCap": 3.5e12},
+    {"symbol": "MSFT", "region": "US", "exchange": "NMS", "marketCap": 3.1e12},
+    {"symbol": "KO", "region": "US", "exchange": "NYQ", "marketCap": 2.6e11},
+    {"symbol": "TINY", "region": "US", "exchange": "NYQ", "marketCap": None},
+]
+
+
+@patch("src.commands.screen.yf.screen")
+def test_screen_snapshot(mock_screen, invoke_json):
+    mock_screen.return_value = {"total": 4, "quotes": LOCAL_QUOTES}
+    code, data = invoke_json("screen-snapshot", "--region", "us")
+
+    assert code == 0
+    assert data["quotes"] == 4
+    assert mock_screen.call_args.kwargs["sortField"] == "ticker"
+
+
+def test_screen_local(invoke_json):
+    save_snapshot(get_snapshot_path(), LOCAL_QUOTES, {"regions": ["us"]})
+    code, data = invoke_json(
+        "screen",
+        "--local",
+        "--json-query",
+        '{"operator": "and", "queries": ["region eq us", '
+        '{"operator": "or", "queries": ["exchange eq NYQ", "intradaymarketcap gt 3200000000000"]}]}',
+        "--sort-field",
+        "intradaymarketcap",
+    )
+
+    assert code == 0
+    assert [quote["symbol"] for quote in data] == ["AAPL", "KO", "TINY"]
+
+
+def test_screen_local_offset_limit(invoke_json):
+    save_snapshot(get_snapshot_path(), LOCAL_QUOTES, {"regions": ["us"]})
+    code, data = invoke_json(
+        "screen",
+        "--local",
+        "--filter",
+        "intradaymarketcap btwn 1e11,4e12",
+        "--sort-order",
+        "asc",
+        "--offset",
+        "1",
+        "--limit",
+        "5",
+    )
+
+    # Sorted by ticker by default
+    assert code == 0
+    assert [quote["symbol"] for quote in data] == ["KO", "MSFT"]
+
+
+def test_screen_local_unavailable_field(invoke):
+    save_snapshot(get_snapshot_path(), LOCAL_QUOTES, {"regions": ["us"]})
+    result = invoke("screen", "--local", "--filter", "beta gt 1")
+
+    assert result.exit_code == 2
+    assert "not available in the local screen snapshot" in result.output
+
+
+def test_screen_local_without_snapshot(invoke):
+    result = invoke("screen", "--local", "--filter", "region eq us")
+
+    assert result.exit_code == 2
+    assert "No local screen snapshot found" in result.output
@@ -0,0 +1,61 @@
+"""Tests for the persisted screener validation index."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src import screen_index
+from src.screen_index import get_index, get_index_path
+
+
+@pytest.fixture(autouse=True)
+def clear_index():
+    get_index.cache_clear()
+    yield
+    get_index.cache_clear()
+
+
+def test_index_is_built_once_and_persisted():
+    index = get_index()
+
+    assert "region" in index["values"]
+    assert "us" in index["values"]["region"]
+    assert "intradaymarketcap" in index["fields"]
+    assert get_index_path().exists()
+
+    get_index.cache_clear()
+    with patch.object(screen_index, "build_index") as mock_build:
+        assert get_index() == index
+    mock_build.assert_not_called()
+
+
+def test_index_is_rebuilt_for_another_yfinance_version():
+    get_index()
+    get_index.cache_clear()
+
+    with (
+        patch.object(screen_index, "yfinance_version", return_value="0.0.0"),
+        patch.object(screen_index, "build_index", return_value={"fields": set()}),
+    ):
+        assert get_index() == {"fields": set()}
+
+
+def test_unreadable_index_is_rebuilt():
+    path = get_index_path()
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not a pickle")
+
+    assert "sector" in get_index()["values"]
+
+
+def test_large_is_in_filter(invoke_json):
+    exchanges = sorted(get_index()["values"]["exchange"])
+    with patch("src.commands.screen.yf.screen") as mock_screen:
+        mock_screen.return_value = {"quotes": []}
+        code, _ = invoke_json(
+            "screen", "--filter", f"exchange is-in {','.join(exchanges)}"
+        )
+
+    assert code == 0
+    query = mock_screen.call_args.args[0].to_dict()
+    assert len(query["operands"]) == len(exchanges)
@@ -1,7 +1,7 @@
 """Tests for sector commands."""
 
 import pandas as pd
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 
 MOCK_INDUSTRIES = pd.DataFrame(
@@ -187,3 +187,129 @@ def test_sector_top_mutual_funds_api_error(mock_sector, invoke):
 
     assert result.exit_code == 1
     assert "Unexpected error" in result.output
+
+
+MOCK_MAPPING = {
+    "technology": {"software": "Software", "semiconductors": "Semiconductors"},
+    "energy": {"oil-gas": "Oil & Gas"},
+}
+
+
+def create_mock_sector(key):
+    sector = MagicMock()
+    sector.name = key.title()
+    sector.industries = pd.DataFrame(
+        {
+            "name": [MOCK_MAPPING[key][k] for k in MOCK_MAPPING[key]],
+            "market weight": [0.5] * len(MOCK_MAPPING[key]),
+        },
+        index=pd.Index(list(MOCK_MAPPING[key]), name="key"),
+    )
+    return sector
+
+
+def create_mock_industry(key):
+    industry = MagicMock()
+    symbols = {"software": ["MSFT", "ORCL"], "semiconductors": ["NVDA"]}.get(key)
+    industry.top_companies = (
+        None
+        if symbols is None
+        else pd.DataFrame(
+            {"name": symbols, "market weight": [0.1] * len(symbols)},
+            index=pd.Index(symbols, name="symbol"),
+        )
+    )
+    return industry
+
+
+@patch("src.commands.sector.yf.const.SECTOR_INDUSTY_MAPPING_LC", MOCK_MAPPING)
+@patch("src.commands.sector.yf.Industry", side_effect=create_mock_industry)
+@patch("src.commands.sector.yf.Sector", side_effect=create_mock_sector)
+def test_sector_crawl(mock_sector, mock_industry, invoke_json):
+    code, data = invoke_json("sector-crawl", "--rate-limit", "1000")
+
+    assert code == 0
+    assert mock_sector.call_count == 2
+    assert mock_industry.call_count == 3
+    assert [(r["industry"], r["symbol"]) for r in data] == [
+        ("software", "MSFT"),
+        ("software", "ORCL"),
+        ("semiconductors", "NVDA"),
+    ]
+    assert list(data[0])[:6] == [
+        "sector",
+        "sector name",
+        "industry",
+        "industry name",
+        "industry market weight",
+        "symbol",
+    ]
+    assert data[0]["sector name"] == "Technology"
+    assert data[0]["industry name"] == "Software"
+
+
+@patch("src.commands.sector.yf.const.SECTOR_INDUSTY_MAPPING_LC", MOCK_MAPPING)
+@patch("src.commands.sector.yf.Industry", side_effect=create_mock_industry)
+@patch("src.commands.sector.yf.Sector", side_effect=create_mock_sector)
+def test_sector_crawl_selected_sectors(mock_sector, mock_industry, invoke):
+    result = invoke("sector-crawl", "--sector", "energy")
+
+    assert result.exit_code == 1
+    mock_sector.assert_called_once_with("energy")
+    mock_industry.assert_called_once_with("oil-gas")
+    assert "No data found" in result.output
+
+
+@patch("src.commands.sector.yf.const.SECTOR_INDUSTY_MAPPING_LC", MOCK_MAPPING)
+def test_sector_crawl_invalid_sector(invoke):
+    result = invoke("sector-crawl", "--sector", "unknown")
+
+    assert result.exit_code == 2
+    assert "Invalid sector key" in result.output
+
+
+@patch("src.domains.yf.Sector")
+def test_sector_views_share_one_object(mock_sector, invoke_json):
+    mock_sector.return_value.overview = MOCK_OVERVIEW
+    mock_sector.return_value.top_etfs = MOCK_TOP_ETFS
+    invoke_json("sector-overview", "technology")
+    code, data = invoke_json("sector-top-etfs", "technology")
+
+    assert code == 0
+    assert len(data) == 2
+    mock_sector.assert_called_once_with("technology")
+
+
+@patch("src.domains.yf.Sector")
+def test_sector_report(mock_sector, invoke_json):
+    sector = mock_sector.return_value
+    sector.name = "Technology"
+    sector.overview = MOCK_OVERVIEW
+    sector.industries = MOCK_INDUSTRIES
+    sector.top_companies = MOCK_TOP_COMPANIES
+    sector.top_etfs = MOCK_TOP_ETFS
+    sector.top_mutual_funds = {}
+    sector.research_reports = MOCK_RESEARCH_REPORTS
+    code, data = invoke_json("sector-report", "technology")
+
+    assert code == 0
+    mock_sector.assert_called_once_with("technology")
+    assert data["key"] == "technology"
+    assert data["overview"]["companyCount"] == 1500
+    assert data["top_companies"][0]["index"] == "AAPL"
+    assert data["top_etfs"][0] == {
+        "symbol": "XLK",
+        "name": "Technology Select Sector SPDR",
+    }
+    assert data["top_mutual_funds"] == []
+    assert len(data["industries"]) == 2
+    assert len(data["research_reports"]) == 2
+
+
+@patch("src.domains.yf.Sector")
+def test_sector_report_none_data(mock_sector, invoke):
+    mock_sector.return_value.overview = None
+    result = invoke("sector-report", "technology")
+
+    assert result.exit_code == 1
+    assert "No data found" in result.output
@@ -0,0 +1,151 @@
+"""Tests for the pooled HTTP session shared by yfinance requests."""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+from curl_cffi.requests.exceptions import Timeout
+
+from src import session
+from src.utils import lazy_import, map_concurrently, on_load
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections alive
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(0.5)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    stats = session.ConnectionStats()
+    monkeypatch.setattr(session, "stats", stats)
+    return stats
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    settings = dict(session.settings)
+    monkeypatch.setattr(session, "settings", settings)
+    return settings
+
+
+def create_session():
+    pooled_session = session.create_session()
+    session.apply_settings(pooled_session)
+    return pooled_session
+
+
+def test_connections_are_reused_across_thread_pools(server_url, stats, settings):
+    settings["pool_size"] = 2
+    pooled_session = create_session()
+
+    for _ in range(3):
+        # Every call runs on a new thread pool, whose threads have never made a request
+        codes = map_concurrently(
+            lambda _: pooled_session.get(server_url).status_code, range(4), 4
+        )
+        assert codes == [200] * 4
+
+    assert stats.requests == 12
+    # One connection per pooled handle, however many threads made the requests
+    assert stats.connections <= 2
+    assert stats.reused >= 10
+    pooled_session.close()
+
+
+def test_slots_never_exceed_a_lowered_limit():
+    slots = session.Slots(2)
+    entered = threading.Event()
+
+    def hold():
+        with slots:
+            entered.set()
+
+    with slots:
+        with slots:
+            slots.resize(1)
+        thread = threading.Thread(target=hold)
+        thread.start()
+        # One slot is still held, which is all a limit of 1 allows
+        assert not entered.wait(0.1)
+    assert entered.wait(5)
+    thread.join()
+
+
+def test_timeout_overrides_request_timeout(server_url, settings):
+    settings["timeout"] = 0.1
+    pooled_session = create_session()
+
+    with pytest.raises(Timeout):
+        pooled_session.get(f"{server_url}/slow", timeout=30)
+    pooled_session.close()
+
+
+def test_configure_updates_installed_session(monkeypatch, settings):
+    pooled_session = create_session()
+    monkeypatch.setattr(session, "session", pooled_session)
+    session.configure(pool_size=3, timeout=5.0, http2=False)
+
+    assert session.session is pooled_session
+    assert pooled_session.request_timeout == 5.0
+    assert pooled_session.http_version == "v1"
+    assert settings == {"pool_size": 3, "timeout": 5.0, "http2": False}
+
+
+def test_yfinance_uses_the_installed_session():
+    yf = lazy_import("yfinance")
+    _ = yf.Ticker  # loading yfinance installs the session
+
+    assert session.session is not None
+    assert yf.data.YfData()._session is session.session
+
+
+def test_on_load_runs_hook_on_first_use(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    loaded = []
+    module = lazy_import("colorsys")
+    on_load("colorsys", loaded.append)
+
+    assert loaded == []
+    module.rgb_to_hsv(0.0, 0.0, 0.0)
+    assert loaded == [module]
+
+
+def test_on_load_runs_hook_now_for_loaded_module():
+    loaded = []
+    on_load("json", loaded.append)
+
+    assert loaded == [sys.modules["json"]]
+
+
+@patch("src.commands.sector.yf.const")
+def test_cli_debug_connections(mock_const, invoke):
+    mock_const.SECTOR_INDUSTY_MAPPING_LC = {"technology": {}}
+    result = invoke("--debug-connections", "sector-keys")
+
+    assert result.exit_code == 0
+    assert "Connections: " in result.stderr
+    assert "Connections: " not in result.stdout
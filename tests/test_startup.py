@@ -0,0 +1,46 @@
+"""Startup regression tests: `--help` must not import heavy dependencies."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = ("pandas", "numpy", "yfinance", "curl_cffi", "requests", "lxml")
+
+SCRIPT = """
+import json, sys
+from src.cli import app
+try:
+    app({args})
+except SystemExit:
+    pass
+# Lazily imported modules are registered in sys.modules but only executed on first use,
+# which is when their submodules get imported.
+loaded = sorted({{m.split(".")[0] for m in sys.modules if m.startswith({prefixes})}})
+print(json.dumps(loaded), file=sys.stderr)
+"""
+
+
+def loaded_heavy_modules(*args):
+    script = SCRIPT.format(
+        args=list(args), prefixes=tuple(f"{m}." for m in HEAVY_MODULES)
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["--help"], ["history", "--help"], ["screen", "--help"]],
+    ids=["root", "history", "screen"],
+)
+def test_help_does_not_import_heavy_modules(args):
+    assert loaded_heavy_modules(*args) == []
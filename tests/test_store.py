@@ -0,0 +1,202 @@
+"""Tests for the incremental history store."""
+
+import math
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.store import (
+    HistoryStore,
+    requested_range,
+    subtract_ranges,
+)
+
+NOW = pd.Timestamp("2026-02-10 22:00")
+
+
+def daily_bars(start, end, close_offset=0.0):
+    index = pd.date_range(start, end, freq="B", tz="America/New_York", name="Date")
+    closes = [100.0 + i + close_offset for i in range(len(index))]
+    return pd.DataFrame({"Close": closes, "Volume": 1000}, index=index)
+
+
+class FakeSource:
+    """Serves bars from a fixed full history and records every requested range."""
+
+    def __init__(self, data_frame):
+        self.data_frame = data_frame
+        self.calls = []
+
+    def __call__(self, start, end):
+        self.calls.append((start, end))
+        local = self.data_frame.index.tz_localize(None)
+        mask = (local >= (start or pd.Timestamp.min)) & (
+            local < (end or pd.Timestamp.max)
+        )
+        return self.data_frame[mask]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return HistoryStore(tmp_path / "history")
+
+
+def test_first_request_fetches_range(store):
+    source = FakeSource(daily_bars("2026-01-01", "2026-02-10"))
+    data = store.history(
+        "AAPL", "1d", pd.Timestamp("2026-01-05"), None, source, now=NOW
+    )
+
+    assert source.calls == [(pd.Timestamp("2025-12-29"), None)]
+    assert data.index[0] == pd.Timestamp("2026-01-05", tz="America/New_York")
+    assert len(data) == 27
+
+
+def test_later_request_fetches_only_missing_tail(store):
+    source = FakeSource(daily_bars("2026-01-01", "2026-02-10"))
+    store.history("AAPL", "1d", pd.Timestamp("2026-01-05"), None, source, now=NOW)
+
+    later = NOW + pd.Timedelta(days=3)
+    source.data_frame = daily_bars("2026-01-01", "2026-02-13")
+    source.calls.clear()
+    data = store.history(
+        "AAPL", "1d", pd.Timestamp("2026-01-05"), None, source, now=later
+    )
+
+    # Only the gap since the last fetch, starting one overlap earlier
+    assert source.calls == [(NOW - pd.Timedelta(days=7), None)]
+    assert data.index[-1] == pd.Timestamp("2026-02-13", tz="America/New_York")
+    assert not data.index.duplicated().any()
+
+
+def test_covered_request_is_served_from_disk(store):
+    source = FakeSource(daily_bars("2026-01-01", "2026-02-10"))
+    store.history("AAPL", "1d", pd.Timestamp("2026-01-05"), None, source, now=NOW)
+
+    source.calls.clear()
+    data = store.history(
+        "AAPL",
+        "1d",
+        pd.Timestamp("2026-01-12"),
+        pd.Timestamp("2026-01-17"),
+        source,
+        now=NOW,
+    )
+
+    assert source.calls == []
+    assert len(data) == 5
+
+
+def test_adjusted_bars_replace_store(store):
+    store.history(
+        "AAPL",
+        "1d",
+        pd.Timestamp("2026-01-05"),
+        None,
+        FakeSource(daily_bars("2026-01-01", "2026-02-10")),
+        now=NOW,
+    )
+
+    # A dividend adjusted every past close
+    source = FakeSource(daily_bars("2026-01-01", "2026-02-13", close_offset=-0.5))
+    later = NOW + pd.Timedelta(days=3)
+    data = store.history(
+        "AAPL", "1d", pd.Timestamp("2026-01-05"), None, source, now=later
+    )
+
+    assert source.calls[-1] == (pd.Timestamp("2026-01-05"), None)
+    assert data["Close"].iloc[0] == 101.5
+
+
+def test_unreadable_store_is_refetched(store):
+    path = store.path("AAPL", "1d")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not a pickle")
+    source = FakeSource(daily_bars("2026-01-01", "2026-02-10"))
+    data = store.history(
+        "AAPL", "1d", pd.Timestamp("2026-01-05"), None, source, now=NOW
+    )
+
+    assert len(source.calls) == 1
+    assert len(data) == 27
+
+
+def test_empty_fetch_is_retried(store):
+    # yfinance returns no bars when a request fails, e.g. when rate limited
+    failing = FakeSource(daily_bars("2026-01-01", "2026-02-10").iloc[:0])
+    start = pd.Timestamp("2026-01-05")
+    assert len(store.history("AAPL", "1d", start, None, failing, now=NOW)) == 0
+
+    source = FakeSource(daily_bars("2026-01-01", "2026-02-10"))
+    data = store.history("AAPL", "1d", start, None, source, now=NOW)
+
+    assert len(source.calls) == 1
+    assert len(data) == 27
+
+
+@pytest.mark.parametrize(
+    "ranges, expected",
+    [
+        ([], [(0, 10)]),
+        ([(0, 10)], []),
+        ([(2, 4)], [(0, 2), (4, 10)]),
+        ([(-math.inf, 5), (7, 8)], [(5, 7), (8, 10)]),
+    ],
+    ids=["empty", "covered", "middle", "multiple"],
+)
+def test_subtract_ranges(ranges, expected):
+    assert subtract_ranges(0, 10, ranges) == expected
+
+
+@pytest.mark.parametrize(
+    "period, start, end, expected",
+    [
+        ("1mo", None, None, (pd.Timestamp("2026-01-10 22:00"), None)),
+        (
+            "5d",
+            "2026-01-01",
+            None,
+            (pd.Timestamp("2026-01-01"), pd.Timestamp("2026-01-06")),
+        ),
+        ("ytd", None, None, (pd.Timestamp("2026-01-01"), None)),
+        ("max", None, "2026-01-01", (None, pd.Timestamp("2026-01-01"))),
+        (
+            None,
+            "2025-01-01",
+            "2026-01-01",
+            (pd.Timestamp("2025-01-01"), pd.Timestamp("2026-01-01")),
+        ),
+    ],
+    ids=["period", "period_start", "ytd", "max_end", "start_end"],
+)
+def test_requested_range(period, start, end, expected):
+    assert requested_range(period, start, end, now=NOW) == expected
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_cli_history_store(mock_ticker, invoke_json):
+    mock_ticker.return_value.history.return_value = daily_bars(
+        "2026-01-05", "2026-01-09"
+    )
+    args = (
+        "--no-cache",
+        "history",
+        "AAPL",
+        "--start",
+        "2026-01-05",
+        "--end",
+        "2026-01-10",
+        "--store",
+    )
+    code, first = invoke_json(*args)
+    code, second = invoke_json(*args)
+
+    assert code == 0
+    assert first == second
+    assert [row["Close"] for row in second] == [100.0, 101.0, 102.0, 103.0, 104.0]
+    # The second call is served from the store
+    assert mock_ticker.return_value.history.call_count == 1
+    call_kwargs = mock_ticker.return_value.history.call_args[1]
+    assert call_kwargs["start"] == pd.Timestamp("2025-12-29")
+    assert call_kwargs["end"] == pd.Timestamp("2026-01-10")
@@ -0,0 +1,178 @@
+"""Tests for the DataFrame conversion and concurrency helpers."""
+
+import json
+import sys
+import threading
+import time
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils import (
+    RateLimiter,
+    data_frame_to_json,
+    data_frame_to_list,
+    flatten_index,
+    imap_concurrently,
+    lazy_import,
+    map_concurrently,
+    series_to_frame,
+)
+
+
+def create_mixed_data_frame():
+    return pd.DataFrame(
+        {
+            "naive": pd.to_datetime(["2026-01-01 10:00", None]),
+            "aware": pd.DatetimeIndex(["2026-01-01", "2026-01-02"]).tz_localize(
+                "America/New_York"
+            ),
+            "float": [1.5, np.nan],
+            "inf": [np.inf, -np.inf],
+            "int": np.array([1, 2], dtype=np.int64),
+            "nullable_int": pd.array([1, None], dtype="Int64"),
+            "bool": [True, False],
+            "str": ["a", None],
+            "object": [np.float64(2.5), pd.Timestamp("2026-01-01", tz="UTC")],
+        }
+    )
+
+
+# ── data_frame_to_list ────────────────────────────────────────────────
+
+
+def test_data_frame_to_list_values():
+    data = data_frame_to_list(create_mixed_data_frame())
+
+    assert data[0] == {
+        "naive": "2026-01-01T10:00:00.000",
+        "aware": "2026-01-01T05:00:00.000Z",
+        "float": 1.5,
+        "inf": None,
+        "int": 1,
+        "nullable_int": 1,
+        "bool": True,
+        "str": "a",
+        "object": 2.5,
+    }
+    assert data[1]["naive"] is None
+    assert data[1]["float"] is None
+    assert data[1]["nullable_int"] is None
+    assert data[1]["object"] == "2026-01-01T00:00:00.000Z"
+
+
+def test_data_frame_to_list_native_types():
+    data = data_frame_to_list(create_mixed_data_frame())
+
+    assert type(data[0]["int"]) is int
+    assert type(data[0]["float"]) is float
+    assert type(data[0]["object"]) is float
+
+
+@pytest.mark.parametrize(
+    "data_frame",
+    [
+        create_mixed_data_frame(),
+        pd.DataFrame(
+            {"a": [1, 2]}, index=pd.DatetimeIndex(["2026-01-01", "2026-01-02"])
+        ),
+        pd.DataFrame(),
+    ],
+    ids=["mixed", "datetime_index", "empty"],
+)
+def test_data_frame_to_list_matches_to_json(data_frame):
+    """The direct conversion must produce the same records as a to_json round-trip."""
+    data_frame = flatten_index(data_frame)
+    expected = json.loads(data_frame.to_json(orient="records", date_format="iso"))
+
+    assert data_frame_to_list(data_frame) == expected
+    assert json.loads(data_frame_to_json(data_frame, indent=2)) == expected
+
+
+def test_data_frame_to_list_does_not_modify_input():
+    data_frame = create_mixed_data_frame()
+    data_frame_to_list(data_frame)
+
+    assert data_frame["aware"].dtype.kind == "M"
+
+
+def test_data_frame_to_list_none():
+    assert data_frame_to_list(None) is None
+
+
+# ── flatten_index / series_to_frame ───────────────────────────────────
+
+
+def test_flatten_index_names():
+    data_frame = pd.DataFrame({"a": [1]}, index=["x"])
+
+    assert list(flatten_index(data_frame, index_name="Key").columns) == ["Key", "a"]
+    assert flatten_index(None) is None
+
+
+def test_series_to_frame():
+    series = pd.Series(
+        [0.25], index=pd.DatetimeIndex(["2026-01-01"], name="Date"), name="Dividends"
+    )
+
+    assert data_frame_to_list(series_to_frame(series)) == [
+        {"Date": "2026-01-01T00:00:00.000", "Dividends": 0.25}
+    ]
+    assert series_to_frame(None) is None
+
+
+def test_imap_concurrently_order_and_bound():
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(i):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01 * (i % 3))
+        with lock:
+            in_flight -= 1
+        return i * 2
+
+    results = []
+    for result in imap_concurrently(work, range(12), max_workers=3):
+        time.sleep(0.005)  # a slow consumer must not let work pile up
+        results.append(result)
+
+    assert results == [i * 2 for i in range(12)]
+    assert peak <= 3
+
+
+def test_map_concurrently_loads_lazy_modules_first(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    module = lazy_import("colorsys")
+    loaded = []
+
+    def work(i):
+        loaded.append(type(module) is types.ModuleType)
+        return i
+
+    map_concurrently(work, range(4), max_workers=2)
+
+    assert loaded == [True] * 4
+
+
+def test_rate_limiter_spaces_calls_across_threads():
+    limiter = RateLimiter(50)
+    start = time.monotonic()
+    map_concurrently(lambda _: limiter.wait(), range(6), 6)
+
+    # The sixth call waits for five 20 ms intervals, however the threads are scheduled
+    assert time.monotonic() - start >= 0.099
+
+
+def test_rate_limiter_unlimited():
+    start = time.monotonic()
+    limiter = RateLimiter(None)
+    for _ in range(100):
+        limiter.wait()
+    assert time.monotonic() - start < 0.05
@@ -1,8 +1,9 @@
 """Tests for WriterFactory, JsonWriter, and TableWriter."""
 
 import json
+import pandas as pd
 import pytest
-from src.writer import WriterFactory, JsonWriter, TableWriter
+from src.writer import WriterFactory, JsonWriter, NdjsonWriter, TableWriter, project
 from unittest.mock import patch
 
 
@@ -17,6 +18,10 @@ def test_factory_table():
     assert isinstance(WriterFactory.get_writer("table"), TableWriter)
 
 
+def test_factory_ndjson():
+    assert isinstance(WriterFactory.get_writer("ndjson"), NdjsonWriter)
+
+
 def test_factory_invalid():
     with pytest.raises(ValueError, match="Unsupported writer type"):
         WriterFactory.get_writer("csv")
@@ -123,3 +128,157 @@ def test_cli_output_json_default(mock_market, invoke_json):
 
     assert code == 0
     assert data["market_state"] == "REGULAR"
+
+
+# ── DataFrame input ───────────────────────────────────────────────────
+
+
+def create_data_frame():
+    return pd.DataFrame(
+        {
+            "Date": pd.DatetimeIndex(["2026-02-05", "2026-02-06"]).tz_localize("UTC"),
+            "Close": [104.0, float("nan")],
+        }
+    )
+
+
+def test_json_writer_data_frame(capsys):
+    writer = JsonWriter()
+    writer.write(create_data_frame())
+    output = capsys.readouterr().out
+    data = json.loads(output)
+
+    assert data == [
+        {"Date": "2026-02-05T00:00:00.000Z", "Close": 104.0},
+        {"Date": "2026-02-06T00:00:00.000Z", "Close": None},
+    ]
+
+
+def test_json_writer_long_string_not_wrapped(capsys):
+    writer = JsonWriter()
+    writer.write({"summary": "word " * 100, "tag": "[bold]x[/bold]"})
+    output = capsys.readouterr().out
+    data = json.loads(output)
+
+    assert data["summary"] == "word " * 100
+    assert data["tag"] == "[bold]x[/bold]"
+
+
+def test_table_writer_data_frame(capsys):
+    writer = TableWriter()
+    writer.write(create_data_frame())
+    output = capsys.readouterr().out
+
+    assert "Date" in output
+    assert "Close" in output
+    assert "104.0" in output
+
+
+# ── NdjsonWriter ──────────────────────────────────────────────────────
+
+
+def read_ndjson(output):
+    return [json.loads(line) for line in output.splitlines()]
+
+
+def test_ndjson_writer_dict(capsys):
+    NdjsonWriter().write({"key": "value"})
+    output = capsys.readouterr().out
+
+    assert output == '{"key":"value"}\n'
+
+
+def test_ndjson_writer_list(capsys):
+    NdjsonWriter().write([{"a": 1}, {"a": 2}])
+    output = capsys.readouterr().out
+
+    assert read_ndjson(output) == [{"a": 1}, {"a": 2}]
+
+
+def test_ndjson_writer_data_frame(capsys):
+    NdjsonWriter().write(create_data_frame())
+    output = capsys.readouterr().out
+
+    assert read_ndjson(output) == [
+        {"Date": "2026-02-05T00:00:00.000Z", "Close": 104.0},
+        {"Date": "2026-02-06T00:00:00.000Z", "Close": None},
+    ]
+
+
+def test_ndjson_writer_empty(capsys):
+    NdjsonWriter().write([])
+    NdjsonWriter().write(pd.DataFrame())
+
+    assert capsys.readouterr().out == ""
+
+
+def test_ndjson_writer_streams_incrementally(capsys):
+    """Each chunk is written before the next one is produced."""
+    seen = []
+
+    def generate():
+        yield {"a": 1}
+        seen.append(capsys.readouterr().out)
+        yield create_data_frame()
+
+    NdjsonWriter().write(generate())
+
+    assert seen == ['{"a":1}\n']
+    assert len(read_ndjson(capsys.readouterr().out)) == 2
+
+
+def test_json_writer_iterator(capsys):
+    JsonWriter().write(iter([create_data_frame(), create_data_frame()]))
+    data = json.loads(capsys.readouterr().out)
+
+    assert len(data) == 4
+    assert data[0]["Close"] == 104.0
+
+
+@patch("src.commands.market.yf.Market")
+def test_cli_output_ndjson(mock_market, invoke):
+    mock_market.return_value.status = {"market_state": "REGULAR"}
+    result = invoke("--output", "ndjson", "market-status")
+
+    assert result.exit_code == 0
+    assert read_ndjson(result.output) == [{"market_state": "REGULAR"}]
+
+
+# ── Field projection ─────────────────────────────────────────────────
+
+
+def test_project_data_frame():
+    data_frame = project(create_data_frame(), ["Close", "Missing", "Date"])
+    assert list(data_frame.columns) == ["Close", "Date"]
+
+
+def test_project_records():
+    assert project({"a": 1, "b": 2}, ["b"]) == {"b": 2}
+    assert project([{"a": 1, "b": 2}, {"a": 3}], ["b"]) == [{"b": 2}, {}]
+
+
+def test_project_iterator():
+    chunks = list(project(iter([create_data_frame(), {"Close": 1, "x": 2}]), ["Close"]))
+
+    assert list(chunks[0].columns) == ["Close"]
+    assert chunks[1] == {"Close": 1}
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_cli_fields(mock_ticker, invoke_json):
+    mock_ticker.return_value.history.return_value = create_data_frame()
+    code, data = invoke_json("--fields", "Close,Date", "history", "AAPL")
+
+    assert code == 0
+    assert list(data[0]) == ["Close", "Date"]
+
+
+@patch("src.commands.stock.yf.Ticker")
+def test_cli_fields_served_from_cache(mock_ticker, invoke_json):
+    mock_ticker.return_value.history.return_value = create_data_frame()
+    invoke_json("history", "AAPL")
+    code, data = invoke_json("--fields", "Close", "history", "AAPL")
+
+    assert code == 0
+    assert data == [{"Close": 104.0}, {"Close": None}]
+    assert mock_ticker.return_value.history.call_count == 1